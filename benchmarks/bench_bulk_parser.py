@@ -0,0 +1,120 @@
+"""
+Before/after benchmark for parsing bulk auction lists.
+
+Run from the repo root:
+    python -m benchmarks.bench_bulk_parser
+"""
+
+import random
+import re
+import timeit
+from collections import defaultdict
+
+from constants.rarity import (
+    auctionable_mons_list,
+    exclusive_mons,
+    fetch_market_value_cache,
+    format_names_for_market_value_lookup,
+    get_rarity,
+    golden_mons,
+    shiny_mons,
+)
+from utils.parser.bulk_parser import parse_bulk_list
+from utils.parser.number_parser import parse_compact_number
+
+LIST_SIZE = 1_000
+ROUNDS = 5
+
+
+# ❀ Old implementation (regexes per entry, linear scans per name) ❀
+def legacy_is_mon_auctionable(pokemon: str) -> bool:
+    name = pokemon.lower()
+    if ("gigantamax" in name or "mega" in name) and "golden" not in name:
+        return True
+    if "golden" in name:
+        return any(name == mon.lower() for mon in golden_mons)
+    if "shiny" in name:
+        result = any(name == mon.lower() for mon in shiny_mons)
+        if not result:
+            result = any(name == mon.lower() for mon in exclusive_mons)
+        return result
+    if any(name == mon.lower() for mon in auctionable_mons_list):
+        return True
+    pokemon_lookup = format_names_for_market_value_lookup(pokemon)
+    return fetch_market_value_cache(pokemon_lookup) is not None
+
+
+def legacy_extract_pokemon_list_and_validate(pokemon):
+    invalid_pokemon = []
+    rarities = []
+    count_map = defaultdict(int)
+    total_count = 0
+    if not pokemon:
+        return [], [], [], 0
+    for p in pokemon.split(","):
+        p = p.strip().lower()
+        if not p:
+            continue
+        match = re.match(r"^([\d,.a-z]+)\s+(.+)$", p)
+        if match:
+            qty_raw = match.group(1).replace(",", "")
+            name = match.group(2).strip()
+            qty = parse_compact_number(qty_raw)
+            if re.search(r"\d+$", name) or qty is None:
+                invalid_pokemon.append(p)
+                continue
+        else:
+            if re.search(r"\d+$", p):
+                invalid_pokemon.append(p)
+                continue
+            qty = 1
+            name = p
+        if legacy_is_mon_auctionable(name):
+            rarities.append(get_rarity(name))
+            count_map[name] += qty
+            total_count += qty
+        else:
+            invalid_pokemon.append(p)
+    return list(count_map.items()), invalid_pokemon, rarities, total_count
+
+
+def build_list(size: int, names: list[str], seed: int) -> str:
+    """Every entry has a quantity, the one format both parsers read the same way"""
+    rng = random.Random(seed)
+    return ", ".join(f"{rng.randint(1, 20)} {rng.choice(names)}" for _ in range(size))
+
+
+def run(label: str, fn, raw: str) -> float:
+    seconds = timeit.timeit(lambda: fn(raw), number=ROUNDS)
+    per_list_ms = seconds / ROUNDS * 1_000
+    print(f"{label:<44} {per_list_ms:>10.2f} ms/list")
+    return per_list_ms
+
+
+def main():
+    common = [mon.lower() for mon in auctionable_mons_list if " " not in mon][:200]
+    shiny = [mon.lower() for mon in shiny_mons][:200]
+    corpora = {
+        "common list": build_list(LIST_SIZE, common, seed=1),
+        "shiny list": build_list(LIST_SIZE, shiny, seed=2),
+        "shiny list, 1 in 10 invalid": build_list(LIST_SIZE, shiny + ["shiny missingno"] * 20, seed=3),
+    }
+
+    # Both must agree on the valid entries, rarities and totals
+    for raw in corpora.values():
+        legacy = legacy_extract_pokemon_list_and_validate(raw)
+        current = parse_bulk_list(raw)
+        assert current.valid_pokemon == legacy[0]
+        assert [error.text for error in current.errors] == legacy[1]
+        assert current.rarities == legacy[2]
+        assert current.total_count == legacy[3]
+
+    print(f"{LIST_SIZE:,} entries per list x {ROUNDS} rounds\n")
+    for label, raw in corpora.items():
+        legacy = run(f"legacy ({label})", legacy_extract_pokemon_list_and_validate, raw)
+        current = run(f"parse_bulk_list ({label})", parse_bulk_list, raw)
+        print(f"{'':<44} {legacy / current:>10.1f}x faster than legacy\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Before/after benchmark for debug_log.
+
+Run from the repo root:
+    python -m benchmarks.bench_debug_log
+"""
+
+import inspect
+import timeit
+
+from utils.logs import debug_log as debug_module
+from utils.logs.debug_log import debug_log, enable_debug, get_debug_logger
+
+CALLS = 100_000
+
+
+# ❀ Old implementation (inspect.stack() before the toggle check) ❀
+def legacy_debug_log(message: str, force: bool = False):
+    stack = inspect.stack()
+    caller_frame = stack[1]
+    func_name = caller_frame.function
+    module_name = caller_frame.frame.f_globals.get("__name__", "__main__")
+    key = f"{module_name}.{func_name}"
+    if not debug_module.DEBUG_TOGGLES.get(key, False) and not force:
+        return
+
+
+def _nest(depth: int, fn):
+    """Call fn from `depth` frames deep, listener/command paths sit ~20-30 frames in."""
+    if depth == 0:
+        return fn()
+    return _nest(depth - 1, fn)
+
+
+def hot_legacy():
+    legacy_debug_log("value")
+
+
+def hot_debug_log():
+    debug_log("value")
+
+
+hot_logger = get_debug_logger(__name__, "hot_logger_path")
+
+
+def hot_logger_path():
+    hot_logger("value")
+
+
+def run(label: str, fn, depth: int, number: int):
+    seconds = timeit.timeit(lambda: _nest(depth, fn), number=number)
+    per_call_us = seconds / number * 1_000_000
+    print(f"{label:<42} {per_call_us:>10.3f} µs/call")
+    return per_call_us
+
+
+def main():
+    depth = 25
+    print(f"Disabled debug calls, {depth} frames deep\n")
+    legacy = run("legacy debug_log (inspect.stack)", hot_legacy, depth, CALLS // 100)
+    current = run("debug_log (nothing enabled)", hot_debug_log, depth, CALLS)
+    logger = run("get_debug_logger() logger", hot_logger_path, depth, CALLS)
+
+    # Something else enabled, forces the per call site lookup path
+    enable_debug("benchmarks.somewhere_else")
+    cached = run("debug_log (other key enabled)", hot_debug_log, depth, CALLS)
+
+    baseline = run("empty call (nesting overhead)", lambda: None, depth, CALLS)
+    print()
+    for label, value in (
+        ("debug_log (nothing enabled)", current),
+        ("get_debug_logger() logger", logger),
+        ("debug_log (other key enabled)", cached),
+    ):
+        cost = max(value - baseline, 1e-6)
+        print(f"{label:<42} {(legacy - baseline) / cost:>10.0f}x faster than legacy")
+
+
+if __name__ == "__main__":
+    main()
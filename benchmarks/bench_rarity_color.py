@@ -0,0 +1,86 @@
+"""
+Before/after benchmark for classifying PokéMeow embeds by color.
+
+Run from the repo root:
+    python -m benchmarks.bench_rarity_color
+"""
+
+import random
+import timeit
+
+import discord
+
+from cogs.events.on_message_create import classify_embed_rarity
+from constants.paldea_galar_dict import get_rarity_by_color, rarity_meta
+
+CORPUS_SIZE = 10_000
+ROUNDS = 20
+
+
+# ❀ Old implementation (scans rarity_meta up to three times) ❀
+def legacy_get_rarity_by_color(color_value):
+    for rarity_name, rarity_data in rarity_meta.items():
+        if rarity_data.get("color") == color_value:
+            return rarity_name
+    if isinstance(color_value, int):
+        hex_str = hex(color_value)
+        try:
+            hex_int = int(hex_str, 16)
+            for rarity_name, rarity_data in rarity_meta.items():
+                if rarity_data.get("color") == hex_int:
+                    return rarity_name
+        except Exception:
+            pass
+    elif isinstance(color_value, str):
+        try:
+            dec_int = int(color_value, 16)
+            for rarity_name, rarity_data in rarity_meta.items():
+                if rarity_data.get("color") == dec_int:
+                    return rarity_name
+        except Exception:
+            pass
+    return "unknown"
+
+
+def build_corpus(size: int) -> list[discord.Embed]:
+    """Spawn/catch style embeds, 1 in 4 has a non-rarity color (market, dex, chat bots)"""
+    rng = random.Random(7)
+    rarity_colors = [data["color"] for data in rarity_meta.values()]
+    other_colors = [0xFFB6C1, 0x87CEFA, 0x2F3136, 0x000000]
+    corpus = []
+    for i in range(size):
+        color = rng.choice(other_colors) if i % 4 == 0 else rng.choice(rarity_colors)
+        corpus.append(discord.Embed(description=f"A wild Pokémon appeared! #{i}", color=color))
+    return corpus
+
+
+def run(label: str, fn, corpus) -> float:
+    seconds = timeit.timeit(lambda: [fn(embed) for embed in corpus], number=ROUNDS)
+    per_embed_ns = seconds / (ROUNDS * len(corpus)) * 1_000_000_000
+    print(f"{label:<44} {per_embed_ns:>10.1f} ns/embed")
+    return per_embed_ns
+
+
+def main():
+    corpus = build_corpus(CORPUS_SIZE)
+
+    # Both must agree on every embed
+    for embed in corpus:
+        expected = legacy_get_rarity_by_color(embed.color.value)
+        assert get_rarity_by_color(embed.color.value) == expected
+        assert (classify_embed_rarity(embed) or "unknown") == expected
+
+    print(f"{CORPUS_SIZE:,} embeds x {ROUNDS} rounds\n")
+    legacy = run("legacy get_rarity_by_color (scan)", lambda e: legacy_get_rarity_by_color(e.color.value), corpus)
+    legacy_hex = run("legacy get_rarity_by_color (hex string)", lambda e: legacy_get_rarity_by_color(hex(e.color.value)), corpus)
+    current = run("get_rarity_by_color (RARITY_BY_COLOR)", lambda e: get_rarity_by_color(e.color.value), corpus)
+    current_hex = run("get_rarity_by_color (hex string)", lambda e: get_rarity_by_color(hex(e.color.value)), corpus)
+    classify = run("classify_embed_rarity (listener pre-filter)", classify_embed_rarity, corpus)
+    print()
+    print(f"{'int lookup':<44} {legacy / current:>10.1f}x faster than legacy")
+    print(f"{'hex string lookup':<44} {legacy_hex / current_hex:>10.1f}x faster than legacy")
+    print(f"{'listener pre-filter':<44} {legacy / classify:>10.1f}x faster than legacy")
+
+
+if __name__ == "__main__":
+    main()
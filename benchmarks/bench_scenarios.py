@@ -0,0 +1,289 @@
+"""
+Scripted hot-path scenarios against in-memory Discord and Postgres fakes.
+
+Run from the repo root:
+    python -m benchmarks.bench_scenarios
+    python -m benchmarks.bench_scenarios --db-latency-ms 2 --api-latency-ms 40 -v
+
+Scenarios:
+    bid storm      100 concurrent bidders on one auction channel (bid_func)
+    end burst      200 auctions due in the same minute (check_and_end_due_auctions)
+    listener flood 10k messages through MessageCreateListener.on_message
+
+Each row reports p50/p99 latency per operation, DB statements per operation
+and Discord API calls per operation. Latencies include the simulated roundtrips.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import time
+
+import discord
+
+from benchmarks.fake_pool import FakePool
+from benchmarks.fakes import (
+    API_LATENCY,
+    DISCORD_CALLS,
+    FakeBot,
+    FakeGuild,
+    FakeInteraction,
+    FakeMember,
+    FakeMessage,
+    FakeRole,
+    FakeTextChannel,
+    FakeWebhook,
+)
+from benchmarks.harness import ScenarioResult, measure, print_report, timed
+from constants.grand_line_auction_constants import (
+    GLA_SERVER_ID,
+    GRAND_LINE_AUCTION_ROLES,
+    GRAND_LINE_AUCTION_TEXT_CHANNELS,
+    POKEMEOW_APPLICATION_ID,
+)
+from utils.cache.cache_list import (
+    WebhookRecord,
+    auction_cache,
+    ongoing_bidding,
+    processing_auction_end,
+    webhook_url_cache,
+)
+
+AUCTION_POKEMON = "shiny charizard"
+MARKET_POKEMON = ["Charizard", "Mewtwo", "Rayquaza", "Gengar", "Dragonite"]
+
+
+# ❀ World setup ❀
+def build_world(db_latency: float, api_latency: float) -> tuple[FakeBot, FakeGuild, FakePool]:
+    API_LATENCY["seconds"] = api_latency
+    DISCORD_CALLS.clear()
+    auction_cache.clear()
+    ongoing_bidding.clear()
+    processing_auction_end.clear()
+
+    pool = FakePool(latency=db_latency)
+    guild = FakeGuild(GLA_SERVER_ID)
+    for role_id in vars(GRAND_LINE_AUCTION_ROLES).values():
+        if isinstance(role_id, int):
+            guild.add_role(FakeRole(role_id))
+    bot = FakeBot(pool, guild)
+
+    # Auction log goes through the webhook dispatcher, pre-seed it so nothing hits the network
+    from utils.functions.webhook_dispatcher import WEBHOOK_DISPATCHER
+
+    log_channel = guild.add_channel(
+        FakeTextChannel(guild, GRAND_LINE_AUCTION_TEXT_CHANNELS.auction_log, "auction-log")
+    )
+    webhook = FakeWebhook(log_channel)
+    key = (bot.user.id, log_channel.id)
+    webhook_url_cache[key] = WebhookRecord(url=webhook.url, channel_name=log_channel.name)
+    WEBHOOK_DISPATCHER.webhooks[key] = (webhook.url, webhook)
+    return bot, guild, pool
+
+
+def auction_row(channel: FakeTextChannel, host: FakeMember, ends_on: int, **overrides) -> dict:
+    row = {
+        "channel_id": channel.id,
+        "channel_name": channel.name,
+        "host_id": host.id,
+        "host_name": host.name,
+        "pokemon": AUCTION_POKEMON,
+        "highest_bidder_id": None,
+        "highest_bidder": None,
+        "highest_offer": 0,
+        "autobuy": 0,
+        "ends_on": ends_on,
+        "accepted_list": None,
+        "image_link": None,
+        "broadcast_msg_id": None,
+        "market_value": 5_000_000,
+        "minimum_increment": 50_000,
+        "last_minute_pinged": False,
+        "is_bulk": False,
+        "state": "active",  # column DEFAULT, FakePool doesn't apply defaults
+        "state_changed_at": None,
+    }
+    row.update(overrides)
+    return row
+
+
+def seed_auction(pool: FakePool, row: dict, cache: bool = True):
+    pool.tables["auctions"][row["channel_id"]] = dict(row)
+    if cache:
+        auction_cache[row["channel_id"]] = {
+            k: v for k, v in row.items() if k != "channel_id"
+        }
+
+
+async def settle():
+    """Let the webhook dispatcher flush whatever the scenario queued."""
+    from utils.functions.webhook_dispatcher import WEBHOOK_DISPATCHER
+
+    if WEBHOOK_DISPATCHER._queue is not None:
+        await WEBHOOK_DISPATCHER._queue.join()
+
+
+# ❀ Scenario: bid storm ❀
+async def bid_storm(args) -> ScenarioResult:
+    from utils.group_commands_func.auction.bid import bid_func
+
+    bot, guild, pool = build_world(args.db_latency, args.api_latency)
+    channel = guild.add_channel(FakeTextChannel(guild, name="shiny-auction"))
+    host = guild.add_member(FakeMember(name="host"))
+    seed_auction(pool, auction_row(channel, host, int(time.time()) + 3_600))
+
+    bidders = [guild.add_member(FakeMember()) for _ in range(args.bidders)]
+    interactions = [FakeInteraction(bot, bidder, channel) for bidder in bidders]
+    amounts = [f"{1_000_000 + i * 100_000}" for i in range(len(bidders))]
+
+    result = ScenarioResult(f"bid storm ({args.bidders} bidders)", len(bidders))
+    with measure(result, pool):
+        await asyncio.gather(
+            *(
+                timed(bid_func(bot, interaction, amount), result.latencies)
+                for interaction, amount in zip(interactions, amounts)
+            )
+        )
+        await settle()
+
+    accepted = sum("placed successfully" in i.final_content for i in interactions)
+    result.notes.append(f"{accepted} bids accepted, {len(bidders) - accepted} rejected")
+    return result
+
+
+# ❀ Scenario: end burst ❀
+async def end_burst(args) -> ScenarioResult:
+    from utils.schedule.background_task.auction_end_checker import (
+        check_and_end_due_auctions,
+    )
+
+    bot, guild, pool = build_world(args.db_latency, args.api_latency)
+    now = int(time.time())
+    channels = []
+    for i in range(args.auctions):
+        channel = guild.add_channel(FakeTextChannel(guild, name=f"auction-{i}"))
+        # Half the hosts/bidders are not in the member cache and need fetch_member
+        cached = i % 2 == 0
+        host = guild.add_member(FakeMember(), cached=cached)
+        bidder = guild.add_member(FakeMember(), cached=cached)
+        seed_auction(
+            pool,
+            auction_row(
+                channel,
+                host,
+                now - (i % 60),
+                highest_bidder_id=bidder.id,
+                highest_bidder=bidder.name,
+                highest_offer=2_000_000,
+            ),
+        )
+        channels.append(channel)
+
+    result = ScenarioResult(f"end burst ({args.auctions} auctions)", args.auctions)
+    with measure(result, pool):
+        tick_start = time.perf_counter()
+        await check_and_end_due_auctions(bot)
+        await settle()
+
+    # Per-auction latency = tick start until its ended embed reached the channel
+    for channel in channels:
+        if channel.sent:
+            result.latencies.append(channel.sent[0][0] - tick_start)
+    ended = sum(1 for channel in channels if channel.sent)
+    result.notes.append(f"{ended}/{args.auctions} auctions announced in one tick")
+    return result
+
+
+# ❀ Scenario: listener flood ❀
+def market_embed(name: str, price: int) -> discord.Embed:
+    embed = discord.Embed(
+        description=(
+            f"`1.` <:shiny:1> **{name}** • `#A1B2C3` • <:PokeCoin:1> {price:,} • "
+            f"x1 • <t:{int(time.time())}:d>\n"
+            f"`2.` <:shiny:1> **{name}** • `#D4E5F6` • <:PokeCoin:1> {price + 50_000:,} • "
+            f"x1 • <t:{int(time.time())}:d>"
+        )
+    )
+    embed.set_author(name=f"PokeMeow Global Market — Shiny {name} Listings")
+    return embed
+
+
+async def listener_flood(args) -> ScenarioResult:
+    from cogs.events.on_message_create import MessageCreateListener
+
+    bot, guild, pool = build_world(args.db_latency, args.api_latency)
+    channel = guild.add_channel(FakeTextChannel(guild, name="market"))
+    pokemeow = FakeMember(POKEMEOW_APPLICATION_ID, name="PokéMeow", bot=True)
+    humans = [guild.add_member(FakeMember()) for _ in range(50)]
+    cog = MessageCreateListener(bot)
+
+    messages = []
+    for i in range(args.messages):
+        if i % 10 == 0:
+            name = MARKET_POKEMON[(i // 10) % len(MARKET_POKEMON)]
+            embed = market_embed(name, 1_000_000 + i)
+            messages.append(FakeMessage(channel, embeds=[embed], author=pokemeow))
+        else:
+            messages.append(
+                FakeMessage(channel, content=f"gg {i}", author=humans[i % len(humans)])
+            )
+
+    result = ScenarioResult(f"listener flood ({args.messages:,} msgs)", len(messages))
+    with measure(result, pool):
+        for message in messages:
+            await timed(cog.on_message(message), result.latencies)
+        await settle()
+
+    market_views = len([m for m in messages if m.embeds])
+    result.notes.append(f"{market_views:,} market view embeds, {len(messages) - market_views:,} chat messages")
+    return result
+
+
+SCENARIOS = {
+    "bid": bid_storm,
+    "end": end_burst,
+    "listener": listener_flood,
+}
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--db-latency-ms", type=float, default=1.0)
+    parser.add_argument("--api-latency-ms", type=float, default=25.0)
+    parser.add_argument("--bidders", type=int, default=100)
+    parser.add_argument("--auctions", type=int, default=200)
+    parser.add_argument("--messages", type=int, default=10_000)
+    parser.add_argument(
+        "--only", choices=sorted(SCENARIOS), action="append", help="run a single scenario"
+    )
+    parser.add_argument("-v", "--verbose", action="store_true", help="per-table/per-endpoint counts")
+    parser.add_argument("--show-logs", action="store_true", help="keep pretty_log output")
+    args = parser.parse_args()
+    args.db_latency = args.db_latency_ms / 1000
+    args.api_latency = args.api_latency_ms / 1000
+    return args
+
+
+async def main():
+    args = parse_args()
+    from utils.functions.webhook_dispatcher import WEBHOOK_DISPATCHER
+    from utils.logs.log_shipper import LOG_SHIPPER
+
+    # pretty_log prints every cache write, keep the report readable
+    sink = contextlib.nullcontext() if args.show_logs else contextlib.redirect_stdout(io.StringIO())
+    results = []
+    with sink:
+        for name in args.only or SCENARIOS:
+            results.append(await SCENARIOS[name](args))
+        await WEBHOOK_DISPATCHER.drain(timeout=1)
+        await LOG_SHIPPER.drain(timeout=1)
+
+    print(
+        f"db latency {args.db_latency_ms}ms, api latency {args.api_latency_ms}ms",
+    )
+    print_report(results, verbose=args.verbose)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
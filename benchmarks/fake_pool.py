@@ -0,0 +1,203 @@
+"""
+asyncpg-compatible in-memory pool for benchmarks.
+
+Understands the statement shapes used in utils/db (single table INSERT .. ON CONFLICT,
+UPDATE .. SET col = $n WHERE key = $m, DELETE .. WHERE key = $n, SELECT * with the
+due/last-minute auction filters). Anything else is counted and answered with an empty result,
+so a new helper still shows up in the DB call counts.
+"""
+
+import asyncio
+import re
+import time
+from collections import Counter
+
+TABLE_KEYS = {
+    "auctions": "channel_id",
+    "auction_bids": "id",
+    "auction_proxy_bids": ("channel_id", "bidder_id"),
+    "auction_result_daily": ("pokemon", "day"),
+    "auction_results": "id",
+    "guild_config": ("guild_id", "key"),
+    "market_value": "pokemon_name",
+    "webhook_url": "channel_id",
+}
+
+_INSERT_RE = re.compile(
+    r"INSERT INTO (\w+)\s*\(([^)]*)\)\s*VALUES\s*\(([^)]*)\)", re.I | re.S
+)
+_UPDATE_RE = re.compile(r"UPDATE (\w+)\s+SET (.*?)\s+WHERE (.*?);?\s*$", re.I | re.S)
+_DELETE_RE = re.compile(r"DELETE FROM (\w+)\s+WHERE (.*?);?\s*$", re.I | re.S)
+_SELECT_RE = re.compile(r"SELECT .*? FROM (\w+)(.*)$", re.I | re.S)
+_ASSIGN_RE = re.compile(r"(\w+)\s*=\s*\$(\d+)")
+
+
+class FakeConnection:
+    def __init__(self, pool: "FakePool"):
+        self.pool = pool
+
+    async def _roundtrip(self, verb: str, query: str):
+        self.pool.calls[verb] += 1
+        table = _table_of(query)
+        if table:
+            self.pool.calls[f"{verb}:{table}"] += 1
+        if self.pool.latency:
+            await asyncio.sleep(self.pool.latency)
+
+    async def execute(self, query: str, *args):
+        await self._roundtrip("execute", query)
+        return self.pool.apply(query, args)
+
+    async def executemany(self, query: str, args_list):
+        await self._roundtrip("executemany", query)
+        for args in args_list:
+            self.pool.apply(query, args)
+
+    async def fetch(self, query: str, *args):
+        await self._roundtrip("fetch", query)
+        return self.pool.select(query, args)
+
+    async def fetchrow(self, query: str, *args):
+        await self._roundtrip("fetchrow", query)
+        rows = self.pool.select(query, args)
+        if rows:
+            return rows[0]
+        return self.pool.apply(query, args, returning=True)
+
+    async def fetchval(self, query: str, *args):
+        row = await self.fetchrow(query, *args)
+        if isinstance(row, dict) and row:
+            return next(iter(row.values()))
+        return None
+
+    def transaction(self):
+        return _Transaction(self.pool)
+
+
+class _Transaction:
+    def __init__(self, pool):
+        self.pool = pool
+
+    async def __aenter__(self):
+        self.pool.calls["transaction"] += 1
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class _Acquire:
+    def __init__(self, pool: "FakePool"):
+        self.pool = pool
+
+    async def __aenter__(self):
+        self.pool.calls["acquire"] += 1
+        return FakeConnection(self.pool)
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class FakePool:
+    """Drop-in for bot.pg_pool, `latency` is added to every statement."""
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.tables: dict[str, dict] = {name: {} for name in TABLE_KEYS}
+        self.calls: Counter = Counter()
+
+    def acquire(self):
+        return _Acquire(self)
+
+    async def close(self):
+        return None
+
+    @property
+    def statements(self) -> int:
+        return sum(
+            count for verb, count in self.calls.items()
+            if ":" not in verb and verb not in ("acquire", "transaction")
+        )
+
+    # ❀ Tiny statement interpreter ❀
+    def apply(self, query: str, args, returning: bool = False):
+        match = _INSERT_RE.search(query)
+        if match:
+            table, cols, values = match.groups()
+            cols = [c.strip() for c in cols.split(",")]
+            placeholders = [v.strip() for v in values.split(",")]
+            row = {}
+            for col, placeholder in zip(cols, placeholders):
+                if placeholder.startswith("$"):
+                    row[col] = args[int(placeholder[1:]) - 1]
+            rows = self.tables.setdefault(table, {})
+            key_cols = TABLE_KEYS.get(table, cols[0])
+            if isinstance(key_cols, tuple):
+                key = tuple(row.get(col) for col in key_cols)
+            else:
+                key = row.get(key_cols)
+            if key is None:
+                key = len(rows) + 1
+            rows.setdefault(key, {}).update(row)
+            return dict(rows[key]) if returning else "INSERT 0 1"
+
+        match = _UPDATE_RE.search(query)
+        if match:
+            table, assignments, where = match.groups()
+            rows = self._matching(table, where, args)
+            for row in rows:
+                for col, idx in _ASSIGN_RE.findall(assignments):
+                    row[col] = args[int(idx) - 1]
+            return f"UPDATE {len(rows)}"
+
+        match = _DELETE_RE.search(query)
+        if match:
+            table, where = match.groups()
+            rows = self.tables.get(table, {})
+            matched = {id(row) for row in self._matching(table, where, args)}
+            doomed = [key for key, row in rows.items() if id(row) in matched]
+            deleted = [rows.pop(key) for key in doomed]
+            if returning:
+                return dict(deleted[0]) if deleted else None
+            return f"DELETE {len(doomed)}"
+        return None if returning else "OK"
+
+    def select(self, query: str, args):
+        match = _SELECT_RE.search(query)
+        if not match:
+            return []
+        table, rest = match.groups()
+        if table not in self.tables:
+            return []
+        where = ""
+        if " where " in rest.lower():
+            where = re.split(r"\bwhere\b", rest, flags=re.I)[1]
+        rows = self._matching(table, where, args) if where else list(self.tables[table].values())
+        return [dict(row) for row in rows]
+
+    def _matching(self, table: str, where: str, args) -> list[dict]:
+        rows = list(self.tables.get(table, {}).values())
+        now = int(time.time())
+        lowered = where.lower()
+        if "extract(epoch" in lowered:
+            window = 600 if "+ 600" in lowered else 0
+            rows = [r for r in rows if (r.get("ends_on") or 0) <= now + window]
+            if "last_minute_pinged = false" in lowered:
+                rows = [r for r in rows if not r.get("last_minute_pinged")]
+            if "state = 'active'" in lowered:
+                rows = [r for r in rows if r.get("state", "active") == "active"]
+            return rows
+        for col, idx in _ASSIGN_RE.findall(where):
+            value = args[int(idx) - 1]
+            rows = [r for r in rows if r.get(col) == value]
+        any_match = re.search(r"(\w+)\s*=\s*ANY\(\$(\d+)\)", where)
+        if any_match:
+            col, idx = any_match.groups()
+            values = set(args[int(idx) - 1])
+            rows = [r for r in rows if r.get(col) in values]
+        return rows
+
+
+def _table_of(query: str) -> str | None:
+    match = re.search(r"\b(?:FROM|INTO|UPDATE)\s+(\w+)", query, re.I)
+    return match.group(1) if match else None
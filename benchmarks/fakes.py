@@ -0,0 +1,286 @@
+"""
+In-memory stand-ins for the discord.py objects the command funcs and listeners touch.
+
+Every coroutine that would be a REST call in discord.py goes through `api_call`,
+which counts it (DISCORD_CALLS) and sleeps for the configured API latency.
+"""
+
+import asyncio
+import itertools
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+DISCORD_CALLS: Counter = Counter()
+API_LATENCY = {"seconds": 0.0}
+
+_ids = itertools.count(10_000_000_000_000_000)
+
+
+def next_id() -> int:
+    return next(_ids)
+
+
+async def api_call(name: str):
+    DISCORD_CALLS[name] += 1
+    if API_LATENCY["seconds"]:
+        await asyncio.sleep(API_LATENCY["seconds"])
+
+
+class FakeAsset:
+    def __init__(self, url: str):
+        self.url = url
+
+    async def read(self) -> bytes:
+        await api_call("asset.read")
+        return b"\x89PNG"
+
+
+class FakeRole:
+    def __init__(self, role_id: int, name: str = None):
+        self.id = role_id
+        self.name = name or f"role-{role_id}"
+        self.mention = f"<@&{role_id}>"
+
+    def __eq__(self, other):
+        return getattr(other, "id", None) == self.id
+
+    def __hash__(self):
+        return hash(self.id)
+
+
+class FakeMember:
+    def __init__(self, member_id: int = None, name: str = None, roles=None, bot=False):
+        self.id = member_id or next_id()
+        self.name = name or f"user{self.id % 10_000}"
+        self.display_name = self.name
+        self.mention = f"<@{self.id}>"
+        self.roles = list(roles or [])
+        self.bot = bot
+        self.avatar = FakeAsset(f"https://cdn.example/avatars/{self.id}.png")
+        self.display_avatar = self.avatar
+        self.guild_permissions = SimpleNamespace(administrator=False)
+
+    def __str__(self):
+        return self.name
+
+
+class FakeMessage:
+    def __init__(
+        self,
+        channel,
+        content: str = None,
+        embeds=None,
+        author=None,
+        webhook_id=None,
+        reference=None,
+    ):
+        self.id = next_id()
+        self.channel = channel
+        self.guild = getattr(channel, "guild", None)
+        self.content = content or ""
+        self.embeds = list(embeds or [])
+        self.author = author
+        self.webhook_id = webhook_id
+        self.reference = reference
+        self.created_at = datetime.now(timezone.utc)
+        self.jump_url = f"https://discord.com/channels/{getattr(self.guild, 'id', 0)}/{getattr(channel, 'id', 0)}/{self.id}"
+
+    async def edit(self, content=None, embed=None, view=None, **kwargs):
+        await api_call("message.edit")
+        if content is not None:
+            self.content = content
+        if embed is not None:
+            self.embeds = [embed]
+        return self
+
+    async def delete(self):
+        await api_call("message.delete")
+
+    async def publish(self):
+        await api_call("message.publish")
+
+    async def add_reaction(self, emoji):
+        await api_call("message.add_reaction")
+
+
+class FakeCategory:
+    def __init__(self, category_id: int, name: str = None):
+        self.id = category_id
+        self.name = name or f"category-{category_id}"
+
+
+class FakeTextChannel:
+    def __init__(self, guild, channel_id: int = None, name: str = None, category=None):
+        self.id = channel_id or next_id()
+        self.name = name or f"channel-{self.id % 10_000}"
+        self.guild = guild
+        self.category = category
+        self.category_id = category.id if category else None
+        self.mention = f"<#{self.id}>"
+        self.sent: list[tuple[float, FakeMessage]] = []
+
+    async def send(self, content=None, embed=None, embeds=None, view=None, file=None, **kwargs):
+        await api_call("channel.send")
+        message = FakeMessage(self, content=content, embeds=[embed] if embed else embeds)
+        self.sent.append((time.perf_counter(), message))
+        return message
+
+    async def fetch_message(self, message_id: int):
+        await api_call("channel.fetch_message")
+        return FakeMessage(self)
+
+    async def create_webhook(self, name: str, avatar: bytes = None):
+        await api_call("channel.create_webhook")
+        return FakeWebhook(self)
+
+
+class FakeWebhook:
+    def __init__(self, channel):
+        self.id = next_id()
+        self.channel = channel
+        self.url = f"https://discord.com/api/webhooks/{self.id}/token"
+        self.sent = 0
+
+    async def send(self, content=None, embed=None, **kwargs):
+        await api_call("webhook.send")
+        self.sent += 1
+
+
+class FakeGuild:
+    def __init__(self, guild_id: int, name: str = "Grand Line Auction"):
+        self.id = guild_id
+        self.name = name
+        self.icon = None
+        self.members: dict[int, FakeMember] = {}
+        self.remote_members: dict[int, FakeMember] = {}  # only reachable through fetch_member
+        self.channels: dict[int, FakeTextChannel] = {}
+        self.roles: dict[int, FakeRole] = {}
+        self.categories: list[FakeCategory] = []
+
+    def add_member(self, member: FakeMember, cached: bool = True):
+        if cached:
+            self.members[member.id] = member
+        else:
+            self.remote_members[member.id] = member
+        return member
+
+    def add_channel(self, channel: FakeTextChannel):
+        self.channels[channel.id] = channel
+        return channel
+
+    def add_role(self, role: FakeRole):
+        self.roles[role.id] = role
+        return role
+
+    def get_member(self, member_id: int):
+        return self.members.get(member_id)
+
+    def get_channel(self, channel_id: int):
+        return self.channels.get(channel_id)
+
+    def get_role(self, role_id: int):
+        return self.roles.get(role_id)
+
+    async def fetch_member(self, member_id: int):
+        await api_call("guild.fetch_member")
+        member = self.remote_members.get(member_id) or self.members.get(member_id)
+        if member is None:
+            member = FakeMember(member_id)
+        return member
+
+    async def query_members(self, user_ids=None, limit=5, **kwargs):
+        await api_call("guild.query_members")
+        return [
+            self.remote_members.get(uid) or self.members.get(uid) or FakeMember(uid)
+            for uid in (user_ids or [])
+        ]
+
+    async def chunk(self, **kwargs):
+        await api_call("guild.chunk")
+        self.members.update(self.remote_members)
+        return list(self.members.values())
+
+
+class FakeResponse:
+    def __init__(self, interaction):
+        self.interaction = interaction
+        self._done = False
+
+    def is_done(self) -> bool:
+        return self._done
+
+    async def defer(self, ephemeral: bool = False, thinking: bool = False):
+        await api_call("interaction.defer")
+        self._done = True
+
+    async def send_message(self, content=None, embed=None, view=None, ephemeral=False, **kwargs):
+        await api_call("interaction.send_message")
+        self._done = True
+        self.interaction.original = FakeMessage(self.interaction.channel, content=content)
+        self.interaction.messages.append(content or "")
+
+    async def edit_message(self, **kwargs):
+        await api_call("interaction.edit_message")
+
+
+class FakeFollowup:
+    def __init__(self, interaction):
+        self.interaction = interaction
+
+    async def send(self, content=None, embed=None, view=None, ephemeral=False, file=None, **kwargs):
+        await api_call("followup.send")
+        self.interaction.messages.append(content or "")
+        return FakeMessage(self.interaction.channel, content=content)
+
+
+class FakeInteraction:
+    def __init__(self, bot, user: FakeMember, channel: FakeTextChannel):
+        self.id = next_id()
+        self.client = bot
+        self.user = user
+        self.guild = channel.guild
+        self.guild_id = channel.guild.id
+        self.channel = channel
+        self.channel_id = channel.id
+        self.created_at = datetime.now(timezone.utc)
+        self.extras: dict = {}
+        self.response = FakeResponse(self)
+        self.followup = FakeFollowup(self)
+        self.original: FakeMessage | None = None
+        self.messages: list[str] = []
+        self.command = None
+
+    async def original_response(self):
+        await api_call("interaction.original_response")
+        return self.original
+
+    @property
+    def final_content(self) -> str:
+        """Last thing the loader showed, edits to the original message included."""
+        if self.original and self.original.content:
+            return self.original.content
+        return self.messages[-1] if self.messages else ""
+
+
+class FakeBot:
+    def __init__(self, pool, guild: FakeGuild):
+        self.pg_pool = pool
+        self.user = FakeMember(next_id(), name="Jigglypuff", bot=True)
+        self.guilds = [guild]
+        self._guild = guild
+        self.loop = None
+        self.cogs = {}
+
+    def get_guild(self, guild_id: int):
+        return self._guild if guild_id == self._guild.id else None
+
+    def get_channel(self, channel_id: int):
+        return self._guild.get_channel(channel_id)
+
+    def is_closed(self) -> bool:
+        return False
+
+    async def wait_until_ready(self):
+        return None
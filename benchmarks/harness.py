@@ -0,0 +1,94 @@
+"""Timing and reporting helpers shared by the benchmark scenarios."""
+
+import time
+from contextlib import contextmanager
+
+from benchmarks.fakes import DISCORD_CALLS
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+class ScenarioResult:
+    def __init__(self, name: str, operations: int):
+        self.name = name
+        self.operations = operations
+        self.latencies: list[float] = []
+        self.db_calls = 0
+        self.api_calls = 0
+        self.wall_seconds = 0.0
+        self.notes: list[str] = []
+        self.db_breakdown: dict[str, int] = {}
+        self.api_breakdown: dict[str, int] = {}
+
+    def row(self) -> str:
+        ops = max(self.operations, 1)
+        return (
+            f"{self.name:<34} {self.operations:>7,} "
+            f"{percentile(self.latencies, 50) * 1000:>9.2f} "
+            f"{percentile(self.latencies, 99) * 1000:>9.2f} "
+            f"{self.db_calls / ops:>8.2f} "
+            f"{self.api_calls / ops:>8.2f} "
+            f"{self.wall_seconds:>8.2f}"
+        )
+
+
+HEADER = (
+    f"{'scenario':<34} {'ops':>7} {'p50 ms':>9} {'p99 ms':>9} "
+    f"{'db/op':>8} {'api/op':>8} {'wall s':>8}"
+)
+
+
+@contextmanager
+def measure(result: ScenarioResult, pool):
+    """Captures wall time and the DB/Discord call deltas of the wrapped block."""
+    db_before = dict(pool.calls)
+    statements_before = pool.statements
+    api_before = dict(DISCORD_CALLS)
+    start = time.perf_counter()
+    yield
+    result.wall_seconds = time.perf_counter() - start
+    result.db_calls = pool.statements - statements_before
+    result.api_calls = sum(DISCORD_CALLS.values()) - sum(api_before.values())
+    result.db_breakdown = {
+        key: count - db_before.get(key, 0)
+        for key, count in pool.calls.items()
+        if ":" in key and count - db_before.get(key, 0)
+    }
+    result.api_breakdown = {
+        key: count - api_before.get(key, 0)
+        for key, count in DISCORD_CALLS.items()
+        if count - api_before.get(key, 0)
+    }
+
+
+async def timed(coro, samples: list[float]):
+    start = time.perf_counter()
+    try:
+        return await coro
+    finally:
+        samples.append(time.perf_counter() - start)
+
+
+def print_report(results: list[ScenarioResult], verbose: bool = False):
+    print()
+    print(HEADER)
+    print("─" * len(HEADER))
+    for result in results:
+        print(result.row())
+    for result in results:
+        if not (result.notes or verbose):
+            continue
+        print(f"\n{result.name}")
+        for note in result.notes:
+            print(f"  - {note}")
+        if verbose:
+            for key, count in sorted(result.db_breakdown.items()):
+                print(f"  db   {key:<34} {count:>8,}")
+            for key, count in sorted(result.api_breakdown.items()):
+                print(f"  api  {key:<34} {count:>8,}")
@@ -3,6 +3,7 @@ from discord import app_commands
 from discord.ext import commands
 
 from utils.essentials.command_safe import run_command_safe
+from utils.essentials.interaction_pipeline import pre_defer
 from utils.group_commands_func.accepted_list import *
 
 GROUP_NAME = "accepted-list"
@@ -28,6 +29,7 @@ class Accepted_List_Group_Commands(commands.Cog):
     @accepted_list_group.command(
         name="view", description="View accepted list for the current auction"
     )
+    @pre_defer(content="Fetching accepted Pokémon list...", ephemeral=True)
     async def accepted_list_view(
         self,
         interaction: discord.Interaction,
@@ -52,6 +54,7 @@ class Accepted_List_Group_Commands(commands.Cog):
     @app_commands.describe(
         new_accepted_list="New accepted Pokémon list (comma-separated)"
     )
+    @pre_defer(content="Updating accepted Pokémon list...", ephemeral=False)
     async def accepted_list_update(
         self,
         interaction: discord.Interaction,
@@ -75,6 +78,7 @@ class Accepted_List_Group_Commands(commands.Cog):
     @accepted_list_group.command(
         name="clear", description="Clear accepted list for the current auction"
     )
+    @pre_defer(content="Clearing accepted Pokémon list...", ephemeral=False)
     async def accepted_list_clear(
         self,
         interaction: discord.Interaction,
@@ -8,6 +8,11 @@ from discord.ext import commands
 from utils.db.market_value_db import pokemon_autocomplete
 
 from utils.essentials.command_safe import run_command_safe
+from utils.essentials.interaction_pipeline import (
+    caches_ready,
+    no_active_auction,
+    pre_defer,
+)
 from utils.essentials.role_checks import auctioneer_only
 from utils.group_commands_func.auction import *
 from utils.logs.pretty_log import pretty_log
@@ -41,6 +46,11 @@ class AuctionGroupCommand(commands.Cog):
         accepted_pokemon="Optional List of accepted Pokémon (comma-separated)",
     )
     @app_commands.autocomplete(pokemon=pokemon_autocomplete)
+    @pre_defer(
+        content="Starting auction...",
+        ephemeral=False,
+        preconditions=(caches_ready, no_active_auction),
+    )
     async def auction_start(
         self,
         interaction: discord.Interaction,
@@ -71,6 +81,7 @@ class AuctionGroupCommand(commands.Cog):
         name="stop", description="Ends the active auction in this channel"
     )
     @auctioneer_only()
+    @pre_defer(content="Stopping auction...", ephemeral=False)
     async def auction_stop(self, interaction: discord.Interaction):
         slash_cmd_name = "auction end"
 
@@ -90,6 +101,7 @@ class AuctionGroupCommand(commands.Cog):
         name="bid", description="Place a bid in the active auction in this channel"
     )
     @app_commands.describe(amount="Your bid amount (e.g. '1k', '1.5m')")
+    @pre_defer(content="Placing your bid...", ephemeral=True)
     async def auction_bid(self, interaction: discord.Interaction, amount: str):
         slash_cmd_name = "auction bid"
 
@@ -103,6 +115,28 @@ class AuctionGroupCommand(commands.Cog):
 
     auction_bid.extras = {"category": "Public"}
 
+    # 🎀────────────────────────────────────────────
+    #          🌸 /auction max-bid 🌸
+    # 🎀────────────────────────────────────────────
+    @auction_group.command(
+        name="max-bid",
+        description="Privately set the most you are willing to pay, Jigglypuff bids for you",
+    )
+    @app_commands.describe(max_bid="Your maximum bid (e.g. '5m', '12.5m')")
+    @pre_defer(content="Registering your max bid...", ephemeral=True)
+    async def auction_max_bid(self, interaction: discord.Interaction, max_bid: str):
+        slash_cmd_name = "auction max-bid"
+
+        await run_command_safe(
+            bot=self.bot,
+            interaction=interaction,
+            slash_cmd_name=slash_cmd_name,
+            command_func=proxy_bid_func,
+            max_bid=max_bid,
+        )
+
+    auction_max_bid.extras = {"category": "Public"}
+
     # 🎀────────────────────────────────────────────
     #          🌸 /auction roll-back 🌸
     # 🎀────────────────────────────────────────────
@@ -111,15 +145,16 @@ class AuctionGroupCommand(commands.Cog):
         description="Roll back a bid in the active auction in this channel",
     )
     @app_commands.describe(
-        member="The member whose bid you want to roll back",
-        amount="The amount to roll back (e.g. '1k', '1.5m')",
+        member="Member to roll the bid back to (leave empty to undo the latest bid)",
+        amount="The amount to roll back to (e.g. '1k', '1.5m')",
     )
     @auctioneer_only()
+    @pre_defer(content="Rolling back the bid...", ephemeral=False)
     async def auction_roll_back(
         self,
         interaction: discord.Interaction,
-        member: discord.Member,
-        amount: str,
+        member: discord.Member = None,
+        amount: str = None,
     ):
         slash_cmd_name = "auction roll-back"
 
@@ -146,6 +181,7 @@ class AuctionGroupCommand(commands.Cog):
         duration="Duration to add or subtract (e.g. '5m', '2h')",
     )
     @auctioneer_only()
+    @pre_defer(content="Updating ends on...", ephemeral=False)
     async def auction_update_ends_on(
         self,
         interaction: discord.Interaction,
@@ -191,6 +227,7 @@ class AuctionGroupCommand(commands.Cog):
         name="info",
         description="Displays information about the active auction in this channel",
     )
+    @pre_defer(content="Fetching Auction Info...", ephemeral=False)
     async def auction_info(self, interaction: discord.Interaction):
         slash_cmd_name = "auction info"
 
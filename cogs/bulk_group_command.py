@@ -8,6 +8,11 @@ from discord.ext import commands
 
 from utils.db.market_value_db import pokemon_autocomplete
 from utils.essentials.command_safe import run_command_safe
+from utils.essentials.interaction_pipeline import (
+    caches_ready,
+    no_active_auction,
+    pre_defer,
+)
 from utils.essentials.role_checks import auctioneer_only
 from utils.group_commands_func.bulk import *
 from utils.logs.pretty_log import pretty_log
@@ -40,6 +45,11 @@ class BulkGroupCommand(commands.Cog):
         autobuy="Autobuy price (e.g. '1k', '1.5m')",
         accepted_pokemon="Optional List of accepted Pokémon (comma-separated)",
     )
+    @pre_defer(
+        content="Generating embed...",
+        ephemeral=False,
+        preconditions=(caches_ready, no_active_auction),
+    )
     async def bulk_auction_start(
         self,
         interaction: discord.Interaction,
@@ -68,6 +78,7 @@ class BulkGroupCommand(commands.Cog):
         name="list", description="Shows the list of pokemon in the current bulk auction"
     )
     @auctioneer_only()
+    @pre_defer(content="Fetching bulk auction details...", ephemeral=False)
     async def bulk_auction_list(self, interaction: discord.Interaction):
         slash_cmd_name = "bulk-auction list"
 
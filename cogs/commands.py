@@ -2,72 +2,28 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 
-from constants.aesthetic import *
-from constants.grand_line_auction_constants import (
-    GRAND_LINE_AUCTION_ROLES,
-    GRAND_LINE_AUCTION_TEXT_CHANNELS,
-    DEFAULT_EMBED_COLOR
+from utils.essentials.help_catalog import (
+    CATEGORY_CONFIG,
+    HelpTier,
+    get_help_tier,
+    with_author,
 )
+from utils.essentials.role_checks import interaction_role_ids, is_staff
 from utils.logs.pretty_log import pretty_log
-from utils.essentials.role_checks import is_staff_member
-
-
-STAFF_THUMBNAIL = Thumbnails.pink_butterfly
-START_THUMBNAIL = Thumbnails.pink_flower
-PUBLIC_THUMBNAIL = Thumbnails.pink_cupcake
-PUBLIC_EMOJI = "🎀"
-STAFF_EMOJI = "🧁"
-MAIN_DIVIDER = Dividers.pink_flowers
-TITLE_EMOJI = "🌸"
-# 🍭──────────────────────────────
-#   🎀 Category Settings
-# 🍭──────────────────────────────
-CATEGORY_CONFIG = {
-    "Public": {
-        "emoji": PUBLIC_EMOJI,
-        "label": "Public",
-        "color": 0xECBDC4,
-        "thumbnail": PUBLIC_THUMBNAIL,
-    },
-    "Staff": {
-        "emoji": STAFF_EMOJI,
-        "label": "Staff",
-        "color": 0xF4589A,
-        "thumbnail": STAFF_THUMBNAIL,
-    },
-}
-
-
-# 💠───────────────────────────────────────────────────────────────
-# [🧩 HELPER] Flatten commands and include group prefixes
-# ────────────────────────────────────────────────────────────────
-def flatten_commands(commands_list, parent_name="") -> list[app_commands.Command]:
-    flattened = []
-    for cmd in commands_list:
-        if isinstance(cmd, app_commands.Group):
-            new_parent = f"{parent_name} {cmd.name}".strip()
-            flattened.extend(flatten_commands(cmd.commands, new_parent))
-        else:
-            cmd.full_name = (
-                f"/{parent_name} {cmd.name}".strip() if parent_name else f"/{cmd.name}"
-            )
-            flattened.append(cmd)
-    return flattened
 
 
 # 💠───────────────────────────────────────────────────────────────
 # [📄 VIEW] Paginated View
 # ────────────────────────────────────────────────────────────────
 class PaginatedCategoryView(discord.ui.View):
-    def __init__(self, user, category, commands_list, command_map):
+    def __init__(self, user, category, tier: HelpTier):
         super().__init__(timeout=120)
         self.user = user
         self.category = category
-        self.commands = commands_list
+        self.tier = tier
+        self.pages = tier.pages[category]
         self.page = 0
-        self.per_page = 6
-        self.max_page = (len(self.commands) - 1) // self.per_page
-        self.command_map = command_map
+        self.max_page = len(self.pages) - 1
         self.message: discord.Message = None
         self.add_navigation_buttons()
 
@@ -78,38 +34,12 @@ class PaginatedCategoryView(discord.ui.View):
         if self.page < self.max_page:
             self.add_item(PageNavButton("➡️", self, 1))
         # ✅ Always show home button
-        self.add_item(BackHomeButton(self.user, self.command_map))
+        self.add_item(BackHomeButton(self.user, self.tier))
 
     async def send_page(self):
         try:
-            cfg = CATEGORY_CONFIG[self.category]
-            start = self.page * self.per_page
-            end = start + self.per_page
-            cmds = self.commands[start:end]
-
-            embed = discord.Embed(
-                title=f"{cfg['emoji']} {cfg['label']} Commands",
-                color=cfg["color"],
-            )
-            embed.set_author(
-                name=self.user.display_name, icon_url=self.user.display_avatar.url
-            )
-            if cfg.get("thumbnail"):
-                embed.set_thumbnail(url=cfg["thumbnail"])
-
-            for cmd in cmds:
-                command_name = getattr(cmd, "full_name", "/" + cmd.name)
-                embed.add_field(
-                    name=command_name,
-                    value=cmd.description or "No description",
-                    inline=False,
-                )
-            embed.set_image(url=MAIN_DIVIDER)
-            embed.set_footer(
-                text=f"📄 Page {self.page + 1} of {self.max_page + 1} • 🌷 {len(self.commands)} commands"
-            )
-
-
+            # Pages are pre-rendered in the help catalog, only the author is per user
+            embed = with_author(self.pages[self.page], self.user)
             self.add_navigation_buttons()
             await self.message.edit(embed=embed, view=self)
         except Exception as e:
@@ -134,10 +64,10 @@ class PageNavButton(discord.ui.Button):
 
 
 class BackHomeButton(discord.ui.Button):
-    def __init__(self, user, command_map):
+    def __init__(self, user, tier: HelpTier):
         super().__init__(emoji="🏠", style=discord.ButtonStyle.primary)
         self.user = user
-        self.command_map = command_map
+        self.tier = tier
 
     async def callback(self, interaction: discord.Interaction):
         try:
@@ -146,25 +76,11 @@ class BackHomeButton(discord.ui.Button):
                     "This menu isn’t for you! ❌", ephemeral=True
                 )
 
-            view = CommandCategoryMenuView(self.user, self.command_map or {})
-            description = (
-                "Choose a command group by clicking the buttons below! ✨\n\n"
-                + "\n".join(view.category_lines)
-            )
-
-            embed = discord.Embed(
-                title=f"{TITLE_EMOJI} Command Categories",
-                description=description,
-                color=DEFAULT_EMBED_COLOR,
-            )
-            embed.set_image(url=MAIN_DIVIDER)
-            embed.set_thumbnail(url=START_THUMBNAIL)
-            embed.set_author(
-                name=self.user.display_name, icon_url=self.user.display_avatar.url
-            )
-
+            view = CommandCategoryMenuView(self.user, self.tier)
             view.message = interaction.message
-            await interaction.response.edit_message(embed=embed, view=view)
+            await interaction.response.edit_message(
+                embed=with_author(self.tier.home, self.user), view=view
+            )
         except Exception as e:
             pretty_log("error", f"[BackHomeButton] Callback failed: {e}")
 
@@ -173,30 +89,24 @@ class BackHomeButton(discord.ui.Button):
 # [🌼 VIEW] Category Menu — Home
 # ────────────────────────────────────────────────────────────────
 class CommandCategoryMenuView(discord.ui.View):
-    def __init__(self, user: discord.User, command_map: dict[str, list[str]]):
+    def __init__(self, user: discord.User, tier: HelpTier):
         super().__init__(timeout=120)
         self.user = user
-        self.command_map = command_map
+        self.tier = tier
         self.message: discord.Message = None
-        self.category_lines = []
 
-        for category, data in CATEGORY_CONFIG.items():
-            emoji = data["emoji"]
-            if command_map.get(category):
-                self.add_item(
-                    CategoryButton(user, category, command_map[category], command_map)
-                )
-                self.category_lines.append(f"{emoji} — {data['label']} Commands")
+        for category in CATEGORY_CONFIG:
+            if tier.pages.get(category):
+                self.add_item(CategoryButton(user, category, tier))
 
 
 class CategoryButton(discord.ui.Button):
-    def __init__(self, user, category, commands_list, command_map):
+    def __init__(self, user, category, tier: HelpTier):
         config = CATEGORY_CONFIG[category]
         super().__init__(emoji=config["emoji"], style=discord.ButtonStyle.secondary)
         self.user = user
         self.category = category
-        self.commands = commands_list
-        self.command_map = command_map
+        self.tier = tier
 
     async def callback(self, interaction: discord.Interaction):
         if interaction.user != self.user:
@@ -205,9 +115,7 @@ class CategoryButton(discord.ui.Button):
             )
         await interaction.response.defer()
 
-        view = PaginatedCategoryView(
-            self.user, self.category, self.commands, self.command_map
-        )
+        view = PaginatedCategoryView(self.user, self.category, self.tier)
         view.message = interaction.message
         await view.send_page()
 
@@ -226,36 +134,16 @@ class CommandsView(commands.Cog):
 
             user = interaction.user
 
-            # Staff check
-            # Flatten commands
-            all_commands = flatten_commands(self.bot.tree.get_commands())
-            command_map = {"Public": [], "Staff": []}
-
-            for cmd in all_commands:
-                category = getattr(cmd, "extras", {}).get("category", "Public")
-
-                # 👑 Staff Only
-                if category == "Staff":
-                    if is_staff_member(user):
-                        command_map["Staff"].append(cmd)
-                else:
-                    command_map["Public"].append(cmd)
-
-            view = CommandCategoryMenuView(user, command_map)
-            description = (
-                "Choose a command group by clicking the buttons below! 🌷\n\n"
-                + "\n".join(view.category_lines)
+            # Staff check picks the tier, the pages come from the help catalog
+            user_is_staff = is_staff(
+                user.id, interaction_role_ids(interaction), interaction.guild_id
             )
+            tier = get_help_tier(self.bot, user_is_staff)
 
-            embed = discord.Embed(
-                title=f"{TITLE_EMOJI} Command Categories",
-                description=description,
-                color=DEFAULT_EMBED_COLOR,
+            view = CommandCategoryMenuView(user, tier)
+            view.message = await interaction.followup.send(
+                embed=with_author(tier.home, user), view=view
             )
-            embed.set_image(url=MAIN_DIVIDER)
-            embed.set_author(name=user.display_name, icon_url=user.display_avatar.url)
-            embed.set_thumbnail(url=START_THUMBNAIL)
-            view.message = await interaction.followup.send(embed=embed, view=view)
         except Exception as e:
             pretty_log("error", f"[CommandsView] Command failed: {e}")
 
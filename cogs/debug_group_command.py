@@ -0,0 +1,71 @@
+import discord
+from discord import app_commands
+from discord.ext import commands
+
+from utils.essentials.command_safe import run_command_safe
+from utils.essentials.role_checks import owner_only
+from utils.group_commands_func.debug import *
+
+GROUP_NAME = "debug"
+
+
+# 🎀────────────────────────────────────────────
+#           🌸 Debug Cog Setup 🌸
+# ─────────────────────────────────────────────
+class Debug_Group_Commands(commands.Cog):
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+
+    # 🎀────────────────────────────────────────────
+    #           🌸 Slash Command Group 🌸
+    # 🎀────────────────────────────────────────────
+    debug_group = app_commands.Group(
+        name=GROUP_NAME, description="Owner-only debug logging controls"
+    )
+
+    # 🎀────────────────────────────────────────────
+    #          🌸 /debug toggle 🌸
+    # 🎀────────────────────────────────────────────
+    @debug_group.command(
+        name="toggle", description="Turn debug logging on/off for a function"
+    )
+    @app_commands.describe(
+        func_path="Function path, e.g. utils.db.market_value_db.pokemon_autocomplete",
+    )
+    @app_commands.autocomplete(func_path=debug_path_autocomplete)
+    @owner_only()
+    async def debug_toggle(self, interaction: discord.Interaction, func_path: str):
+        slash_cmd_name = "debug toggle"
+
+        await run_command_safe(
+            bot=self.bot,
+            interaction=interaction,
+            slash_cmd_name=slash_cmd_name,
+            command_func=debug_toggle_func,
+            func_path=func_path,
+        )
+
+    debug_toggle.extras = {"category": "Owner"}
+
+    # 🎀────────────────────────────────────────────
+    #          🌸 /debug list 🌸
+    # 🎀────────────────────────────────────────────
+    @debug_group.command(
+        name="list", description="List functions with debug logging enabled"
+    )
+    @owner_only()
+    async def debug_list(self, interaction: discord.Interaction):
+        slash_cmd_name = "debug list"
+
+        await run_command_safe(
+            bot=self.bot,
+            interaction=interaction,
+            slash_cmd_name=slash_cmd_name,
+            command_func=debug_list_func,
+        )
+
+    debug_list.extras = {"category": "Owner"}
+
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(Debug_Group_Commands(bot))
@@ -1,16 +1,23 @@
 import asyncio
+import contextlib
+import time
 
 from discord.ext import commands
 
+from utils.db.auction_results_db import ensure_result_partitions
+from utils.db.guild_config_db import ensure_guild_config_listener
+from utils.logs.metrics import METRICS, measure
 from utils.logs.pretty_log import pretty_log
 
 # 🧹 Import your scheduled tasks
 from utils.schedule.background_task.auction_end_checker import (
     check_and_end_due_auctions,
+    reconcile_auction_endings,
 )
 from utils.schedule.background_task.last_minute_ping_checker import (
     check_and_ping_last_minute_auctions,
 )
+from utils.schedule.auction_schedule import flush_pending_ends_on
 
 TEST_SECONDS = 1
 ACTUAL_SECONDS = 30
@@ -25,16 +32,31 @@ class CentralLoop(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
         self.loop_task = None
+        self.stopping = asyncio.Event()
 
-    def cog_unload(self):
-        if self.loop_task and not self.loop_task.done():
+    async def cog_unload(self):
+        await self.stop_loop()
+
+    async def stop_loop(self, timeout: float = TICK_INTERVAL) -> bool:
+        """
+        Lets the running tick finish (an auction is never left deleted without its ended
+        message), cancels only if it overruns the timeout. Returns True if it stopped cleanly.
+        """
+        self.stopping.set()
+        if not self.loop_task or self.loop_task.done():
+            return True
+        try:
+            await asyncio.wait_for(asyncio.shield(self.loop_task), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
             self.loop_task.cancel()
             pretty_log(
                 "warn",
-                "Loop task cancelled on cog unload.",
+                f"Loop task cancelled after {timeout:.0f}s on stop.",
                 label="CENTRAL LOOP",
                 bot=self.bot,
             )
+            return False
 
     async def central_loop(self):
         """Background loop that ticks every 30 seconds"""
@@ -45,7 +67,7 @@ class CentralLoop(commands.Cog):
             label="🌻 CENTRAL LOOP",
             bot=self.bot,
         )
-        while not self.bot.is_closed():
+        while not self.bot.is_closed() and not self.stopping.is_set():
             try:
                 """pretty_log(
                     "",
@@ -54,25 +76,51 @@ class CentralLoop(commands.Cog):
                     bot=self.bot,
                 )"""
 
+                tick_start = time.perf_counter()
+
+                # 🗂️ Keep the guild_config LISTEN connection alive (hot reload of ids)
+                with measure("loop_task_ms", task="ensure_guild_config_listener"):
+                    await ensure_guild_config_listener(self.bot)
+
+                # 🗃️ Monthly auction_results partitions (one DB call per new month)
+                with measure("loop_task_ms", task="ensure_result_partitions"):
+                    await ensure_result_partitions(self.bot)
+
+                # ⏰ Write soft close extensions before the checks read ends_on from the DB
+                with measure("loop_task_ms", task="flush_pending_ends_on"):
+                    await flush_pending_ends_on(self.bot)
+
                 # 🍰 Check and end due auctions
-                await check_and_end_due_auctions(self.bot)
+                with measure("loop_task_ms", task="check_and_end_due_auctions"):
+                    await check_and_end_due_auctions(self.bot)
+
+                # 🧾 Finish auction endings left half way (crash, failed send)
+                with measure("loop_task_ms", task="reconcile_auction_endings"):
+                    await reconcile_auction_endings(self.bot)
 
                 # 🍩 Check and ping auctions that are ending within 10 minutes
-                await check_and_ping_last_minute_auctions(self.bot)
+                with measure("loop_task_ms", task="check_and_ping_last_minute_auctions"):
+                    await check_and_ping_last_minute_auctions(self.bot)
+
+                METRICS.observe("loop_tick_ms", (time.perf_counter() - tick_start) * 1000)
+                METRICS.set_gauge("loop_last_tick_unix", time.time())
 
             except Exception as e:
+                METRICS.inc("loop_errors_total")
                 pretty_log(
                     "error",
                     f"{e}",
                     label="CENTRAL LOOP ERROR",
                     bot=self.bot,
                 )
-            await asyncio.sleep(TICK_INTERVAL)  # ⏱ tick interval
+            # ⏱ tick interval, cut short by stop_loop
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self.stopping.wait(), timeout=TICK_INTERVAL)
 
     @commands.Cog.listener()
     async def on_ready(self):
         """Start the loop automatically once the bot is ready"""
-        if not self.loop_task:
+        if not self.loop_task and not self.stopping.is_set():
             self.loop_task = asyncio.create_task(self.central_loop())
 
 
@@ -85,7 +133,11 @@ async def setup(bot: commands.Bot):
 
     print("\n[📋 CENTRAL LOOP CHECKLIST] Scheduled tasks loaded:")
     print("  ─────────────────────────────────────────────")
+    print("  ✅  🗂️ ensure_guild_config_listener")
+    print("  ✅  🗃️ ensure_result_partitions")
+    print("  ✅  ⏰ flush_pending_ends_on")
     print("  ✅  🍰 check_and_end_due_auctions")
+    print("  ✅  🧾 reconcile_auction_endings")
     print("  ✅  🍩 check_and_ping_last_minute_auctions")
     print("  🌻 CentralLoop ticking every 60 seconds!")
     print("  ─────────────────────────────────────────────\n")
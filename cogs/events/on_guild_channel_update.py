@@ -0,0 +1,43 @@
+import discord
+from discord.ext import commands
+
+from constants.grand_line_auction_constants import GLA_SERVER_ID
+from utils.essentials.channel_routing import rebuild_channel_routes
+
+
+# 🍭──────────────────────────────
+#   🎀 Event: On Guild Channel Update
+# 🍭──────────────────────────────
+class OnGuildChannelUpdateCog(commands.Cog):
+    """Rebuilds the channel routing table when GLA categories change."""
+
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+
+    def _refresh(self, channel: discord.abc.GuildChannel):
+        if channel.guild.id == GLA_SERVER_ID and isinstance(
+            channel, discord.CategoryChannel
+        ):
+            rebuild_channel_routes(channel.guild)
+
+    @commands.Cog.listener()
+    async def on_ready(self):
+        rebuild_channel_routes(self.bot.get_guild(GLA_SERVER_ID))
+
+    @commands.Cog.listener()
+    async def on_guild_channel_update(
+        self, before: discord.abc.GuildChannel, after: discord.abc.GuildChannel
+    ):
+        self._refresh(after)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_create(self, channel: discord.abc.GuildChannel):
+        self._refresh(channel)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel):
+        self._refresh(channel)
+
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(OnGuildChannelUpdateCog(bot))
@@ -3,14 +3,11 @@ from datetime import datetime
 import discord
 from discord.ext import commands
 
-from constants.grand_line_auction_constants import (
-    GLA_SERVER_ID,
-    GRAND_LINE_AUCTION_TEXT_CHANNELS,
-    YUKI_USER_ID,
-)
-
-LOG_CHANNEL_ID = GRAND_LINE_AUCTION_TEXT_CHANNELS.server_logs
+from constants.grand_line_auction_constants import GLA_SERVER_ID, YUKI_USER_ID
+from constants.guild_config import SERVER_LOG_CHANNEL
+from utils.cache.guild_config_cache import configured_guild_ids, get_guild_config
 
+# Guilds with a row in guild_config are allowed as well
 ALLOWED_GUILD_IDS = [GLA_SERVER_ID, 1220718310455250996, 1311620784720183316]
 
 from utils.logs.pretty_log import pretty_log
@@ -27,9 +24,10 @@ class OnGuildJoinCog(commands.Cog):
     async def on_guild_join(self, guild: discord.Guild):
         bot_owner = self.bot.get_user(YUKI_USER_ID)
         main_guild: discord.Guild = self.bot.get_guild(GLA_SERVER_ID)
-        if guild.id not in ALLOWED_GUILD_IDS:
+        log_channel_id = get_guild_config().first_id(SERVER_LOG_CHANNEL)
+        if guild.id not in ALLOWED_GUILD_IDS and guild.id not in configured_guild_ids():
             # Log the event to server log channel
-            log_channel = main_guild.get_channel(LOG_CHANNEL_ID)
+            log_channel = main_guild.get_channel(log_channel_id)
             log_embed = discord.Embed(
                 title="❌ Unrecognized Guild Joined",
                 description=(
@@ -75,7 +73,7 @@ class OnGuildJoinCog(commands.Cog):
             )
         else:
             # Log the successful join to server log channel
-            log_channel = main_guild.get_channel(LOG_CHANNEL_ID)
+            log_channel = main_guild.get_channel(log_channel_id)
             log_embed = discord.Embed(
                 title="✅ Joined Authorized Guild",
                 description=(
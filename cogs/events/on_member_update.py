@@ -0,0 +1,38 @@
+import discord
+from discord.ext import commands
+
+from constants.grand_line_auction_constants import GLA_SERVER_ID
+from utils.cache.member_resolver import MEMBER_RESOLVER
+
+
+# 🍭──────────────────────────────
+#   🎀 Event: On Member Update
+# 🍭──────────────────────────────
+class OnMemberUpdateCog(commands.Cog):
+    """Keeps the member resolver snapshots fresh (names, avatars, role ids used by role_checks)."""
+
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+
+    @commands.Cog.listener()
+    async def on_ready(self):
+        # Fill the gateway member cache once so lookups don't go to the API
+        await MEMBER_RESOLVER.warm_up(self.bot.get_guild(GLA_SERVER_ID))
+
+    @commands.Cog.listener()
+    async def on_member_update(self, before: discord.Member, after: discord.Member):
+        if after.guild.id == GLA_SERVER_ID:
+            MEMBER_RESOLVER.invalidate(after.id)
+
+    @commands.Cog.listener()
+    async def on_member_remove(self, member: discord.Member):
+        if member.guild.id == GLA_SERVER_ID:
+            MEMBER_RESOLVER.invalidate(member.id)
+
+    @commands.Cog.listener()
+    async def on_user_update(self, before: discord.User, after: discord.User):
+        MEMBER_RESOLVER.invalidate(after.id)
+
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(OnMemberUpdateCog(bot))
@@ -7,6 +7,7 @@ from constants.grand_line_auction_constants import (
     MH_APP_ID,
     POKEMEOW_APPLICATION_ID,
 )
+from constants.paldea_galar_dict import RARITY_BY_COLOR
 from utils.listener_func.dex_listener import dex_listener
 
 # ————————————————————————————————
@@ -14,8 +15,11 @@ from utils.listener_func.dex_listener import dex_listener
 # ————————————————————————————————
 from utils.listener_func.market_view_listener import market_view_listener
 from utils.listener_func.mh_lookup_listener import lookup_listener
+from utils.logs.metrics import METRICS
 from utils.logs.pretty_log import pretty_log
 
+METRICS.describe("pokemeow_embeds_total", "PokéMeow embeds seen, by rarity (from the embed color)")
+
 
 def embed_has_field_name(embed, name_to_match: str) -> bool:
     """
@@ -30,6 +34,17 @@ def embed_has_field_name(embed, name_to_match: str) -> bool:
     return False
 
 
+def classify_embed_rarity(embed: discord.Embed | None) -> str | None:
+    """
+    Rarity of a PokéMeow embed from its color alone (one dict lookup, no text parsing).
+    None when the embed has no color or the color isn't a rarity color.
+    """
+    color = getattr(embed, "color", None)
+    if color is None:
+        return None
+    return RARITY_BY_COLOR.get(color.value)
+
+
 # 🐾────────────────────────────────────────────
 #        🌸 Message Create Listener Cog
 # 🐾────────────────────────────────────────────
@@ -76,8 +91,16 @@ class MessageCreateListener(commands.Cog):
             ):
                 return
 
-            content = message.content
-            first_embed = message.embeds[0] if message.embeds else None
+            # ————————————————————————————————
+            # 🎨 Pre-filter — every listener below needs an embed
+            # ————————————————————————————————
+            if not message.embeds:
+                return
+            first_embed = message.embeds[0]
+            embed_rarity = classify_embed_rarity(first_embed)
+            if embed_rarity:
+                METRICS.inc("pokemeow_embeds_total", rarity=embed_rarity)
+
             first_embed_author = (
                 first_embed.author.name if first_embed and first_embed.author else ""
             )
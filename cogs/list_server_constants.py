@@ -1,12 +1,189 @@
+import asyncio
 import os
 import re
+import tempfile
 
 import discord
 from discord import app_commands
 from discord.ext import commands
 
+from utils.logs.pretty_log import pretty_log
+
 ALLOWED_USER_IDS = {705447976658665552, 952071312124313611}
 
+FILE_HEADER = "# 🐾 Generated by Bot for server constants 🐾\n\n"
+CLASS_BANNER = "# 💦☁────────────────────────────────────────────💦☁"
+CATEGORY_MARK = "─────────────"
+# Sections in the order they are written, True when grouped by category
+SECTIONS = {
+    "TEXT_CHANNELS": True,
+    "VOICE_CHANNELS": True,
+    "STAGE_CHANNELS": True,
+    "NEWS_CHANNELS": True,
+    "CATEGORIES": False,
+    "ROLES": False,
+    "EMOJIS": False,
+}
+CLASS_BLOCK_PATTERN = re.compile(
+    rf"{CLASS_BANNER}\n#\s+(\w+)\n{CLASS_BANNER}\nclass \1:\n(.*?)(?=\n*{CLASS_BANNER}|\n+[^\s#]|\s*\Z)",
+    re.DOTALL,
+)
+MAX_DIFF_CHARS = 1800
+
+
+# -------------------- File helpers (pure, run off-loop) --------------------
+def format_value(value) -> str:
+    # Wrap in quotes if it's an emoji string starting with '<'
+    if isinstance(value, str) and value.startswith("<"):
+        return f'"{value}"'
+    return str(value)
+
+
+def parse_class_body(body: str, group_by_category: bool) -> dict:
+    """Reads the entries of a generated class back into a (nested) dict"""
+    items = {}
+    current_category = None
+    for line in body.splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            if CATEGORY_MARK in line:
+                parts = line.split(f"{CATEGORY_MARK} ")
+                if len(parts) > 1:
+                    current_category = parts[1].split(f" {CATEGORY_MARK}")[0].strip()
+            continue
+        if " = " not in line:
+            continue
+        key, value = line.split(" = ", 1)
+        if value.startswith('"') and value.endswith('"'):
+            value = value[1:-1]
+        if group_by_category and current_category:
+            items.setdefault(current_category, {})[key] = value
+        elif not group_by_category:
+            items[key] = value
+    return items
+
+
+def render_class(class_name: str, items: dict, group_by_category: bool) -> str:
+    lines = [
+        f"{CLASS_BANNER}\n",
+        f"#       {class_name}\n",
+        f"{CLASS_BANNER}\n",
+        f"class {class_name}:\n\n",
+    ]
+    if group_by_category:
+        for cat_name, cat_items in items.items():
+            lines.append(
+                f"    \n# 🌊💙🤍{CATEGORY_MARK} {cat_name} {CATEGORY_MARK}💙🤍🌊\n\n"
+            )
+            for name, value in cat_items.items():
+                lines.append(f"    {name} = {format_value(value)}\n")
+    else:
+        for name, value in items.items():
+            lines.append(f"    {name} = {format_value(value)}\n")
+    return "".join(lines)
+
+
+def merge_items(
+    section: str, existing: dict, new: dict, group_by_category: bool
+) -> tuple[dict, list[str]]:
+    """
+    Adds entries missing from the file, entries already in the file are kept as they are
+    (same as before). Returns the merged items and the diff lines.
+    """
+    diff = []
+    merged = {
+        key: dict(value) if group_by_category else value
+        for key, value in existing.items()
+    }
+    pairs = (
+        [(cat, cat_items) for cat, cat_items in new.items()]
+        if group_by_category
+        else [(None, new)]
+    )
+    for cat_name, new_items in pairs:
+        target = merged.setdefault(cat_name, {}) if group_by_category else merged
+        prefix = f"{section}.{cat_name}" if group_by_category else section
+        for name, value in new_items.items():
+            if name not in target:
+                target[name] = value
+                diff.append(f"+ {prefix}.{name} = {value}")
+            elif str(target[name]) != str(value):
+                diff.append(f"~ {prefix}.{name}: {target[name]} -> {value} (kept)")
+    return merged, diff
+
+
+def build_constants_file(
+    content: str, alias: str, sections: dict[str, dict]
+) -> tuple[str, list[str]]:
+    """
+    Merges every section into the file content in one pass. Classes not generated
+    by this command are left untouched.
+    """
+    if not content:
+        content = FILE_HEADER
+    blocks = {match.group(1): match for match in CLASS_BLOCK_PATTERN.finditer(content)}
+    rendered = {}
+    diff = []
+    for suffix, group_by_category in SECTIONS.items():
+        items = sections.get(suffix)
+        if not items:
+            continue  # skip empty sections
+        class_name = f"{alias}_{suffix}"
+        match = blocks.get(class_name)
+        existing = parse_class_body(match.group(2), group_by_category) if match else {}
+        merged, section_diff = merge_items(suffix, existing, items, group_by_category)
+        rendered[class_name] = render_class(class_name, merged, group_by_category)
+        diff.extend(section_diff)
+
+    # -------------------- Swap existing classes, append new ones --------------------
+    parts = []
+    cursor = 0
+    for class_name, match in blocks.items():
+        if class_name not in rendered:
+            continue
+        parts.append(content[cursor : match.start()])
+        parts.append(rendered.pop(class_name).rstrip("\n"))
+        cursor = match.end()
+    parts.append(content[cursor:])
+    new_content = "".join(parts).rstrip("\n") + "\n"
+    for class_text in rendered.values():
+        new_content += "\n" + class_text + "\n"
+    return new_content.rstrip("\n") + "\n", diff
+
+
+def read_text(filename: str) -> str:
+    if not os.path.exists(filename):
+        return ""
+    with open(filename, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def write_atomic(filename: str, content: str):
+    """Writes to a temp file next to the target then renames it, readers never see half a file"""
+    directory = os.path.dirname(os.path.abspath(filename))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, filename)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def update_constants_file(
+    filename: str, alias: str, sections: dict[str, dict], dry_run: bool = False
+) -> list[str]:
+    """🟦 Read, merge and (unless dry run) write the constants file, returns the diff"""
+    content = read_text(filename)
+    new_content, diff = build_constants_file(content, alias, sections)
+    if not dry_run and new_content != content:
+        write_atomic(filename, new_content)
+    return diff
+
 
 class ServerConstants(commands.Cog):
     """🐾 Server Constants Extractor Cog 🐾"""
@@ -41,254 +218,100 @@ class ServerConstants(commands.Cog):
             name = "_unknown"
         return name
 
-    #
-    def update_constants_file(
-        self,
-        filename: str,
-        class_suffix: str,
-        items: dict,
-        guild_name: str,
-        group_by_category: bool = False,
-    ):
-        """🟦 Create or update a constants class in the file, skip if empty"""
-        if not items:
-            return  # skip empty sections
-
-        # -------------------- Use alias if available --------------------
-        alias = getattr(self, "SERVER_ALIASES", {}).get(
-            guild_name, self.safe_name(guild_name).upper()
-        )
-        class_name = f"{alias}_{class_suffix}"
-
-        # -------------------- Create file if missing --------------------
-        if not os.path.exists(filename):
-            with open(filename, "w", encoding="utf-8") as f:
-                f.write(f"# 🐾 Generated by Bot for server constants 🐾\n\n")
-
-        # -------------------- Read existing content --------------------
-        with open(filename, "r", encoding="utf-8") as f:
-            content = f.read()
-
-        # -------------------- Prepare new class content --------------------
-        class_lines = [
-            f"# 💦☁────────────────────────────────────────────💦☁\n",
-            f"#       {class_name}\n",
-            f"# 💦☁────────────────────────────────────────────💦☁\n",
-            f"class {class_name}:\n\n",
-        ]
-
-        if group_by_category:
-            # items should be: {category_name: {channel_name: id}}
-            for cat_name, cat_channels in items.items():
-                class_lines.append(
-                    f"    \n# 🌊💙🤍───────────── {cat_name} ─────────────💙🤍🌊\n\n"
-                )
-                for ch_name, ch_id in cat_channels.items():
-                    class_lines.append(f"    {ch_name} = {ch_id}\n")
-        else:
-            for name, id in items.items():
-                # Wrap in quotes if it's an emoji string starting with '<'
-                if isinstance(id, str) and id.startswith("<"):
-                    class_lines.append(f'    {name} = "{id}"\n')
-                else:
-                    class_lines.append(f"    {name} = {id}\n")
-
-        new_class_content = "".join(class_lines)
-
-        # -------------------- Merge if class exists --------------------
-        if f"class {class_name}:" in content:
-            pattern = re.compile(rf"class {class_name}:\n(.*?)(\n\n|$)", re.DOTALL)
-            match = pattern.search(content + "\n\n")
-            existing_items = {}
-            current_category = None
-
-            if match:
-                for line in match.group(1).splitlines():
-                    line = line.strip()
-                    # Skip empty lines and comment lines
-                    if not line or line.startswith("#"):
-                        # Check if it's a category header
-                        if "─────────────" in line and "─────────────" in line:
-                            # Extract category name from comment
-                            parts = line.split("───────────── ")
-                            if len(parts) > 1:
-                                cat_part = parts[1].split(" ─────────────")[0]
-                                current_category = cat_part.strip()
-                        continue
-
-                    if "=" in line:
-                        k, v = line.split(" = ", 1)
-                        # Remove surrounding quotes if present
-                        if v.startswith('"') and v.endswith('"'):
-                            v = v[1:-1]
-
-                        if group_by_category and current_category:
-                            if current_category not in existing_items:
-                                existing_items[current_category] = {}
-                            existing_items[current_category][k] = v
-                        else:
-                            existing_items[k] = v
-
-            # Merge new items with existing ones
-            if group_by_category:
-                # items is {category_name: {channel_name: id}}
-                for cat_name, cat_channels in items.items():
-                    if cat_name not in existing_items:
-                        existing_items[cat_name] = {}
-
-                    # Add only new channels that don't exist yet
-                    for ch_name, ch_id in cat_channels.items():
-                        if ch_name not in existing_items[cat_name]:
-                            existing_items[cat_name][ch_name] = ch_id
-
-                # Rebuild the class with merged data
-                merged_lines = [
-                    f"# 💦☁────────────────────────────────────────────💦☁\n",
-                    f"#       {class_name}\n",
-                    f"# 💦☁────────────────────────────────────────────💦☁\n",
-                    f"class {class_name}:\n\n",
-                ]
-
-                for cat_name, cat_items in existing_items.items():
-                    merged_lines.append(
-                        f"    \n# 🌊💙🤍───────────── {cat_name} ─────────────💙🤍🌊\n\n"
-                    )
-                    for item_name, item_id in cat_items.items():
-                        if isinstance(item_id, str) and item_id.startswith("<"):
-                            merged_lines.append(f'    {item_name} = "{item_id}"\n')
-                        else:
-                            merged_lines.append(f"    {item_name} = {item_id}\n")
-            else:
-                # Normal case - flat dictionary
-                # Add new items if missing
-                for k, v in items.items():
-                    if k not in existing_items:
-                        existing_items[k] = v
-
-                merged_lines = [
-                    f"# 💦☁────────────────────────────────────────────💦☁\n",
-                    f"#       {class_name}\n",
-                    f"# 💦☁────────────────────────────────────────────💦☁\n",
-                    f"class {class_name}:\n\n",
-                ]
-                for k, v in existing_items.items():
-                    if isinstance(v, str) and v.startswith("<"):
-                        merged_lines.append(f'    {k} = "{v}"\n')
-                    else:
-                        merged_lines.append(f"    {k} = {v}\n")
-
-            merged_content = "".join(merged_lines)
-            content = pattern.sub(merged_content + "\n\n", content)
-        else:
-            content += "\n" + new_class_content + "\n"
-
-        # -------------------- Write updated content --------------------
-        with open(filename, "w", encoding="utf-8") as f:
-            f.write(content)
-
-    @app_commands.command(
-        name="list-server", description="🐾 Extract server info and save constants 🐾"
-    )
-    async def list_server(self, interaction: discord.Interaction):
-
-        if interaction.user.id not in ALLOWED_USER_IDS:
-            interaction.response.send_message(
-                content="Only Yuki or Khy is allowed to use this!"
-            )
-            return
-
-        guild = interaction.guild
-        filename = self.sanitize_filename(guild.name)
+    def class_alias(self, guild_name: str) -> str:
+        return self.SERVER_ALIASES.get(guild_name, self.safe_name(guild_name).upper())
 
-        # -------------------- Channels grouped by category --------------------
-        text_channels_by_cat = {}
-        voice_channels_by_cat = {}
-        stage_channels_by_cat = {}
-        news_channels_by_cat = {}
+    def collect_sections(self, guild: discord.Guild) -> dict[str, dict]:
+        """🐾 Builds every section in one pass over channels, roles and emojis"""
+        sections = {suffix: {} for suffix in SECTIONS}
+        cat_names = {}  # category id -> title cased safe name
 
+        # -------------------- Channels grouped by category + categories --------------------
         for ch in guild.channels:
-            name = self.safe_name(ch.name)
-            cat_name = (
-                ch.category.name if getattr(ch, "category", None) else "Uncategorized"
-            )
-            cat_name = self.safe_name(cat_name).title()
+            category = getattr(ch, "category", None)
+            if category:
+                if category.id not in cat_names:
+                    cat_names[category.id] = self.safe_name(category.name).title()
+                    sections["CATEGORIES"].setdefault(
+                        self.safe_name(category.name).upper(), category.id
+                    )
+                cat_name = cat_names[category.id]
+            else:
+                cat_name = "Uncategorized"
 
             if isinstance(ch, discord.TextChannel):
                 # Check if it's a news channel
-                if getattr(ch, "is_news", lambda: False)():
-                    news_channels_by_cat.setdefault(cat_name, {})[name] = ch.id
-                else:
-                    text_channels_by_cat.setdefault(cat_name, {})[name] = ch.id
+                suffix = "NEWS_CHANNELS" if ch.is_news() else "TEXT_CHANNELS"
             elif isinstance(ch, discord.VoiceChannel):
-                voice_channels_by_cat.setdefault(cat_name, {})[name] = ch.id
+                suffix = "VOICE_CHANNELS"
             elif isinstance(ch, discord.StageChannel):
-                stage_channels_by_cat.setdefault(cat_name, {})[name] = ch.id
+                suffix = "STAGE_CHANNELS"
             elif isinstance(ch, discord.ForumChannel):
-                news_channels_by_cat.setdefault(cat_name, {})[name] = ch.id
-
-        self.update_constants_file(
-            filename,
-            "TEXT_CHANNELS",
-            text_channels_by_cat,
-            guild.name,
-            group_by_category=True,
-        )
-        self.update_constants_file(
-            filename,
-            "VOICE_CHANNELS",
-            voice_channels_by_cat,
-            guild.name,
-            group_by_category=True,
-        )
-        self.update_constants_file(
-            filename,
-            "STAGE_CHANNELS",
-            stage_channels_by_cat,
-            guild.name,
-            group_by_category=True,
-        )
-        self.update_constants_file(
-            filename,
-            "NEWS_CHANNELS",
-            news_channels_by_cat,
-            guild.name,
-            group_by_category=True,
-        )
-        # -------------------- Categories --------------------
-        categories = {}
-        for ch in guild.channels:
-            if getattr(ch, "category", None):
-                cat = ch.category
-                cat_name = self.safe_name(cat.name).upper()
-                if cat_name not in categories:
-                    categories[cat_name] = cat.id
-
-        # Use the same update_constants_file for categories
-        self.update_constants_file(filename, "CATEGORIES", categories, guild.name)
+                suffix = "NEWS_CHANNELS"
+            else:
+                continue
+            sections[suffix].setdefault(cat_name, {})[self.safe_name(ch.name)] = ch.id
 
         # -------------------- Roles --------------------
-        roles = {}
         for r in sorted(guild.roles, key=lambda x: x.position, reverse=True):
             if r.is_default():
                 continue
-            name = self.safe_name(r.name)
-            roles[name] = r.id
-        self.update_constants_file(filename, "ROLES", roles, guild.name)
+            sections["ROLES"][self.safe_name(r.name)] = r.id
 
         # -------------------- Emojis (single class) --------------------
-        all_emojis = {}
         for e in guild.emojis:
-            name = self.safe_name(e.name)
-            # Format Discord string
             emoji_str = f"<a:{e.name}:{e.id}>" if e.animated else f"<:{e.name}:{e.id}>"
-            all_emojis[name] = emoji_str
+            sections["EMOJIS"][self.safe_name(e.name)] = emoji_str
+
+        return sections
 
-        self.update_constants_file(filename, "EMOJIS", all_emojis, guild.name)
+    @app_commands.command(
+        name="list-server", description="🐾 Extract server info and save constants 🐾"
+    )
+    @app_commands.describe(
+        dry_run="Only report what would change, don't write the file"
+    )
+    async def list_server(self, interaction: discord.Interaction, dry_run: bool = False):
 
-        await interaction.response.send_message(
-            content=f"✅ Bot has updated **{filename}** with all your server constants! 💌🐾",
-            ephemeral=True,
-        )
+        if interaction.user.id not in ALLOWED_USER_IDS:
+            await interaction.response.send_message(
+                content="Only Yuki or Khy is allowed to use this!", ephemeral=True
+            )
+            return
+
+        await interaction.response.defer(ephemeral=True)
+        guild = interaction.guild
+        filename = self.sanitize_filename(guild.name)
+        sections = self.collect_sections(guild)
+
+        try:
+            # File read + merge + write happen in a worker thread, not on the gateway loop
+            diff = await asyncio.to_thread(
+                update_constants_file,
+                filename,
+                self.class_alias(guild.name),
+                sections,
+                dry_run,
+            )
+        except Exception as e:
+            pretty_log("error", f"Error updating {filename}: {e}", include_trace=True)
+            await interaction.followup.send(
+                content=f"❌ Could not update **{filename}**: {e}", ephemeral=True
+            )
+            return
+
+        if dry_run:
+            summary = f"🔎 Dry run for **{filename}**, {len(diff)} change(s)"
+        elif diff:
+            summary = f"✅ Bot has updated **{filename}** with all your server constants! 💌🐾 ({len(diff)} change(s))"
+        else:
+            summary = f"✅ **{filename}** is already up to date! 💌🐾"
+        if diff:
+            diff_text = "\n".join(diff)
+            if len(diff_text) > MAX_DIFF_CHARS:
+                diff_text = diff_text[:MAX_DIFF_CHARS].rsplit("\n", 1)[0] + "\n..."
+            summary += f"\n```diff\n{diff_text}\n```"
+        await interaction.followup.send(content=summary, ephemeral=True)
 
     list_server.extras = {"category": "Staff"}
 
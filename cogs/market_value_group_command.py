@@ -6,6 +6,7 @@ from discord.ext import commands
 
 from utils.db.market_value_db import pokemon_autocomplete
 from utils.essentials.command_safe import run_command_safe
+from utils.essentials.interaction_pipeline import pre_defer
 from utils.essentials.role_checks import auctioneer_only
 from utils.group_commands_func.market_value import *
 
@@ -37,6 +38,7 @@ class Market_Value_Group_Commands(commands.Cog):
     )
     @app_commands.autocomplete(pokemon=pokemon_autocomplete)
     @auctioneer_only()
+    @pre_defer(content="Fetching market value...", ephemeral=False)
     async def market_value_view(
         self,
         interaction: discord.Interaction,
@@ -68,6 +70,7 @@ class Market_Value_Group_Commands(commands.Cog):
     )
     @app_commands.autocomplete(pokemon=pokemon_autocomplete)
     @auctioneer_only()
+    @pre_defer(content="Updating market value...", ephemeral=False)
     async def market_value_update(
         self,
         interaction: discord.Interaction,
@@ -98,8 +101,14 @@ class Market_Value_Group_Commands(commands.Cog):
         name="filter",
         description="Filter in-game Pokémon that do not have market value data",
     )
+    @app_commands.describe(
+        export_csv="Also attach a CSV of the missing Pokémon",
+    )
     @auctioneer_only()
-    async def market_value_filter(self, interaction: discord.Interaction):
+    @pre_defer(content="Fetching market value data...", ephemeral=False)
+    async def market_value_filter(
+        self, interaction: discord.Interaction, export_csv: bool = False
+    ):
         slash_cmd_name = "market-value filter"
 
         await run_command_safe(
@@ -107,6 +116,7 @@ class Market_Value_Group_Commands(commands.Cog):
             interaction=interaction,
             slash_cmd_name=slash_cmd_name,
             command_func=market_value_filter_func,
+            export_csv=export_csv,
         )
 
     market_value_filter.extras = {"category": "Staff"}
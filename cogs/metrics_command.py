@@ -0,0 +1,81 @@
+import discord
+from discord import app_commands
+from discord.ext import commands
+
+from utils.cache.cache_list import auction_cache, market_value_cache
+from utils.essentials.command_safe import run_command_safe
+from utils.essentials.role_checks import owner_only
+from utils.functions.webhook_dispatcher import WEBHOOK_DISPATCHER
+from utils.group_commands_func.debug import metrics_func
+from utils.logs.log_shipper import LOG_SHIPPER
+from utils.logs.metrics import METRICS, start_metrics_server, stop_metrics_server
+
+
+def _webhook_queue_depth() -> int:
+    queue = WEBHOOK_DISPATCHER._queue
+    return queue.qsize() if queue is not None else 0
+
+
+# 🎀────────────────────────────────────────────
+#           🌸 Metrics Cog Setup 🌸
+# ─────────────────────────────────────────────
+class Metrics_Command(commands.Cog):
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+
+    async def cog_load(self):
+        METRICS.register_gauge(
+            "auctions_cached", lambda: len(auction_cache), "Auctions in auction_cache"
+        )
+        METRICS.register_gauge(
+            "market_values_cached",
+            lambda: len(market_value_cache),
+            "Entries in market_value_cache",
+        )
+        METRICS.register_gauge(
+            "webhook_queue_depth",
+            _webhook_queue_depth,
+            "Webhook sends waiting for a worker",
+        )
+        METRICS.register_gauge(
+            "webhook_dropped",
+            lambda: WEBHOOK_DISPATCHER.dropped,
+            "Webhook sends dropped because the queue was full",
+        )
+        METRICS.register_gauge(
+            "log_shipper_pending",
+            lambda: len(LOG_SHIPPER.pending),
+            "Log entries waiting to be shipped",
+        )
+        # Prometheus text endpoint, only when METRICS_PORT is set
+        await start_metrics_server()
+
+    async def cog_unload(self):
+        await stop_metrics_server()
+
+    # 🎀────────────────────────────────────────────
+    #          🌸 /metrics 🌸
+    # 🎀────────────────────────────────────────────
+    @app_commands.command(
+        name="metrics", description="Live latency percentiles, counters and gauges"
+    )
+    @app_commands.describe(
+        name_filter="Only show metrics containing this text, e.g. auction bid",
+    )
+    @owner_only()
+    async def metrics(self, interaction: discord.Interaction, name_filter: str = None):
+        slash_cmd_name = "metrics"
+
+        await run_command_safe(
+            bot=self.bot,
+            interaction=interaction,
+            slash_cmd_name=slash_cmd_name,
+            command_func=metrics_func,
+            name_filter=name_filter,
+        )
+
+    metrics.extras = {"category": "Owner"}
+
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(Metrics_Command(bot))
@@ -15,6 +15,17 @@ MAX_SPEED_AUCTION_SECONDS = 1800
 MIN_REGULAR_AUCTION_SECONDS = 1800 # 30 mins
 MAX_REGULAR_AUCTION_SECONDS = 18000  # 5hrs
 
+# Last minute ping goes out this long before an auction ends
+LAST_MINUTE_PING_SECONDS = 600  # 10 mins
+
+# Soft close (anti-sniping): a bid in the last SOFT_CLOSE_WINDOW_SECONDS pushes the end
+# back so at least SOFT_CLOSE_EXTENSION_SECONDS are left, up to SOFT_CLOSE_MAX_EXTENSION_SECONDS
+# in total per auction. SOFT_CLOSE_MODE is "off", "speed" (speed auction channel only) or "all"
+SOFT_CLOSE_MODE = "speed"
+SOFT_CLOSE_WINDOW_SECONDS = 60
+SOFT_CLOSE_EXTENSION_SECONDS = 60
+SOFT_CLOSE_MAX_EXTENSION_SECONDS = 600  # 10 mins
+
 AUCTION_CATEGORY_LIST = [
     GRAND_LINE_AUCTION_CATEGORIES.BULK_AUCTION,
     GRAND_LINE_AUCTION_CATEGORIES.SHINY_AUCTION,
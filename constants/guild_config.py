@@ -0,0 +1,48 @@
+from .auction import AUCTION_CATEGORY_LIST
+from .grand_line_auction_constants import (
+    GLA_SERVER_ID,
+    GRAND_LINE_AUCTION_CATEGORIES,
+    GRAND_LINE_AUCTION_ROLES,
+    GRAND_LINE_AUCTION_TEXT_CHANNELS,
+)
+
+# Keys of the guild_config table, every key holds a set of ids
+AUCTION_BROADCAST_CHANNEL = "auction_broadcast_channel"
+AUCTION_LOG_CHANNEL = "auction_log_channel"
+SERVER_LOG_CHANNEL = "server_log_channel"
+TEST_AUCTION_CHANNEL = "test_auction_channel"
+BOOSTER_AUCTION_CHANNEL = "booster_auction_channel"
+SPEED_AUCTION_CHANNEL = "speed_auction_channel"
+AUCTION_CATEGORIES = "auction_categories"
+STAFF_CATEGORIES = "staff_categories"  # auctions are allowed in any channel of these
+AUCTIONEER_ROLES = "auctioneer_roles"
+STAFF_ROLES = "staff_roles"
+BOOSTER_ROLES = "booster_roles"
+LAST_MINUTE_PING_ROLES = "last_minute_ping_roles"
+
+# Guild the background tasks run for
+HOME_GUILD_ID = GLA_SERVER_ID
+
+# Used until (or for keys missing from) the guild_config table
+GUILD_CONFIG_DEFAULTS: dict[int, dict[str, tuple[int, ...]]] = {
+    GLA_SERVER_ID: {
+        AUCTION_BROADCAST_CHANNEL: (GRAND_LINE_AUCTION_TEXT_CHANNELS.auction_broadcast,),
+        AUCTION_LOG_CHANNEL: (GRAND_LINE_AUCTION_TEXT_CHANNELS.auction_log,),
+        SERVER_LOG_CHANNEL: (GRAND_LINE_AUCTION_TEXT_CHANNELS.server_logs,),
+        TEST_AUCTION_CHANNEL: (GRAND_LINE_AUCTION_TEXT_CHANNELS.test_auction,),
+        BOOSTER_AUCTION_CHANNEL: (GRAND_LINE_AUCTION_TEXT_CHANNELS.booster_auction,),
+        SPEED_AUCTION_CHANNEL: (GRAND_LINE_AUCTION_TEXT_CHANNELS.speed_auction,),
+        AUCTION_CATEGORIES: tuple(AUCTION_CATEGORY_LIST),
+        STAFF_CATEGORIES: (
+            GRAND_LINE_AUCTION_CATEGORIES.STAFF,
+            GRAND_LINE_AUCTION_CATEGORIES.PRIV_CHANNELS,
+        ),
+        AUCTIONEER_ROLES: (GRAND_LINE_AUCTION_ROLES.auctioneer,),
+        STAFF_ROLES: (
+            GRAND_LINE_AUCTION_ROLES.auctioneer,
+            GRAND_LINE_AUCTION_ROLES.moderator,
+        ),
+        BOOSTER_ROLES: (GRAND_LINE_AUCTION_ROLES.server_booster,),
+        LAST_MINUTE_PING_ROLES: (GRAND_LINE_AUCTION_ROLES.last_min,),
+    },
+}
@@ -153,70 +153,47 @@ rarity_meta = {
 }
 
 
-def get_rarity_by_color(color_value):
-    """
-    🎨 Reverse lookup: Get rarity name from color value
-
-    Args:
-        color_value (int): The color value to look up
-
-    Returns:
-        str: The rarity name, or "unknown" if not found
-
-    Example:
-        >>> get_rarity_by_color(810198)
-        'common'
-        >>> get_rarity_by_color(16550924)
-        'rare'
-    """
-    # Try direct match first
-    for rarity_name, rarity_data in rarity_meta.items():
-        if rarity_data.get("color") == color_value:
-            return rarity_name
-
-    # Try converting between hex and decimal
-    # If input is int, try hex string
+def _color_to_int(color_value) -> int | None:
+    """Accepts an int, a discord.Colour or a hex string ("0xff99cc", "#FF99CC", "ff99cc")"""
     if isinstance(color_value, int):
-        hex_str = hex(color_value)
+        return color_value
+    value = getattr(color_value, "value", None)
+    if isinstance(value, int):
+        return value
+    if isinstance(color_value, str):
         try:
-            hex_int = int(hex_str, 16)
-            for rarity_name, rarity_data in rarity_meta.items():
-                if rarity_data.get("color") == hex_int:
-                    return rarity_name
-        except Exception:
-            pass
-    # If input is str (hex), try converting to int
-    elif isinstance(color_value, str):
-        try:
-            dec_int = int(color_value, 16)
-            for rarity_name, rarity_data in rarity_meta.items():
-                if rarity_data.get("color") == dec_int:
-                    return rarity_name
-        except Exception:
-            pass
-    return "unknown"
+            return int(color_value.strip().lstrip("#"), 16)
+        except ValueError:
+            return None
+    return None
 
 
-def old_get_rarity_by_color(color_value):
+# 🎨 Reverse index built once: color int -> rarity name
+RARITY_BY_COLOR: dict[int, str] = {
+    _color_to_int(data["color"]): rarity_name for rarity_name, data in rarity_meta.items()
+}
+
+
+def get_rarity_by_color(color_value):
     """
     🎨 Reverse lookup: Get rarity name from color value
 
     Args:
-        color_value (int): The color value to look up
+        color_value (int | str | discord.Colour): The color value to look up
 
     Returns:
         str: The rarity name, or "unknown" if not found
 
     Example:
-        >>> get_rarity_by_color(810198)
+        >>> get_rarity_by_color(0x0855FB)
         'common'
-        >>> get_rarity_by_color(16550924)
+        >>> get_rarity_by_color("0xFB8908")
         'rare'
     """
-    for rarity_name, rarity_data in rarity_meta.items():
-        if rarity_data["color"] == color_value:
-            return rarity_name
-    return "unknown"
+    rarity = RARITY_BY_COLOR.get(color_value) if type(color_value) is int else None
+    if rarity is None:
+        rarity = RARITY_BY_COLOR.get(_color_to_int(color_value), "unknown")
+    return rarity
 
 
 paldean_mons = [
@@ -1551,83 +1528,13 @@ dex = {
     999: "Gimmighoul",
 }
 
-from typing import Optional
-
-from constants.pokemons import golden_mons, shiny_mons
 
-
-def old_get_dex_number_by_name(name: str) -> Optional[int]:
-    """
-    Returns the dex number for a given Pokémon name.
-    Example: get_dex_number_by_name("Flutter-mane") -> 987
-    Returns None if not found.
-    """
-    name = name.strip()
-    # Check golden/shiny first for priority
-    if name.lower() in golden_mons:
-        return golden_mons[name]
-    if name.lower() in shiny_mons:
-        return shiny_mons[name]
-    for dex_num, poke_name in dex.items():
-        if poke_name == name:
-            return dex_num
-    return None
-
-
-from constants.weakness_chart import weakness_chart as WEAKNESS_CHART
-from utils.logs.pretty_log import pretty_log
-
-
-def old_old_get_dex_number_by_name(name: str) -> Optional[int]:
+def get_dex_number_by_name(pokemon_name: str) -> str:
     """
-    Returns the dex number for a given Pokémon name.
-    Example: get_dex_number_by_name("Flutter-mane") -> 987
-    Returns None if not found.
+    Get the Pokédex number for a given Pokémon name as a string, "N/A" when unknown.
+    Misses are counted in the dex_lookup_misses_total metric.
     """
-    normalized = name.strip().lower()
-
-    # 🌟 Golden / shiny priority
-    if normalized in golden_mons:
-        return golden_mons[normalized]["dex"]
-
-    if normalized in shiny_mons:
-        return shiny_mons[normalized]["dex"]
-
-    # 📘 Normal dex lookup
-    for dex_num, poke_name in dex.items():
-        if poke_name.lower() == normalized:
-            return dex_num
-
-    return None
-
-
-from utils.logs.debug_log import debug_log, enable_debug
-
-
-# enable_debug(f"{__name__}.format_timestamp")
-def get_dex_number_by_name(pokemon_name: str) -> str:
-    """Get the Pokédex number for a given Pokémon name."""
-    debug_log(f"Fetching Dex number for Pokémon '{pokemon_name}'.")
-    pokemon_name = pokemon_name.lower().replace("♀", "-f").replace("♂", "-m")
-    if "shiny mega " in pokemon_name:
-        pokemon_name = pokemon_name.replace("shiny mega ", "shiny mega-")
-    if "mega " in pokemon_name:
-        pokemon_name = pokemon_name.replace("mega ", "mega-")
-    if "shiny gigantamax " in pokemon_name:
-        pokemon_name = pokemon_name.replace("shiny gigantamax ", "shiny gigantamax-")
-    if "gigantamax " in pokemon_name:
-        pokemon_name = pokemon_name.replace("gigantamax ", "gigantamax-")
-
-    debug_log(f"Normalized Pokémon name: '{pokemon_name}'.")
-    if pokemon_name not in WEAKNESS_CHART:
-        pretty_log("info", f"Pokémon '{pokemon_name}' not found in the weakness chart.")
-        return "N/A"
-    dex_number = WEAKNESS_CHART.get(pokemon_name, {}).get("dex")
-    if dex_number is None:
-        debug_log(f"Dex number for Pokémon '{pokemon_name}' is not available.")
-        return None
+    from utils.essentials.dex_service import get_dex_number
 
-    # Remove leading zeros, but ensure '0' is returned if dex_number is all zeros
-    dex_number = dex_number.lstrip("0") or "0"
-    debug_log(f"Found Dex number {dex_number} for Pokémon '{pokemon_name}'.")
-    return dex_number
+    dex_number = get_dex_number(pokemon_name)
+    return "N/A" if dex_number is None else str(dex_number)
@@ -12,7 +12,7 @@ from utils.essentials.minimum_increment import (
     compute_minimum_increment,
     format_names_for_market_value_lookup,
 )
-from utils.logs.debug_log import debug_log, enable_debug
+from utils.logs.debug_log import debug_log, enable_debug, get_debug_logger
 
 from .pokemons import *
 
@@ -141,6 +141,15 @@ RARITY_MAP = {
 }
 
 
+# Lowercased name sets so rarity/exclusive lookups are O(1)
+_LEGENDARY_NAMES = frozenset(mon.lower() for mon in legendary_mons)
+_SUPERRARE_NAMES = frozenset(mon.lower() for mon in superrare_mons)
+_RARE_NAMES = frozenset(mon.lower() for mon in rare_mons)
+_UNCOMMON_NAMES = frozenset(mon.lower() for mon in uncommon_mons)
+_COMMON_NAMES = frozenset(mon.lower() for mon in common_mons)
+_EXCLUSIVE_NAMES = frozenset(mon.lower() for mon in exclusive_mons)
+
+
 def get_rarity(pokemon: str):
     """Determines the rarity of a given Pokemon based on the name"""
 
@@ -159,15 +168,15 @@ def get_rarity(pokemon: str):
         return "mega"
 
     # Fallback to the list (case-insensitive)
-    elif name in (mon.lower() for mon in legendary_mons):
+    elif name in _LEGENDARY_NAMES:
         return "legendary"
-    elif name in (mon.lower() for mon in superrare_mons):
+    elif name in _SUPERRARE_NAMES:
         return "superrare"
-    elif name in (mon.lower() for mon in rare_mons):
+    elif name in _RARE_NAMES:
         return "rare"
-    elif name in (mon.lower() for mon in uncommon_mons):
+    elif name in _UNCOMMON_NAMES:
         return "uncommon"
-    elif name in (mon.lower() for mon in common_mons):
+    elif name in _COMMON_NAMES:
         return "common"
     else:
         return None
@@ -194,70 +203,71 @@ exclusive_mons_list = list(exclusive_mons.keys())
 
 
 # enable_debug(f"{__name__}.is_mon_exclusive")
+exclusive_log = get_debug_logger(__name__, "is_mon_exclusive")
+
+
 def is_mon_exclusive(pokemon: str) -> bool:
     """
     Checks if a given Pokémon is exclusive based on the exclusive_mons list or the market value cache.
     """
-    debug_log(f"Checking exclusivity for: {pokemon}")
+    exclusive_log("Checking exclusivity for: {}", pokemon)
     name = pokemon.lower()
-    if any(name == mon.lower() for mon in exclusive_mons_list):
-        debug_log(f"{pokemon} is exclusive based on the exclusive_mons list.")
+    if name in _EXCLUSIVE_NAMES:
+        exclusive_log("{} is exclusive based on the exclusive_mons list.", pokemon)
         return True
     # Check cache for exclusivity, if it's exclusive then it's not auctionable
     pokemon = format_names_for_market_value_lookup(pokemon)
     if is_pokemon_exclusive_cache(pokemon):
-        debug_log(f"{pokemon} is exclusive based on the market value cache.")
+        exclusive_log("{} is exclusive based on the market value cache.", pokemon)
         return True
     else:
-        debug_log(f"{pokemon} is not exclusive based on the market value cache.")
+        exclusive_log("{} is not exclusive based on the market value cache.", pokemon)
         return False
 
 
 enable_debug(f"{__name__}.is_mon_auctionable")
 
 
-def is_mon_auctionable(pokemon: str) -> bool:
-    """
-    Checks if a given Pokémon is auctionable based on whether it has been released in the game.
-    Gigantamax and Mega Pokémon are always auctionable except golden variants.
-    Golden and Shiny variants are auctionable only if present in their respective lists.
-    """
-    name = pokemon.lower()
-    debug_log(f"Checking if '{pokemon}' is auctionable.")
+_GOLDEN_NAMES = frozenset(mon.lower() for mon in golden_mons)
+_SHINY_OR_EXCLUSIVE_NAMES = frozenset(mon.lower() for mon in shiny_mons) | _EXCLUSIVE_NAMES
+_AUCTIONABLE_NAMES = frozenset(mon.lower() for mon in auctionable_mons_list)
 
+
+def _is_auctionable_name(name: str) -> bool:
+    """is_mon_auctionable without the debug logs, name must be lowercase"""
     # Gigantamax and Mega Pokémon are always auctionable except golden variants
     if ("gigantamax" in name or "mega" in name) and "golden" not in name:
-        debug_log(f"'{pokemon}' is Gigantamax or Mega (not golden): auctionable.")
         return True
-
     # Golden variant: check golden_mons list
     if "golden" in name:
-        result = any(name == mon.lower() for mon in golden_mons)
-        debug_log(f"'{pokemon}' is golden. Auctionable: {result}")
-        return result
-
-    # Shiny variant: check shiny_mons list
+        return name in _GOLDEN_NAMES
+    # Shiny variant: check shiny_mons list, then the exclusives
     if "shiny" in name:
-        result = any(name == mon.lower() for mon in shiny_mons)
-        debug_log(f"'{pokemon}' is shiny. Auctionable: {result}")
-        if not result:
-            # Check exclusives list
-            result = any(name == mon.lower() for mon in exclusive_mons)
-            debug_log(
-                f"'{pokemon}' is shiny but not in shiny list. Checking exclusives. Auctionable: {result}"
-            )
+        return name in _SHINY_OR_EXCLUSIVE_NAMES
+    # Fallback: general auctionable list, then a market value in the cache
+    if name in _AUCTIONABLE_NAMES:
+        return True
+    return fetch_market_value_cache(format_names_for_market_value_lookup(name)) is not None
 
-        return result
 
-    # Fallback: check general auctionable list
-    if any(name == mon.lower() for mon in auctionable_mons_list):
-        debug_log(f"'{pokemon}' found in general auctionable list.")
-        return True
-    # Check cache for market value, if it exists then it's auctionable
-    pokemon_lookup = format_names_for_market_value_lookup(pokemon)
-    market_value = fetch_market_value_cache(pokemon_lookup)
-    if market_value is not None:
-        debug_log(f"'{pokemon}' has market value ({market_value}): auctionable.")
-        return True
-    debug_log(f"'{pokemon}' is not auctionable.")
-    return False
+def is_mon_auctionable(pokemon: str) -> bool:
+    """
+    Checks if a given Pokémon is auctionable based on whether it has been released in the game.
+    Gigantamax and Mega Pokémon are always auctionable except golden variants.
+    Golden and Shiny variants are auctionable only if present in their respective lists.
+    """
+    result = _is_auctionable_name(pokemon.lower())
+    debug_log(f"'{pokemon}' auctionable: {result}")
+    return result
+
+
+def resolve_auctionable_rarities(names) -> dict[str, str | None]:
+    """
+    Batch lookup for lowercase names: rarity of every auctionable name, None when it isn't
+    auctionable. Each distinct name is resolved once.
+    """
+    resolved = {}
+    for name in names:
+        if name not in resolved:
+            resolved[name] = get_rarity(name) if _is_auctionable_name(name) else None
+    return resolved
@@ -6,6 +6,7 @@ import glob
 import logging
 import os
 import random
+import signal
 from datetime import datetime
 from zoneinfo import ZoneInfo
 
@@ -14,8 +15,16 @@ from discord import app_commands
 from discord.ext import commands, tasks
 from dotenv import load_dotenv
 
+from utils.cache.cache_snapshot import (
+    load_cache_snapshot,
+    reconcile_cache_snapshot,
+    save_cache_snapshot,
+    snapshot_reconcile_pending,
+)
 from utils.cache.central_cache_loader import load_all_cache
 from utils.db.get_pg_pool import *
+from utils.essentials.help_catalog import rebuild_help_catalog
+from utils.essentials.lifecycle import LIFECYCLE
 from utils.logs.pretty_log import pretty_log, set_jiggly_bot
 #
 # ❀───────────────────────────────❀
@@ -41,7 +50,14 @@ intents.guilds = True
 intents.message_content = True
 intents.members = True
 
-bot = commands.Bot(command_prefix="!", intents=intents)
+
+class JigglyCommandTree(app_commands.CommandTree):
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        # ❀ No new commands once shutdown started ❀
+        return await LIFECYCLE.admit(interaction)
+
+
+bot = commands.Bot(command_prefix="!", intents=intents, tree_cls=JigglyCommandTree)
 set_jiggly_bot(bot)
 
 # ❀───────────────────────────────❀
@@ -51,9 +67,9 @@ set_jiggly_bot(bot)
 
 @bot.tree.error
 async def on_app_command_error(interaction, error):
-    from utils.essentials.role_checks import AuctioneerCheckFailure
+    from utils.essentials.role_checks import AuctioneerCheckFailure, OwnerCheckFailure
 
-    if isinstance(error, AuctioneerCheckFailure):
+    if isinstance(error, (AuctioneerCheckFailure, OwnerCheckFailure)):
         await interaction.response.send_message(str(error), ephemeral=True)
     elif isinstance(error, app_commands.CheckFailure):
         await interaction.response.send_message(
@@ -75,7 +91,14 @@ async def on_app_command_error(interaction, error):
 async def refresh_all_caches():
 
     # Removed first-run skip logic so cache loads immediately
-    await load_all_cache(bot)
+    if snapshot_reconcile_pending():
+        # Warm start: only what changed since the snapshot
+        await reconcile_cache_snapshot(bot)
+    else:
+        await load_all_cache(bot)
+
+    # ❀ Keep the warm start snapshot fresh ❀
+    await save_cache_snapshot()
 
 
 # ❀───────────────────────────────❀
@@ -134,8 +157,14 @@ async def on_ready():
     total_commands = len(bot.tree.get_commands())
     pretty_log("ready", f"Synced {total_commands} slash commands.")
 
-    # Load all caches immediately on startup
-    await load_all_cache(bot)
+    # ❀ Pre-render the /commands help pages ❀
+    help_count = rebuild_help_catalog(bot)
+    pretty_log("ready", f"Help catalog built with {help_count} commands.")
+
+    # Load all caches immediately on startup, unless the snapshot already serves them
+    # (the first refresh tick reconciles it with the DB in the background)
+    if not snapshot_reconcile_pending():
+        await load_all_cache(bot)
 
     # Start the cache refresh task if it's not already running
     if not refresh_all_caches.is_running():
@@ -161,6 +190,9 @@ async def setup_hook():
     except Exception as e:
         pretty_log("critical", f"Postgres connection failed: {e}", include_trace=True)
 
+    # ❀ Warm start: serve the caches from the last snapshot until the DB answers ❀
+    load_cache_snapshot()
+
     # ❀ Load all cogs, skip __init__.py ❀
     for cog_path in glob.glob("cogs/**/*.py", recursive=True):
         if os.path.basename(cog_path) == "__init__.py":
@@ -181,20 +213,34 @@ async def main():
     load_dotenv()
     pretty_log("ready", "Jigglypuff Bot is starting...")
 
-    retry_delay = 5
-    while True:
+    # ❀ SIGTERM (deploys, restarts) drains instead of dropping work ❀
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
         try:
-            await bot.start(os.getenv("DISCORD_TOKEN"))
-        except KeyboardInterrupt:
-            pretty_log("ready", "Shutting down Jigglypuff Bot...")
-            break
-        except Exception as e:
-            pretty_log("error", f"Bot crashed: {e}", include_trace=True)
-            pretty_log(
-                "ready", f"Restarting Jigglypuff Bot in {retry_delay} seconds..."
-            )
-            await asyncio.sleep(retry_delay)
-            retry_delay = min(retry_delay * 2, 60)
+            loop.add_signal_handler(sig, LIFECYCLE.request_shutdown, bot)
+        except (NotImplementedError, RuntimeError):
+            pass  # Windows, Ctrl+C still ends up in the finally below
+
+    retry_delay = 5
+    try:
+        while LIFECYCLE.accepting:
+            try:
+                await bot.start(os.getenv("DISCORD_TOKEN"))
+            except KeyboardInterrupt:
+                pretty_log("ready", "Shutting down Jigglypuff Bot...")
+                break
+            except Exception as e:
+                if not LIFECYCLE.accepting:
+                    break
+                pretty_log("error", f"Bot crashed: {e}", include_trace=True)
+                pretty_log(
+                    "ready", f"Restarting Jigglypuff Bot in {retry_delay} seconds..."
+                )
+                await asyncio.sleep(retry_delay)
+                retry_delay = min(retry_delay * 2, 60)
+    finally:
+        # ❀ Drain in-flight work, snapshot the caches and close connections ❀
+        await LIFECYCLE.request_shutdown(bot)
 
 
 # ❀───────────────────────────────❀
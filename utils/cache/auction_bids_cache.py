@@ -0,0 +1,81 @@
+# 🍩────────────────────────────────────────────
+#     💤 Auction Bid Stack (per channel ledger)
+# 🍩────────────────────────────────────────────
+import discord
+
+from utils.cache.cache_list import BidRecord, auction_bid_stack, auction_cache
+from utils.logs.pretty_log import pretty_log
+
+
+def push_bid(channel_id: int, record: BidRecord):
+    auction_bid_stack.setdefault(channel_id, []).append(record)
+
+
+def pop_bid(channel_id: int) -> BidRecord | None:
+    """Removes the current highest bid, O(1)."""
+    stack = auction_bid_stack.get(channel_id)
+    if not stack:
+        return None
+    return stack.pop()
+
+
+def peek_bid(channel_id: int, depth: int = 0) -> BidRecord | None:
+    """depth 0 = current highest bid, 1 = the bid it replaced, ..."""
+    stack = auction_bid_stack.get(channel_id)
+    if not stack or depth >= len(stack):
+        return None
+    return stack[-1 - depth]
+
+
+def get_bid_history(channel_id: int, limit: int | None = None) -> list[BidRecord]:
+    """Bids of the running auction, newest first."""
+    stack = auction_bid_stack.get(channel_id, [])
+    history = stack[::-1]
+    return history[:limit] if limit else history
+
+
+def clear_bid_stack(channel_id: int):
+    auction_bid_stack.pop(channel_id, None)
+
+
+def replay_bid_rows(rows) -> dict[int, list[BidRecord]]:
+    """
+    Rebuilds stacks from auction_bids rows ordered by id.
+    "undo" pops, "close" (auction ended) clears, anything else is pushed.
+    """
+    stacks: dict[int, list[BidRecord]] = {}
+    for row in rows:
+        channel_id = row["channel_id"]
+        kind = row["kind"]
+        stack = stacks.setdefault(channel_id, [])
+        if kind == "close":
+            stack.clear()
+        elif kind == "undo":
+            if stack:
+                stack.pop()
+        else:
+            stack.append(
+                BidRecord(
+                    bidder_id=row["bidder_id"],
+                    bidder_name=row["bidder_name"],
+                    amount=row["amount"],
+                    placed_at=row["placed_at"],
+                    kind=kind,
+                )
+            )
+    return stacks
+
+
+async def load_auction_bid_cache(bot: discord.Client):
+    """Loads the bid stacks of every auction in auction_cache, call after load_auction_cache."""
+    from utils.db.auction_bids_db import fetch_open_bids
+
+    try:
+        rows = await fetch_open_bids(bot, list(auction_cache))
+        stacks = replay_bid_rows(rows)
+        auction_bid_stack.clear()
+        for channel_id, stack in stacks.items():
+            if stack and channel_id in auction_cache:
+                auction_bid_stack[channel_id] = stack
+    except Exception as e:
+        pretty_log("error", f"Error loading auction bid cache: {e}", include_trace=True)
@@ -1,9 +1,19 @@
 import discord
 
-from constants.grand_line_auction_constants import GRAND_LINE_AUCTION_ROLES
-from utils.cache.cache_list import auction_cache
+from utils.cache.cache_list import (
+    auction_bid_stack,
+    auction_cache,
+    auction_proxy_cache,
+    pending_ends_on_writes,
+    soft_close_extended,
+)
 from utils.db.auction_db import fetch_all_auctions
+from utils.essentials.role_checks import is_booster, member_role_ids
 from utils.logs.pretty_log import pretty_log
+from utils.schedule.auction_schedule import (
+    arm_last_minute_ping,
+    rebuild_last_minute_ping_schedule,
+)
 
 # SQL SCRIPT
 """CREATE TABLE auctions (
@@ -48,7 +58,9 @@ async def load_auction_cache(bot: discord.Client):
                 "minimum_increment": auction["minimum_increment"],
                 "last_minute_pinged": auction.get("last_minute_pinged", False),
                 "is_bulk": auction.get("is_bulk", False),
+                "state": auction.get("state") or "active",
             }
+        rebuild_last_minute_ping_schedule()
         # pretty_log("cache", f"Auction cache loaded with {len(auction_cache)} auctions")
 
     except Exception as e:
@@ -75,7 +87,7 @@ def if_user_has_ongoing_auction_cache(user: discord.Member) -> bool:
     If server booster role they are allowed to have 2 ongoing auctions"""
     ongoing_auctions_count = 0
     max_auctions_allowed = 1
-    if GRAND_LINE_AUCTION_ROLES.server_booster in [role.id for role in user.roles]:
+    if is_booster(member_role_ids(user)):
         max_auctions_allowed = 2
     for auction in auction_cache.values():
         if auction["host_id"] == user.id:
@@ -123,26 +135,12 @@ def upsert_auction_cache(
             "last_minute_pinged": last_minute_pinged,
             "is_bulk": is_bulk,
         }
-
-        def update_last_minute_pinged_cache(channel_id: int, last_minute_pinged: bool):
-            try:
-                if channel_id in auction_cache:
-                    auction_cache[channel_id]["last_minute_pinged"] = last_minute_pinged
-                    pretty_log(
-                        "cache",
-                        f"Auction cache last_minute_pinged updated for channel_id {channel_id} (New Value: {last_minute_pinged})",
-                    )
-                else:
-                    pretty_log(
-                        "warning",
-                        f"Tried to update auction cache last_minute_pinged for channel_id {channel_id} but it was not found.",
-                    )
-            except Exception as e:
-                pretty_log(
-                    "error",
-                    f"Error updating auction cache last_minute_pinged: {e}",
-                    include_trace=True,
-                )
+        # New auction in this channel, start an empty bid stack, max bids and soft close tally
+        auction_bid_stack.pop(channel_id, None)
+        auction_proxy_cache.pop(channel_id, None)
+        pending_ends_on_writes.pop(channel_id, None)
+        soft_close_extended.pop(channel_id, None)
+        arm_last_minute_ping(channel_id, ends_on)
 
         pretty_log(
             "cache",
@@ -230,6 +228,7 @@ def update_auction_ends_on_cache(channel_id: int, ends_on: int):
     try:
         if channel_id in auction_cache:
             auction_cache[channel_id]["ends_on"] = ends_on
+            arm_last_minute_ping(channel_id, ends_on)
             pretty_log(
                 "cache",
                 f"Auction cache end time updated for channel_id {channel_id} (New Ends On: {ends_on})",
@@ -247,6 +246,10 @@ def update_auction_ends_on_cache(channel_id: int, ends_on: int):
 
 
 def delete_auction_cache(channel_id: int):
+    auction_bid_stack.pop(channel_id, None)
+    auction_proxy_cache.pop(channel_id, None)
+    pending_ends_on_writes.pop(channel_id, None)
+    soft_close_extended.pop(channel_id, None)
     if channel_id in auction_cache:
         del auction_cache[channel_id]
         pretty_log("cache", f"Auction cache deleted for channel_id {channel_id}")
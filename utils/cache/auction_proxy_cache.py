@@ -0,0 +1,61 @@
+# 🍩────────────────────────────────────────────
+#     💤 Auction Proxy Bids (max bid per bidder)
+# 🍩────────────────────────────────────────────
+import discord
+
+from utils.cache.cache_list import ProxyBid, auction_cache, auction_proxy_cache
+from utils.logs.pretty_log import pretty_log
+
+
+def get_proxy_bids(channel_id: int) -> dict[int, ProxyBid]:
+    return auction_proxy_cache.get(channel_id, {})
+
+
+def get_proxy_bid(channel_id: int, bidder_id: int) -> ProxyBid | None:
+    return auction_proxy_cache.get(channel_id, {}).get(bidder_id)
+
+
+def set_proxy_bid(
+    channel_id: int, bidder_id: int, bidder_name: str, ceiling: int, placed_at: int
+):
+    auction_proxy_cache.setdefault(channel_id, {})[bidder_id] = ProxyBid(
+        bidder_name=bidder_name,
+        ceiling=ceiling,
+        placed_at=placed_at,
+    )
+
+
+def remove_proxy_bid(channel_id: int, bidder_id: int):
+    auction_proxy_cache.get(channel_id, {}).pop(bidder_id, None)
+
+
+async def load_proxy_bid_cache(bot: discord.Client):
+    """Loads and decrypts the max bids of every auction in auction_cache, call after load_auction_cache."""
+    from utils.db.auction_proxy_db import (
+        decrypt_ceiling,
+        fetch_proxy_bids,
+        proxy_bidding_enabled,
+    )
+
+    if not proxy_bidding_enabled():
+        return
+    try:
+        rows = await fetch_proxy_bids(bot, list(auction_cache))
+        proxies: dict[int, dict[int, ProxyBid]] = {}
+        for row in rows:
+            ceiling = decrypt_ceiling(row["ceiling_enc"])
+            if ceiling is None:
+                pretty_log(
+                    "warn",
+                    f"Skipped proxy bid of {row['bidder_name']} in channel_id {row['channel_id']}, could not decrypt it",
+                )
+                continue
+            proxies.setdefault(row["channel_id"], {})[row["bidder_id"]] = ProxyBid(
+                bidder_name=row["bidder_name"],
+                ceiling=ceiling,
+                placed_at=row["placed_at"],
+            )
+        auction_proxy_cache.clear()
+        auction_proxy_cache.update(proxies)
+    except Exception as e:
+        pretty_log("error", f"Error loading proxy bid cache: {e}", include_trace=True)
@@ -1,3 +1,5 @@
+from typing import TypedDict
+
 ongoing_bidding = set()  # Set of channel_ids that have ongoing bidding
 processing_auction_end = (
     set()
@@ -29,23 +31,132 @@ auction_cache: dict[int, dict] = {}
 #         "minimum_increment": int,
 #         "last_minute_pinged": bool,
 #         "is_bulk": bool,
+#         "state": str,  # active, ending, announced (utils/essentials/auction_state.py)
 #     },
 #     ...
 # }
 market_value_cache: dict[str, dict] = {}
 
-webhook_url_cache: dict[tuple[int, int], dict[str, str]] = {}
-#     ...
-#
+
+# 🍩────────────────────────────────────────────
+#        💤 Auction Bid Stack
+# 🍩────────────────────────────────────────────
+class BidRecord(TypedDict):
+    bidder_id: int
+    bidder_name: str
+    amount: int
+    placed_at: int  # unix timestamp
+    kind: str  # "bid", "autobuy", "roll_back" or "proxy"
+
+
+auction_bid_stack: dict[int, list[BidRecord]] = {}
+# Bids of the running auction per channel, oldest first, top = current highest bid
+# (see utils/cache/auction_bids_cache.py, persisted in the auction_bids table)
+# Structure:
+# auction_bid_stack = {
+#     channel_id: [
+#         {"bidder_id": 123, "bidder_name": "khy", "amount": 1_000_000, "placed_at": 1700000000, "kind": "bid"},
+#     ],
+# }
+
+# 🍩────────────────────────────────────────────
+#        💤 Proxy Bid Cache
+# 🍩────────────────────────────────────────────
+class ProxyBid(TypedDict):
+    bidder_name: str
+    ceiling: int  # max bid, stored encrypted in the auction_proxy_bids table
+    placed_at: int  # unix timestamp, earlier ceiling wins a tie
+
+
+auction_proxy_cache: dict[int, dict[int, ProxyBid]] = {}
+# Max bids of the running auctions (see utils/cache/auction_proxy_cache.py)
+# Structure:
+# auction_proxy_cache = {
+#     channel_id: {
+#         bidder_id: {"bidder_name": "khy", "ceiling": 5_000_000, "placed_at": 1700000000},
+#     },
+# }
+
+# 🍩────────────────────────────────────────────
+#        💤 Auction Deadline Schedule
+# 🍩────────────────────────────────────────────
+pending_ends_on_writes: dict[int, int] = {}
+# Soft close extensions already applied to auction_cache, waiting for the next
+# coalesced DB write (see utils/schedule/auction_schedule.py)
+# Structure: {channel_id: ends_on}
+soft_close_extended: dict[int, int] = {}
+# Seconds added by soft close so far per running auction
+# Structure: {channel_id: seconds}
+last_minute_ping_heap: list[tuple[int, int]] = []
+# Min-heap of (ping_at, channel_id), ping_at = ends_on - LAST_MINUTE_PING_SECONDS.
+# Entries are checked against auction_cache when they fire, so stale ones are just skipped
+
+# 🍩────────────────────────────────────────────
+#        💤 Missing Market Value Cache
+# 🍩────────────────────────────────────────────
+missing_market_value_cache: dict[str, dict] = {}
+# In-game mons without a market value (see utils/cache/market_value_coverage.py)
+# Structure:
+# missing_market_value_cache = {
+#     "lookup_name": {
+#         "display": "Golden Pikachu #25",
+#         "name": "Golden Pikachu",
+#         "dex": "25",
+#         "rarity": "golden",
+#         "is_priority": True,
+#     },
 # }
+
+# 🍩────────────────────────────────────────────
+#        💤 Auction Rule Cache
+# 🍩────────────────────────────────────────────
+auction_rule_cache: dict[str, tuple] = {}
+# Pre-evaluated AuctionRule per Pokémon (see utils/essentials/auction_rules.py)
+# Structure:
+# auction_rule_cache = {
+#     "pokemon_name": AuctionRule(rarity, market_value, min_increment, max_duration_seconds, error),
+# }
+
+# 🍩────────────────────────────────────────────
+#        💤 Channel Route Cache
+# 🍩────────────────────────────────────────────
+channel_route_cache: dict[tuple[str, bool, bool, bool], tuple] = {}
+# Allowed auction categories per listing type (see utils/essentials/channel_routing.py)
+# Structure:
+# channel_route_cache = {
+#     (rarity, is_exclusive, is_bulk, is_speed): ChannelRoute(allow_any, category_ids, suggestion),
+# }
+
+# 🍩────────────────────────────────────────────
+#        💤 Guild Config Cache
+# 🍩────────────────────────────────────────────
+guild_config_cache: dict[int, tuple] = {}
+# Immutable config snapshot per guild (see utils/cache/guild_config_cache.py),
+# a reload swaps the whole snapshot
+# Structure:
+# guild_config_cache = {
+#     guild_id: GuildConfig(guild_id, values={key: frozenset(ids)}, version),
+# }
+
+
+# 🍩────────────────────────────────────────────
+#        💤 Webhook Url Cache
+# 🍩────────────────────────────────────────────
+class WebhookRecord(TypedDict):
+    url: str
+    channel_name: str
+
+
+webhook_url_cache: dict[tuple[int, int], WebhookRecord] = {}
 # key = (bot_id, channel_id)
 # Structure:
 # webhook_url_cache = {
-# (bot_id, channel_id): {
-#     "url": "https://discord.com/api/webhooks/..."
-#     "channel_name": "alerts-channel",
-# },
-#
+#     (bot_id, channel_id): {
+#         "url": "https://discord.com/api/webhooks/...",
+#         "channel_name": "alerts-channel",
+#     },
+# }
+
 # 🍩────────────────────────────────────────────
 #        💤 Pokemon List Cache
 # 🍩────────────────────────────────────────────
@@ -54,3 +165,13 @@ pokemon_list_cache: dict[str, int] = {}
 # pokemon_list_cache = {
 #     "pokemon_name": "dex_number",
 #     }
+
+# 🍩────────────────────────────────────────────
+#        💤 Help Catalog Cache
+# 🍩────────────────────────────────────────────
+help_catalog_cache: dict[str, tuple] = {}
+# Pre-rendered /commands pages per permission tier (see utils/essentials/help_catalog.py)
+# Structure:
+# help_catalog_cache = {
+#     "public" | "staff": HelpTier(fingerprint, home, category_lines, pages={category: [Embed]}),
+# }
@@ -0,0 +1,262 @@
+# 🍩────────────────────────────────────────────
+#     💤 Cache Snapshot (warm start from disk)
+# 🍩────────────────────────────────────────────
+import asyncio
+import json
+import os
+import struct
+import tempfile
+import time
+import zlib
+from datetime import datetime, timezone
+from typing import NamedTuple
+
+from utils.cache.cache_list import (
+    WebhookRecord,
+    auction_bid_stack,
+    auction_cache,
+    market_value_cache,
+    webhook_url_cache,
+)
+from utils.essentials.env import get_env
+from utils.logs.metrics import METRICS
+from utils.logs.pretty_log import pretty_log
+
+# File layout: header + zlib compressed JSON payload
+#   magic (4s) | version (H) | watermark (d) | written_at (d) | payload size (I) | crc32 (I)
+SNAPSHOT_MAGIC = b"JGLP"
+SNAPSHOT_VERSION = 1  # Bump when the payload shape changes, old files are then ignored
+SNAPSHOT_HEADER = struct.Struct("<4sHddII")
+# Market rows written by other bots near the watermark could carry a slightly older clock
+WATERMARK_SKEW_SECONDS = 120
+
+METRICS.describe("cache_snapshot_ms", "Time spent writing or loading the cache snapshot, by action")
+
+# Unix time the caches were last fully synced with the DB (set by load_all_cache)
+last_synced_at: float | None = None
+# Set when the caches came from a snapshot and still need the background reconcile
+pending_reconcile: "SnapshotInfo | None" = None
+
+
+class SnapshotInfo(NamedTuple):
+    watermark: float  # unix time of the DB sync the snapshot was taken from
+    written_at: float
+    auction_channel_ids: frozenset[int]
+
+
+def snapshot_path() -> str:
+    return get_env("CACHE_SNAPSHOT_PATH", "cache_snapshot.bin")
+
+
+def mark_cache_synced(started_at: float):
+    """Called by load_all_cache after a full load, started_at becomes the next snapshot's watermark."""
+    global last_synced_at
+    last_synced_at = started_at
+
+
+def snapshot_reconcile_pending() -> bool:
+    return pending_reconcile is not None
+
+
+def watermark_as_db_time(watermark: float) -> datetime:
+    """market_value.last_updated is a naive UTC timestamp (datetime.utcnow())."""
+    since = watermark - WATERMARK_SKEW_SECONDS
+    return datetime.fromtimestamp(since, timezone.utc).replace(tzinfo=None)
+
+
+# ❀ Encode / Decode ❀
+def dump_snapshot_payload() -> bytes:
+    """JSON of the caches, runs on the event loop so it sees one consistent state."""
+    payload = {
+        "auctions": [[channel_id, auction] for channel_id, auction in auction_cache.items()],
+        "bids": [[channel_id, stack] for channel_id, stack in auction_bid_stack.items()],
+        "market_values": market_value_cache,
+        "webhooks": [
+            [bot_id, channel_id, record["url"], record["channel_name"]]
+            for (bot_id, channel_id), record in webhook_url_cache.items()
+        ],
+    }
+    return json.dumps(payload, separators=(",", ":"), default=str).encode()
+
+
+def encode_snapshot(raw_payload: bytes, watermark: float, written_at: float) -> bytes:
+    body = zlib.compress(raw_payload, 6)
+    header = SNAPSHOT_HEADER.pack(
+        SNAPSHOT_MAGIC,
+        SNAPSHOT_VERSION,
+        watermark,
+        written_at,
+        len(body),
+        zlib.crc32(body),
+    )
+    return header + body
+
+
+def decode_snapshot(data: bytes) -> tuple[float, float, dict] | None:
+    """Returns (watermark, written_at, payload), None if the file is foreign, outdated or corrupt."""
+    if len(data) < SNAPSHOT_HEADER.size:
+        return None
+    magic, version, watermark, written_at, size, crc = SNAPSHOT_HEADER.unpack_from(data)
+    body = data[SNAPSHOT_HEADER.size :]
+    if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+        return None
+    if len(body) != size or zlib.crc32(body) != crc:
+        return None
+    return watermark, written_at, json.loads(zlib.decompress(body))
+
+
+def write_snapshot_file(path: str, data: bytes):
+    """Writes next to the target and swaps it in, a crash never leaves a half written snapshot."""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".snapshot-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as tmp:
+            tmp.write(data)
+            tmp.flush()
+            os.fsync(tmp.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def read_snapshot_file(path: str) -> bytes | None:
+    try:
+        with open(path, "rb") as file:
+            return file.read()
+    except FileNotFoundError:
+        return None
+
+
+# ❀ Save / Load ❀
+async def save_cache_snapshot() -> bool:
+    """
+    Serializes the caches on the event loop (a consistent view), compresses and writes
+    in a thread. Skipped until the caches were synced with the DB at least once.
+    """
+    if last_synced_at is None or pending_reconcile is not None:
+        return False
+    try:
+        start = time.perf_counter()
+        raw_payload = dump_snapshot_payload()
+        data = await asyncio.to_thread(
+            encode_snapshot, raw_payload, last_synced_at, time.time()
+        )
+        await asyncio.to_thread(write_snapshot_file, snapshot_path(), data)
+        METRICS.observe(
+            "cache_snapshot_ms", (time.perf_counter() - start) * 1000, action="write"
+        )
+        return True
+    except Exception as e:
+        pretty_log("error", f"Error writing cache snapshot: {e}", include_trace=True)
+        return False
+
+
+def apply_snapshot_payload(payload: dict):
+    auction_cache.clear()
+    auction_cache.update(
+        {int(channel_id): auction for channel_id, auction in payload["auctions"]}
+    )
+    auction_bid_stack.clear()
+    auction_bid_stack.update(
+        {int(channel_id): stack for channel_id, stack in payload["bids"]}
+    )
+    market_value_cache.clear()
+    market_value_cache.update(payload["market_values"])
+    webhook_url_cache.clear()
+    webhook_url_cache.update(
+        {
+            (bot_id, channel_id): WebhookRecord(url=url, channel_name=channel_name)
+            for bot_id, channel_id, url, channel_name in payload["webhooks"]
+        }
+    )
+
+
+def rebuild_derived_caches():
+    """Everything load_all_cache derives from the raw caches, without the DB."""
+    from utils.cache.market_value_coverage import sync_coverage_index
+    from utils.db.market_value_db import build_pokemon_list_from_cache
+    from utils.essentials.auction_rules import rebuild_auction_rule_cache
+    from utils.schedule.auction_schedule import rebuild_last_minute_ping_schedule
+
+    rebuild_last_minute_ping_schedule()
+    build_pokemon_list_from_cache()
+    rebuild_auction_rule_cache()
+    sync_coverage_index()
+
+
+def load_cache_snapshot() -> SnapshotInfo | None:
+    """
+    Fills the caches from the snapshot file so reads are served before the DB answers.
+    Call before the gateway connects, then reconcile_cache_snapshot brings them up to date.
+    """
+    global pending_reconcile
+    if market_value_cache:
+        # Already live (setup_hook runs again after a reconnect), the snapshot is older
+        return None
+    path = snapshot_path()
+    try:
+        start = time.perf_counter()
+        data = read_snapshot_file(path)
+        if data is None:
+            return None
+        decoded = decode_snapshot(data)
+        if decoded is None:
+            pretty_log("warn", f"Ignored cache snapshot {path}, outdated or corrupt")
+            return None
+        watermark, written_at, payload = decoded
+        apply_snapshot_payload(payload)
+        rebuild_derived_caches()
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        METRICS.observe("cache_snapshot_ms", elapsed_ms, action="load")
+    except Exception as e:
+        pretty_log("error", f"Error loading cache snapshot: {e}", include_trace=True)
+        return None
+
+    pending_reconcile = SnapshotInfo(
+        watermark=watermark,
+        written_at=written_at,
+        auction_channel_ids=frozenset(auction_cache),
+    )
+    pretty_log(
+        "cache",
+        f"Warm start from snapshot in {elapsed_ms:.0f}ms: {len(auction_cache)} auctions, "
+        f"{len(market_value_cache):,} market values, {len(webhook_url_cache)} webhook urls",
+    )
+    return pending_reconcile
+
+
+async def reconcile_cache_snapshot(bot) -> bool:
+    """
+    Brings snapshot-loaded caches up to date: market values changed after the watermark,
+    everything small (auctions, bids, max bids, webhooks) in full. Auctions that ended
+    in the DB since the snapshot are dropped.
+    """
+    global pending_reconcile
+    from utils.cache.central_cache_loader import load_all_cache
+
+    info = pending_reconcile
+    if info is None:
+        return False
+    synced = await load_all_cache(bot, market_since=watermark_as_db_time(info.watermark))
+    if not synced:
+        return False
+
+    from utils.db.auction_db import fetch_auction_channel_ids
+
+    try:
+        live_ids = await fetch_auction_channel_ids(bot)
+    except Exception as e:
+        pretty_log("error", f"Error reconciling snapshot auctions: {e}")
+        return False
+    ended = [cid for cid in info.auction_channel_ids if cid not in live_ids]
+    for channel_id in ended:
+        auction_cache.pop(channel_id, None)
+        auction_bid_stack.pop(channel_id, None)
+    pending_reconcile = None
+    pretty_log(
+        "cache",
+        f"Snapshot reconciled with the DB ({len(ended)} ended auctions dropped)",
+    )
+    return True
@@ -1,25 +1,55 @@
+import time
+from datetime import datetime
+
 import discord
 
 from utils.db.market_value_db import load_market_cache_from_db
+from utils.essentials.auction_rules import rebuild_auction_rule_cache
 from utils.logs.pretty_log import pretty_log
 
+from .auction_bids_cache import load_auction_bid_cache
 from .auction_cache import load_auction_cache
+from .auction_proxy_cache import load_proxy_bid_cache
+from .cache_snapshot import mark_cache_synced
+from .guild_config_cache import load_guild_config_cache
+from .market_value_coverage import sync_coverage_index
 from .webhook_url_cache import load_webhook_url_cache
 
 
-async def load_all_cache(bot: discord.Client):
+async def load_all_cache(bot: discord.Client, market_since: datetime | None = None) -> bool:
     """
     Loads all caches used by the bot.
     Currently loads:
-    - Market Alert Cache
+    - Guild Config Cache
+    - Auction Cache (+ bid stacks, max bids)
+    - Market Value Cache (+ pre-evaluated auction rules), only rows updated after market_since if given
+    - Webhook URL Cache
+    Returns True when everything loaded, the start time then becomes the cache snapshot watermark.
     """
+    started_at = time.time()
     try:
 
+        # Load Guild Config (channel, category and role ids per guild)
+        await load_guild_config_cache(bot)
+
         # Load Auction Cache
         await load_auction_cache(bot)
 
+        # Load bid stacks of the running auctions
+        await load_auction_bid_cache(bot)
+
+        # Load (and decrypt) max bids of the running auctions
+        await load_proxy_bid_cache(bot)
+
         # Load Market Value Cache from database
-        await load_market_cache_from_db(bot)
+        if not await load_market_cache_from_db(bot, since=market_since):
+            raise RuntimeError("market value cache did not load")
+
+        # Pre-evaluate auction rules for every Pokémon in the market value cache
+        rebuild_auction_rule_cache()
+
+        # Drop in-game mons that now have a market value from the coverage index
+        sync_coverage_index()
 
         # Load Webhook URL Cache
         await load_webhook_url_cache(bot)
@@ -29,8 +59,10 @@ async def load_all_cache(bot: discord.Client):
             message=f"❌ Error loading caches: {e}",
             tag="cache",
         )
-        return
+        return False
     """pretty_log(
         message="✅ All caches loaded successfully.",
         tag="cache",
     )"""
+    mark_cache_synced(started_at)
+    return True
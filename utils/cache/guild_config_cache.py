@@ -0,0 +1,80 @@
+from types import MappingProxyType
+from typing import Mapping, NamedTuple
+
+import discord
+
+from constants.guild_config import GUILD_CONFIG_DEFAULTS, HOME_GUILD_ID
+from utils.cache.cache_list import guild_config_cache
+from utils.db.guild_config_db import fetch_guild_config_rows
+from utils.logs.pretty_log import pretty_log
+
+EMPTY_IDS: frozenset[int] = frozenset()
+
+
+class GuildConfig(NamedTuple):
+    """Immutable config of one guild, replaced as a whole on reload"""
+
+    guild_id: int
+    values: Mapping[str, frozenset[int]]
+    version: int = 0
+
+    def ids(self, key: str) -> frozenset[int]:
+        return self.values.get(key, EMPTY_IDS)
+
+    def first_id(self, key: str) -> int | None:
+        ids = self.values.get(key)
+        return next(iter(ids)) if ids else None
+
+
+def build_guild_config(guild_id: int, rows: list[dict], version: int = 0) -> GuildConfig:
+    """Defaults of the guild overridden by its guild_config rows"""
+    values = {
+        key: frozenset(ids) for key, ids in GUILD_CONFIG_DEFAULTS.get(guild_id, {}).items()
+    }
+    for row in rows:
+        values[row["key"]] = frozenset(row["ids"] or ())
+    return GuildConfig(guild_id, MappingProxyType(values), version)
+
+
+def get_guild_config(guild_id: int | None = None) -> GuildConfig:
+    """Snapshot of a guild (the home guild by default), falls back to the defaults"""
+    if guild_id is None:
+        guild_id = HOME_GUILD_ID
+    config = guild_config_cache.get(guild_id)
+    if config is None:
+        config = guild_config_cache[guild_id] = build_guild_config(guild_id, [])
+    return config
+
+
+def configured_guild_ids() -> frozenset[int]:
+    return frozenset(GUILD_CONFIG_DEFAULTS) | frozenset(guild_config_cache)
+
+
+async def load_guild_config_cache(bot: discord.Client):
+    rows_by_guild: dict[int, list[dict]] = {guild_id: [] for guild_id in GUILD_CONFIG_DEFAULTS}
+    try:
+        rows = await fetch_guild_config_rows(bot)
+    except Exception:
+        return  # Keep the current snapshots (or the defaults) rather than blocking the other caches
+    for row in rows:
+        rows_by_guild.setdefault(row["guild_id"], []).append(row)
+
+    snapshots = {
+        guild_id: build_guild_config(
+            guild_id, rows, getattr(guild_config_cache.get(guild_id), "version", 0) + 1
+        )
+        for guild_id, rows in rows_by_guild.items()
+    }
+    guild_config_cache.clear()
+    guild_config_cache.update(snapshots)
+
+
+async def reload_guild_config(bot: discord.Client, guild_id: int):
+    """Rebuilds one guild's snapshot after a guild_config NOTIFY, keeps the old one if the read fails"""
+    try:
+        rows = await fetch_guild_config_rows(bot, guild_id)
+    except Exception:
+        return
+    version = getattr(guild_config_cache.get(guild_id), "version", 0) + 1
+    guild_config_cache[guild_id] = build_guild_config(guild_id, rows, version)
+    pretty_log("cache", f"Guild config reloaded for guild {guild_id} (v{version})")
@@ -0,0 +1,114 @@
+# 🍩────────────────────────────────────────────
+#     💤 Market Value Coverage Index
+# 🍩────────────────────────────────────────────
+import csv
+import io
+
+from utils.cache.cache_list import market_value_cache, missing_market_value_cache
+
+# Rarities listed first in /market-value filter
+PRIORITY_RARITIES = {
+    "golden",
+    "shiny",
+    "mega",
+    "gigantamax",
+    "shiny mega",
+    "shiny gigantamax",
+}
+
+_in_game_total = 0
+
+
+def build_coverage_index() -> int:
+    """
+    Builds the list of in-game mons without a market value.
+    Dex number, display name and rarity are resolved once here instead of per command.
+    Returns the number of mons without market value.
+    """
+    global _in_game_total
+    from constants.rarity import get_rarity, in_game_mons_list
+    from utils.essentials.dex_service import get_dex_numbers
+    from utils.essentials.minimum_increment import format_names_for_market_value_lookup
+
+    seen = set()
+    candidates = []
+    for mon in in_game_mons_list:
+        formatted_name = format_names_for_market_value_lookup(mon)
+        if formatted_name in seen:
+            continue
+        seen.add(formatted_name)
+        if formatted_name not in market_value_cache:
+            candidates.append((formatted_name, mon))
+
+    missing = {}
+    dex_numbers = get_dex_numbers(mon for _, mon in candidates)
+    for (formatted_name, mon), dex in zip(candidates, dex_numbers):
+        display = mon.title()
+        rarity = get_rarity(display)
+        missing[formatted_name] = {
+            "display": f"{display} #{dex if dex is not None else 'N/A'}",
+            "name": display,
+            "dex": dex if dex is not None else "N/A",
+            "rarity": rarity or "unknown",
+            "is_priority": rarity in PRIORITY_RARITIES,
+        }
+
+    missing_market_value_cache.clear()
+    missing_market_value_cache.update(missing)
+    _in_game_total = len(seen)
+    return len(missing_market_value_cache)
+
+
+def sync_coverage_index() -> int:
+    """Called after a full market cache load, drops mons that now have a value."""
+    if not _in_game_total:
+        return build_coverage_index()
+    for name in [name for name in missing_market_value_cache if name in market_value_cache]:
+        del missing_market_value_cache[name]
+    return len(missing_market_value_cache)
+
+
+def mark_market_value_present(pokemon_name: str):
+    """Incremental update from market value writes."""
+    missing_market_value_cache.pop(pokemon_name.lower(), None)
+
+
+def coverage_counts() -> tuple[int, int]:
+    """(in-game mons, mons without market value)"""
+    if not _in_game_total:
+        build_coverage_index()
+    return _in_game_total, len(missing_market_value_cache)
+
+
+def missing_market_value_lines() -> list[str]:
+    """Display lines for mons without market value, priority rarities first."""
+    if not _in_game_total:
+        build_coverage_index()
+    entries = missing_market_value_cache.values()
+    return [e["display"] for e in entries if e["is_priority"]] + [
+        e["display"] for e in entries if not e["is_priority"]
+    ]
+
+
+def export_coverage_gaps_csv() -> io.BytesIO:
+    """CSV of mons without market value, priority rarities first."""
+    if not _in_game_total:
+        build_coverage_index()
+    rows = sorted(
+        missing_market_value_cache.items(),
+        key=lambda item: not item[1]["is_priority"],
+    )
+    text = io.StringIO()
+    writer = csv.writer(text)
+    writer.writerow(["pokemon", "lookup_name", "dex", "rarity", "priority"])
+    for lookup_name, entry in rows:
+        writer.writerow(
+            [
+                entry["name"],
+                lookup_name,
+                entry["dex"],
+                entry["rarity"],
+                "yes" if entry["is_priority"] else "no",
+            ]
+        )
+    return io.BytesIO(text.getvalue().encode("utf-8"))
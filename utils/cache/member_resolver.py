@@ -0,0 +1,163 @@
+# 🍩────────────────────────────────────────────
+#     💤 Member Resolver (LRU + TTL snapshots)
+# 🍩────────────────────────────────────────────
+import time
+from collections import OrderedDict
+from typing import NamedTuple
+
+import discord
+
+from utils.logs.metrics import METRICS
+from utils.logs.pretty_log import pretty_log
+
+MEMBER_CACHE_SIZE = 5_000
+MEMBER_TTL_SECONDS = 600  # 10 mins, on_member_update invalidates earlier
+QUERY_MEMBERS_BATCH = 100  # Discord limit for user_ids in one members request
+
+METRICS.describe("member_resolver_total", "Member lookups, by source (lru, gateway, query, missing)")
+
+
+class MemberSnapshot(NamedTuple):
+    """What the auction code needs from a member, cheap to keep and O(1) role checks."""
+
+    id: int
+    name: str
+    display_name: str
+    avatar_url: str | None
+    role_ids: frozenset[int]
+
+    @property
+    def mention(self) -> str:
+        return f"<@{self.id}>"
+
+    def __str__(self):
+        return self.name
+
+
+def snapshot_member(member: discord.Member | discord.User) -> MemberSnapshot:
+    avatar = getattr(member, "display_avatar", None) or getattr(member, "avatar", None)
+    return MemberSnapshot(
+        id=member.id,
+        name=member.name,
+        display_name=getattr(member, "display_name", member.name),
+        avatar_url=avatar.url if avatar else None,
+        role_ids=frozenset(role.id for role in getattr(member, "roles", ())),
+    )
+
+
+def departed_member(user_id: int, name: str | None) -> MemberSnapshot:
+    """Stand-in for a member who left the server, built from the name stored on the row."""
+    name = name or str(user_id)
+    return MemberSnapshot(
+        id=user_id, name=name, display_name=name, avatar_url=None, role_ids=frozenset()
+    )
+
+
+def role_ids_of(user) -> frozenset[int]:
+    """Role ids of a MemberSnapshot or a discord.Member."""
+    role_ids = getattr(user, "role_ids", None)
+    if role_ids is not None:
+        return role_ids
+    return frozenset(role.id for role in getattr(user, "roles", ()))
+
+
+def avatar_url_of(user) -> str | None:
+    """Avatar url of a MemberSnapshot or a discord.Member/User, None-safe."""
+    if isinstance(user, MemberSnapshot):
+        return user.avatar_url
+    avatar = getattr(user, "display_avatar", None) or getattr(user, "avatar", None)
+    return avatar.url if avatar else None
+
+
+class MemberResolver:
+    """
+    Serves members in this order: LRU snapshot -> gateway member cache -> one batched
+    query_members request for everything still unknown. Only unknown ids hit Discord.
+    """
+
+    def __init__(self, max_size: int = MEMBER_CACHE_SIZE, ttl: float = MEMBER_TTL_SECONDS):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.entries: "OrderedDict[int, tuple[float, MemberSnapshot]]" = OrderedDict()
+
+    # ❀ LRU ❀
+    def put(self, member: discord.Member | discord.User) -> MemberSnapshot:
+        snapshot = snapshot_member(member)
+        self.entries[member.id] = (time.monotonic() + self.ttl, snapshot)
+        self.entries.move_to_end(member.id)
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+        return snapshot
+
+    def get_cached(self, user_id: int) -> MemberSnapshot | None:
+        entry = self.entries.get(user_id)
+        if entry is None:
+            return None
+        expires_at, snapshot = entry
+        if expires_at < time.monotonic():
+            del self.entries[user_id]
+            return None
+        self.entries.move_to_end(user_id)
+        return snapshot
+
+    def invalidate(self, user_id: int):
+        self.entries.pop(user_id, None)
+
+    def clear(self):
+        self.entries.clear()
+
+    # ❀ Lookups ❀
+    async def resolve(self, guild: discord.Guild, user_id: int) -> MemberSnapshot | None:
+        if not user_id:
+            return None
+        return (await self.resolve_many(guild, [user_id])).get(user_id)
+
+    async def resolve_many(
+        self, guild: discord.Guild, user_ids
+    ) -> dict[int, MemberSnapshot]:
+        """Snapshots of every id found, members who left the server are simply missing."""
+        resolved: dict[int, MemberSnapshot] = {}
+        unknown: list[int] = []
+        for user_id in dict.fromkeys(uid for uid in user_ids if uid):
+            snapshot = self.get_cached(user_id)
+            if snapshot is not None:
+                METRICS.inc("member_resolver_total", source="lru")
+                resolved[user_id] = snapshot
+                continue
+            member = guild.get_member(user_id)
+            if member is not None:
+                METRICS.inc("member_resolver_total", source="gateway")
+                resolved[user_id] = self.put(member)
+                continue
+            unknown.append(user_id)
+
+        for start in range(0, len(unknown), QUERY_MEMBERS_BATCH):
+            batch = unknown[start : start + QUERY_MEMBERS_BATCH]
+            try:
+                members = await guild.query_members(
+                    user_ids=batch, limit=len(batch), cache=True
+                )
+            except Exception as e:
+                pretty_log("error", f"Error querying {len(batch)} members: {e}")
+                continue
+            for member in members:
+                METRICS.inc("member_resolver_total", source="query")
+                resolved[member.id] = self.put(member)
+
+        missing = len(unknown) - sum(1 for uid in unknown if uid in resolved)
+        if missing:
+            METRICS.inc("member_resolver_total", missing, source="missing")
+        return resolved
+
+    async def warm_up(self, guild: discord.Guild):
+        """Chunks the guild so the gateway member cache has everyone, call once on ready."""
+        if guild is None or getattr(guild, "chunked", False):
+            return
+        try:
+            members = await guild.chunk(cache=True)
+            pretty_log("ready", f"Member cache warmed up with {len(members):,} members")
+        except Exception as e:
+            pretty_log("error", f"Error chunking guild {guild.id}: {e}")
+
+
+MEMBER_RESOLVER = MemberResolver()
@@ -1,6 +1,6 @@
 import discord
 
-from utils.cache.cache_list import webhook_url_cache
+from utils.cache.cache_list import WebhookRecord, webhook_url_cache
 from utils.db.webhook_db_url import fetch_all_webhook_urls
 from utils.logs.pretty_log import pretty_log
 
@@ -18,7 +18,10 @@ async def load_webhook_url_cache(bot: discord.Client):
 
         for entry in webhook_urls:
             key = (entry["bot_id"], entry["channel_id"])
-            webhook_url_cache[key] = entry["url"]
+            webhook_url_cache[key] = WebhookRecord(
+                url=entry["url"],
+                channel_name=entry["channel_name"],
+            )
 
         """pretty_log(
             message=f"✅ Loaded {len(webhook_url_cache)} webhook URLs into cache.",
@@ -44,9 +47,10 @@ def upsert_webhook_url_into_cache(
     bot_id: int,
     channel_id: int,
     url: str,
+    channel_name: str,
 ):
     key = (bot_id, channel_id)
-    webhook_url_cache[key] = url
+    webhook_url_cache[key] = WebhookRecord(url=url, channel_name=channel_name)
     pretty_log(
         message=f"✅ Upserted webhook URL into cache for bot ID: {bot_id}, channel ID: {channel_id}",
         tag="cache",
@@ -69,6 +73,6 @@ def remove_webhook_url_from_cache(
 def fetch_webhook_url_from_cache(
     bot_id: int,
     channel_id: int,
-):
+) -> WebhookRecord | None:
     key = (bot_id, channel_id)
     return webhook_url_cache.get(key)
@@ -0,0 +1,211 @@
+import time
+
+import discord
+
+from utils.cache.cache_list import BidRecord
+from utils.logs.metrics import timed_db
+from utils.logs.pretty_log import pretty_log
+
+# SQL SCRIPT
+"""CREATE TABLE auction_bids (
+    id BIGSERIAL PRIMARY KEY,
+    channel_id BIGINT NOT NULL,
+    bidder_id BIGINT NOT NULL,
+    bidder_name VARCHAR(255),
+    amount BIGINT NOT NULL,
+    placed_at BIGINT NOT NULL,
+    kind VARCHAR(16) NOT NULL DEFAULT 'bid'
+);
+CREATE INDEX auction_bids_channel_id_idx ON auction_bids (channel_id, id);"""
+# Append-only ledger, kind is one of:
+#   bid / autobuy / roll_back / proxy -> new highest bid
+#   undo                              -> the latest bid was rolled back (bidder_id/amount of the undone bid)
+#   close                             -> auction ended, earlier rows of this channel belong to old auctions
+
+
+async def persist_bid(
+    bot: discord.Client,
+    channel_id: int,
+    bidder_id: int,
+    bidder_name: str,
+    amount: int,
+    kind: str = "bid",
+) -> BidRecord:
+    """Stores a new highest bid, see persist_bids. Raises if the write fails so callers can abort."""
+    records = await persist_bids(bot, channel_id, [(bidder_id, bidder_name, amount, kind)])
+    return records[0]
+
+
+@timed_db
+async def persist_bids(
+    bot: discord.Client,
+    channel_id: int,
+    bids: list[tuple[int, str, int, str]],
+) -> list[BidRecord]:
+    """
+    Stores bids placed together, oldest first (a bid and the max bid answering it).
+    Every ledger row and one auctions row update for the last bid go in one transaction,
+    auction_cache and the bid stack only change after it committed. Raises if the write fails.
+    """
+    from utils.cache.auction_bids_cache import push_bid
+    from utils.cache.auction_cache import update_auction_cache
+
+    placed_at = int(time.time())
+    records = [
+        BidRecord(
+            bidder_id=bidder_id,
+            bidder_name=bidder_name,
+            amount=amount,
+            placed_at=placed_at,
+            kind=kind,
+        )
+        for bidder_id, bidder_name, amount, kind in bids
+    ]
+    final = records[-1]
+    try:
+        async with bot.pg_pool.acquire() as conn:
+            async with conn.transaction():
+                await conn.execute(
+                    """
+                    UPDATE auctions
+                    SET highest_bidder_id = $1, highest_bidder = $2, highest_offer = $3
+                    WHERE channel_id = $4;
+                    """,
+                    final["bidder_id"],
+                    final["bidder_name"],
+                    final["amount"],
+                    channel_id,
+                )
+                await conn.executemany(
+                    """
+                    INSERT INTO auction_bids (channel_id, bidder_id, bidder_name, amount, placed_at, kind)
+                    VALUES ($1, $2, $3, $4, $5, $6);
+                    """,
+                    [
+                        (
+                            channel_id,
+                            record["bidder_id"],
+                            record["bidder_name"],
+                            record["amount"],
+                            record["placed_at"],
+                            record["kind"],
+                        )
+                        for record in records
+                    ],
+                )
+    except Exception as e:
+        pretty_log("error", f"Error persisting bid: {e}", include_trace=True)
+        raise
+
+    for record in records:
+        pretty_log(
+            "db",
+            f"Bid stored for channel_id {channel_id} (Highest Offer: {record['amount']} by {record['bidder_name']}, Kind: {record['kind']})",
+        )
+        push_bid(channel_id, record)
+    update_auction_cache(
+        channel_id, final["bidder_id"], final["bidder_name"], final["amount"]
+    )
+    return records
+
+
+@timed_db
+async def undo_last_bid(
+    bot: discord.Client, channel_id: int
+) -> tuple[BidRecord, BidRecord | None] | None:
+    """
+    Rolls back the latest bid and restores the one before it (or no bids).
+    Returns (undone, restored) or None if there is nothing to undo. Raises if the write fails.
+    """
+    from utils.cache.auction_bids_cache import peek_bid, pop_bid
+    from utils.cache.auction_cache import update_auction_cache
+
+    undone = peek_bid(channel_id)
+    if undone is None:
+        return None
+    restored = peek_bid(channel_id, depth=1)
+    bidder_id = restored["bidder_id"] if restored else 0
+    bidder_name = restored["bidder_name"] if restored else ""
+    amount = restored["amount"] if restored else 0
+
+    try:
+        async with bot.pg_pool.acquire() as conn:
+            async with conn.transaction():
+                await conn.execute(
+                    """
+                    UPDATE auctions
+                    SET highest_bidder_id = $1, highest_bidder = $2, highest_offer = $3
+                    WHERE channel_id = $4;
+                    """,
+                    bidder_id,
+                    bidder_name,
+                    amount,
+                    channel_id,
+                )
+                await conn.execute(
+                    """
+                    INSERT INTO auction_bids (channel_id, bidder_id, bidder_name, amount, placed_at, kind)
+                    VALUES ($1, $2, $3, $4, $5, $6);
+                    """,
+                    channel_id,
+                    undone["bidder_id"],
+                    undone["bidder_name"],
+                    undone["amount"],
+                    int(time.time()),
+                    "undo",
+                )
+    except Exception as e:
+        pretty_log("error", f"Error undoing last bid: {e}", include_trace=True)
+        raise
+
+    pretty_log(
+        "db",
+        f"Bid of {undone['amount']} by {undone['bidder_name']} undone for channel_id {channel_id} (Restored Offer: {amount})",
+    )
+    pop_bid(channel_id)
+    update_auction_cache(channel_id, bidder_id, bidder_name, amount)
+    return undone, restored
+
+
+async def close_bid_ledger(conn, channel_id: int):
+    """
+    Marks the end of an auction in the ledger, bids before it are history only.
+    Call inside delete_auction's transaction, an auction row never goes away with its bids still open.
+    """
+    await conn.execute(
+        """
+        INSERT INTO auction_bids (channel_id, bidder_id, bidder_name, amount, placed_at, kind)
+        VALUES ($1, $2, $3, $4, $5, $6);
+        """,
+        channel_id,
+        0,
+        "",
+        0,
+        int(time.time()),
+        "close",
+    )
+
+
+@timed_db
+async def fetch_open_bids(bot: discord.Client, channel_ids: list[int]) -> list:
+    """Ledger rows after the last close marker of each channel, oldest first."""
+    if not channel_ids:
+        return []
+    try:
+        async with bot.pg_pool.acquire() as conn:
+            return await conn.fetch(
+                """
+                SELECT channel_id, bidder_id, bidder_name, amount, placed_at, kind
+                FROM auction_bids b
+                WHERE channel_id = ANY($1)
+                AND id > COALESCE(
+                    (SELECT MAX(id) FROM auction_bids c WHERE c.channel_id = b.channel_id AND c.kind = 'close'),
+                    0
+                )
+                ORDER BY id;
+                """,
+                channel_ids,
+            )
+    except Exception as e:
+        pretty_log("error", f"Error fetching open bids: {e}", include_trace=True)
+        return []
@@ -1,5 +1,6 @@
 import discord
 
+from utils.logs.metrics import timed_db
 from utils.logs.pretty_log import pretty_log
 
 # SQL SCRIPT
@@ -20,10 +21,21 @@ from utils.logs.pretty_log import pretty_log
     market_value BIGINT,
     minimum_increment BIGINT,
     last_minute_pinged BOOLEAN,
-    is_bulk BOOLEAN DEFAULT FALSE
-);"""
+    is_bulk BOOLEAN DEFAULT FALSE,
+    state VARCHAR(16) NOT NULL DEFAULT 'active',  -- active, ending, announced (see utils/essentials/auction_state.py)
+    state_changed_at BIGINT,
+    started_on BIGINT DEFAULT CAST(EXTRACT(EPOCH FROM NOW()) AS BIGINT)
+);
 
+-- Existing tables:
+ALTER TABLE auctions ADD COLUMN state VARCHAR(16) NOT NULL DEFAULT 'active';
+ALTER TABLE auctions ADD COLUMN state_changed_at BIGINT;
+CREATE INDEX auctions_state_idx ON auctions (state, state_changed_at) WHERE state <> 'active';
+ALTER TABLE auctions ADD COLUMN started_on BIGINT DEFAULT CAST(EXTRACT(EPOCH FROM NOW()) AS BIGINT);
+"""
 
+
+@timed_db
 async def upsert_auction(
     bot: discord.Client,
     channel_id: int,
@@ -116,6 +128,7 @@ async def upsert_auction(
         pretty_log("error", f"Error upserting auction: {e}", include_trace=True)
 
 
+@timed_db
 async def update_auction_bid(
     bot: discord.Client,
     channel_id: int,
@@ -188,6 +201,7 @@ async def update_auction_bid(
         pretty_log("error", f"Error updating auction bid: {e}", include_trace=True)
 
 
+@timed_db
 async def remove_accepted_list(bot: discord.Client, channel_id: int):
     try:
         async with bot.pg_pool.acquire() as conn:
@@ -213,6 +227,7 @@ async def remove_accepted_list(bot: discord.Client, channel_id: int):
         )
 
 
+@timed_db
 async def update_accepted_list(
     bot: discord.Client,
     channel_id: int,
@@ -243,12 +258,17 @@ async def update_accepted_list(
         )
 
 
+@timed_db
 async def update_ends_on(
     bot: discord.Client,
     channel_id: int,
     ends_on: int,
     broadcast_msg_id: int = None,
 ):
+    # A manual end time replaces any soft close extension still waiting to be written
+    from utils.cache.cache_list import pending_ends_on_writes
+
+    pending_ends_on_writes.pop(channel_id, None)
     try:
         async with bot.pg_pool.acquire() as conn:
             if broadcast_msg_id is not None:
@@ -285,6 +305,34 @@ async def update_ends_on(
         pretty_log("error", f"Error updating auction end time: {e}", include_trace=True)
 
 
+@timed_db
+async def update_ends_on_many(bot: discord.Client, deadlines: dict[int, int]) -> bool:
+    """Writes several end times in one batch, auction_cache is expected to be up to date already."""
+    if not deadlines:
+        return True
+    try:
+        async with bot.pg_pool.acquire() as conn:
+            await conn.executemany(
+                """
+                UPDATE auctions
+                SET ends_on = $1
+                WHERE channel_id = $2;
+                """,
+                [(ends_on, channel_id) for channel_id, ends_on in deadlines.items()],
+            )
+        pretty_log(
+            "db",
+            f"Auction end times updated for {len(deadlines)} channel(s)",
+        )
+        return True
+    except Exception as e:
+        pretty_log(
+            "error", f"Error updating auction end times: {e}", include_trace=True
+        )
+        return False
+
+
+@timed_db
 async def update_last_minute_pinged(
     bot: discord.Client,
     channel_id: int,
@@ -305,12 +353,17 @@ async def update_last_minute_pinged(
             "db",
             f"Auction last_minute_pinged updated for channel_id {channel_id} (New Value: {last_minute_pinged})",
         )
+        # Update cache as well
+        from utils.cache.auction_cache import update_last_minute_pinged_cache
+
+        update_last_minute_pinged_cache(channel_id, last_minute_pinged)
     except Exception as e:
         pretty_log(
             "error", f"Error updating last_minute_pinged: {e}", include_trace=True
         )
 
 
+@timed_db
 async def update_broadcast_msg_id(
     bot: discord.Client,
     channel_id: int,
@@ -344,36 +397,66 @@ async def update_broadcast_msg_id(
         )
 
 
+@timed_db
 async def delete_auction(
     bot: discord.Client,
     channel_id: int,
-):
+    reason: str | None = None,
+) -> bool:
+    """
+    Deletes the auction and its max bids, returns False if the DB write failed.
+    With a reason (ended, autobought, stopped, channel_deleted) the row is archived into
+    auction_results in the same transaction (see utils/db/auction_results_db.py).
+    """
+    from utils.cache.cache_list import auction_bid_stack
+    from utils.db.auction_bids_db import close_bid_ledger
+    from utils.db.auction_results_db import archive_auction_result
+
+    bid_count = len(auction_bid_stack.get(channel_id) or ())
     try:
         async with bot.pg_pool.acquire() as conn:
-            await conn.execute(
-                """
-                DELETE FROM auctions
-                WHERE channel_id = $1;
-                """,
-                channel_id,
-            )
+            async with conn.transaction():
+                row = await conn.fetchrow(
+                    """
+                    DELETE FROM auctions
+                    WHERE channel_id = $1
+                    RETURNING *;
+                    """,
+                    channel_id,
+                )
+                # Max bids only matter while the auction runs (table in auction_proxy_db.py)
+                await conn.execute(
+                    """
+                    DELETE FROM auction_proxy_bids
+                    WHERE channel_id = $1;
+                    """,
+                    channel_id,
+                )
+                # Bids of this auction stay in the ledger for auditing, but are no longer open
+                await close_bid_ledger(conn, channel_id)
+                if row and reason:
+                    await archive_auction_result(conn, row, reason, bid_count)
             pretty_log("db", f"Auction deleted for channel_id {channel_id}")
             # Delete from cache as well
             from utils.cache.auction_cache import delete_auction_cache
 
             delete_auction_cache(channel_id)
+        return True
 
     except Exception as e:
         pretty_log("error", f"Error deleting auction: {e}", include_trace=True)
+        return False
 
 
+@timed_db
 async def fetch_all_due_auctions(bot: discord.Client):
     try:
         async with bot.pg_pool.acquire() as conn:
             rows = await conn.fetch(
                 """
                 SELECT * FROM auctions
-                WHERE ends_on <= CAST(EXTRACT(EPOCH FROM NOW()) AS BIGINT);
+                WHERE ends_on <= CAST(EXTRACT(EPOCH FROM NOW()) AS BIGINT)
+                AND state = 'active';
                 """
             )
 
@@ -383,6 +466,74 @@ async def fetch_all_due_auctions(bot: discord.Client):
         return []
 
 
+@timed_db
+async def fetch_stuck_auctions(bot: discord.Client, changed_before: int):
+    """Auctions left in ending/announced since before changed_before (crash, failed send)."""
+    try:
+        async with bot.pg_pool.acquire() as conn:
+            return await conn.fetch(
+                """
+                SELECT * FROM auctions
+                WHERE state <> 'active' AND state_changed_at <= $1;
+                """,
+                changed_before,
+            )
+    except Exception as e:
+        pretty_log("error", f"Error fetching stuck auctions: {e}", include_trace=True)
+        return []
+
+
+@timed_db
+async def transition_auction_state(
+    bot: discord.Client,
+    channel_id: int,
+    from_state: str,
+    to_state: str,
+    changed_at: int,
+    lease_before: int | None = None,
+) -> bool:
+    """
+    Compare-and-set of the auction state, True only for the caller that moved it.
+    lease_before also requires state_changed_at <= lease_before (taking over a stuck transition).
+    """
+    try:
+        async with bot.pg_pool.acquire() as conn:
+            if lease_before is None:
+                status = await conn.execute(
+                    """
+                    UPDATE auctions
+                    SET state = $1, state_changed_at = $2
+                    WHERE channel_id = $3 AND state = $4;
+                    """,
+                    to_state,
+                    changed_at,
+                    channel_id,
+                    from_state,
+                )
+            else:
+                status = await conn.execute(
+                    """
+                    UPDATE auctions
+                    SET state = $1, state_changed_at = $2
+                    WHERE channel_id = $3 AND state = $4 AND state_changed_at <= $5;
+                    """,
+                    to_state,
+                    changed_at,
+                    channel_id,
+                    from_state,
+                    lease_before,
+                )
+        return status.split()[-1] != "0"
+    except Exception as e:
+        pretty_log(
+            "error",
+            f"Error moving auction {channel_id} from {from_state} to {to_state}: {e}",
+            include_trace=True,
+        )
+        return False
+
+
+@timed_db
 async def fetch_auction_by_channel_id(bot: discord.Client, channel_id: int):
     try:
         async with bot.pg_pool.acquire() as conn:
@@ -408,6 +559,7 @@ async def fetch_auction_by_channel_id(bot: discord.Client, channel_id: int):
         return None
 
 
+@timed_db
 async def fetch_all_auctions(bot: discord.Client):
     try:
         async with bot.pg_pool.acquire() as conn:
@@ -426,6 +578,42 @@ async def fetch_all_auctions(bot: discord.Client):
         return []
 
 
+async def fetch_auction_channel_ids(bot: discord.Client) -> set[int]:
+    """Channel ids of every running auction. Raises on failure, an empty set means no auctions."""
+    async with bot.pg_pool.acquire() as conn:
+        rows = await conn.fetch("SELECT channel_id FROM auctions")
+    return {row["channel_id"] for row in rows}
+
+
+@timed_db
+async def set_last_minute_pinged_many(
+    bot: discord.Client, channel_ids: list[int], value: bool = True
+):
+    """One write for every auction pinged in a tick, auction_cache is flipped by the scheduler."""
+    if not channel_ids:
+        return
+    try:
+        async with bot.pg_pool.acquire() as conn:
+            await conn.execute(
+                """
+                UPDATE auctions
+                SET last_minute_pinged = $1
+                WHERE channel_id = ANY($2);
+                """,
+                value,
+                channel_ids,
+            )
+        pretty_log(
+            "db",
+            f"Auction last_minute_pinged set to {value} for {len(channel_ids)} channel(s)",
+        )
+    except Exception as e:
+        pretty_log(
+            "error", f"Error setting last_minute_pinged: {e}", include_trace=True
+        )
+
+
+@timed_db
 async def set_last_minute_pinged(bot: discord.Client, channel_id: int, value: bool):
     try:
         async with bot.pg_pool.acquire() as conn:
@@ -450,25 +638,3 @@ async def set_last_minute_pinged(bot: discord.Client, channel_id: int, value: bo
         pretty_log(
             "error", f"Error setting last_minute_pinged: {e}", include_trace=True
         )
-
-
-async def fetch_auctions_ending_within_10_mins(bot: discord.Client):
-    # Grabs auctions that are ending within the next 10 minutes and haven't been pinged yet
-    try:
-        async with bot.pg_pool.acquire() as conn:
-            rows = await conn.fetch(
-                """
-                SELECT * FROM auctions
-                WHERE ends_on <= CAST(EXTRACT(EPOCH FROM NOW()) AS BIGINT) + 600
-                AND last_minute_pinged = FALSE;
-                """
-            )
-
-            return rows
-    except Exception as e:
-        pretty_log(
-            "error",
-            f"Error fetching auctions ending within 10 minutes: {e}",
-            include_trace=True,
-        )
-        return []
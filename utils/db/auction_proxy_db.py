@@ -0,0 +1,126 @@
+import time
+
+import discord
+from cryptography.fernet import Fernet, InvalidToken
+
+from utils.essentials.env import get_env
+from utils.logs.metrics import timed_db
+from utils.logs.pretty_log import pretty_log
+
+# SQL SCRIPT
+"""CREATE TABLE auction_proxy_bids (
+    channel_id BIGINT NOT NULL,
+    bidder_id BIGINT NOT NULL,
+    bidder_name VARCHAR(255),
+    ceiling_enc TEXT NOT NULL,
+    placed_at BIGINT NOT NULL,
+    PRIMARY KEY (channel_id, bidder_id)
+);"""
+# ceiling_enc is the max bid encrypted with PROXY_BID_KEY (Fernet),
+# generate one with: python -c "from cryptography.fernet import Fernet; print(Fernet.generate_key().decode())"
+
+PROXY_BID_KEY_ENV = "PROXY_BID_KEY"
+_fernet: Fernet | None = None
+
+
+def _get_fernet() -> Fernet | None:
+    global _fernet
+    if _fernet is None:
+        key = get_env(PROXY_BID_KEY_ENV)
+        if key:
+            _fernet = Fernet(key)
+    return _fernet
+
+
+def proxy_bidding_enabled() -> bool:
+    return _get_fernet() is not None
+
+
+def encrypt_ceiling(ceiling: int) -> str:
+    return _get_fernet().encrypt(str(ceiling).encode()).decode()
+
+
+def decrypt_ceiling(token: str) -> int | None:
+    try:
+        return int(_get_fernet().decrypt(token.encode()))
+    except (InvalidToken, ValueError):
+        return None
+
+
+@timed_db
+async def upsert_proxy_bid(
+    bot: discord.Client,
+    channel_id: int,
+    bidder_id: int,
+    bidder_name: str,
+    ceiling: int,
+):
+    """Stores or raises a max bid, then updates auction_proxy_cache. Raises if the write fails."""
+    from utils.cache.auction_proxy_cache import set_proxy_bid
+
+    placed_at = int(time.time())
+    try:
+        async with bot.pg_pool.acquire() as conn:
+            await conn.execute(
+                """
+                INSERT INTO auction_proxy_bids (channel_id, bidder_id, bidder_name, ceiling_enc, placed_at)
+                VALUES ($1, $2, $3, $4, $5)
+                ON CONFLICT (channel_id, bidder_id) DO UPDATE SET
+                    bidder_name = EXCLUDED.bidder_name,
+                    ceiling_enc = EXCLUDED.ceiling_enc,
+                    placed_at = EXCLUDED.placed_at;
+                """,
+                channel_id,
+                bidder_id,
+                bidder_name,
+                encrypt_ceiling(ceiling),
+                placed_at,
+            )
+    except Exception as e:
+        pretty_log("error", f"Error storing proxy bid: {e}", include_trace=True)
+        raise
+
+    pretty_log("db", f"Proxy bid stored for channel_id {channel_id} by {bidder_name}")
+    set_proxy_bid(channel_id, bidder_id, bidder_name, ceiling, placed_at)
+
+
+@timed_db
+async def delete_proxy_bid(bot: discord.Client, channel_id: int, bidder_id: int):
+    """
+    Drops one max bid from auction_proxy_cache and the table. The max bids of a whole
+    auction are deleted by delete_auction in its transaction.
+    """
+    from utils.cache.auction_proxy_cache import remove_proxy_bid
+
+    remove_proxy_bid(channel_id, bidder_id)
+    try:
+        async with bot.pg_pool.acquire() as conn:
+            await conn.execute(
+                """
+                DELETE FROM auction_proxy_bids
+                WHERE channel_id = $1 AND bidder_id = $2;
+                """,
+                channel_id,
+                bidder_id,
+            )
+    except Exception as e:
+        pretty_log("error", f"Error deleting proxy bid: {e}", include_trace=True)
+
+
+@timed_db
+async def fetch_proxy_bids(bot: discord.Client, channel_ids: list[int]) -> list:
+    if not channel_ids:
+        return []
+    try:
+        async with bot.pg_pool.acquire() as conn:
+            return await conn.fetch(
+                """
+                SELECT channel_id, bidder_id, bidder_name, ceiling_enc, placed_at
+                FROM auction_proxy_bids
+                WHERE channel_id = ANY($1);
+                """,
+                channel_ids,
+            )
+    except Exception as e:
+        pretty_log("error", f"Error fetching proxy bids: {e}", include_trace=True)
+        return []
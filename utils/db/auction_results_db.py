@@ -0,0 +1,299 @@
+import time
+from datetime import date, datetime, timezone
+from typing import NamedTuple
+
+import discord
+
+from utils.logs.metrics import timed_db
+from utils.logs.pretty_log import pretty_log
+
+# SQL SCRIPT
+"""CREATE TABLE auction_results (
+    id BIGSERIAL,
+    channel_id BIGINT NOT NULL,
+    host_id BIGINT,
+    host_name VARCHAR(255),
+    pokemon VARCHAR(255),
+    rarity VARCHAR(32),
+    is_bulk BOOLEAN DEFAULT FALSE,
+    outcome VARCHAR(16) NOT NULL,  -- sold, unsold, autobought, stopped, channel_deleted
+    winner_id BIGINT,
+    winner_name VARCHAR(255),
+    final_price BIGINT,  -- NULL unless sold or autobought
+    autobuy BIGINT,
+    market_value BIGINT,
+    bid_count INT NOT NULL DEFAULT 0,
+    started_on BIGINT,  -- unix timestamps
+    ended_on BIGINT NOT NULL,
+    duration_seconds BIGINT,
+    ended_at TIMESTAMPTZ NOT NULL,
+    PRIMARY KEY (id, ended_at)
+) PARTITION BY RANGE (ended_at);
+-- Monthly partitions are created by ensure_result_partitions, the default one catches the rest.
+-- A month that already has rows in the default partition can't be added with PARTITION OF,
+-- ensure_result_partitions moves them into a standalone table and attaches that instead.
+CREATE TABLE auction_results_default PARTITION OF auction_results DEFAULT;
+CREATE INDEX auction_results_pokemon_idx ON auction_results (pokemon, ended_at);
+CREATE INDEX auction_results_host_idx ON auction_results (host_id, ended_at);
+
+-- Daily rollup, kept up to date in the same transaction as every result insert
+-- (an incrementally refreshed aggregate, the analytics queries only read this)
+CREATE TABLE auction_result_daily (
+    pokemon VARCHAR(255) NOT NULL,  -- 'bulk' for bulk auctions
+    day DATE NOT NULL,
+    rarity VARCHAR(32),
+    listed INT NOT NULL DEFAULT 0,
+    sold INT NOT NULL DEFAULT 0,
+    sold_prices BIGINT[] NOT NULL DEFAULT '{}',
+    PRIMARY KEY (pokemon, day)
+);
+CREATE INDEX auction_result_daily_rarity_idx ON auction_result_daily (day, rarity);"""
+
+# What delete_auction was asked to do, the stored outcome is derived from it
+ENDED = "ended"
+AUTOBOUGHT = "autobought"
+STOPPED = "stopped"
+CHANNEL_DELETED = "channel_deleted"
+# Outcomes that count as a listing for sell-through (stopped auctions were never up for sale)
+LISTED_OUTCOMES = {"sold", "unsold", "autobought"}
+SOLD_OUTCOMES = {"sold", "autobought"}
+BULK_ROLLUP_KEY = "bulk"
+
+# Months that already have a partition, so the check runs once per month
+_ensured_partitions: set[tuple[int, int]] = set()
+
+
+class ClearingPrice(NamedTuple):
+    pokemon: str
+    median: int
+    sales: int
+
+
+class SellThrough(NamedTuple):
+    rarity: str
+    listed: int
+    sold: int
+
+    @property
+    def rate(self) -> float:
+        return self.sold / self.listed if self.listed else 0.0
+
+
+# ❀ Archive ❀
+def result_outcome(auction, reason: str) -> str:
+    if reason == ENDED:
+        return "sold" if auction["highest_bidder_id"] and auction["highest_offer"] else "unsold"
+    return reason
+
+
+async def archive_auction_result(conn, auction, reason: str, bid_count: int):
+    """
+    Stores the result of a deleted auctions row, call inside delete_auction's transaction
+    so an auction is never both gone and unrecorded.
+    """
+    from constants.rarity import get_rarity
+
+    # A normal ending is recorded at its scheduled end, archiving can lag behind it (retries)
+    ended_on = auction["ends_on"] if reason == ENDED else int(time.time())
+    ended_at = datetime.fromtimestamp(ended_on, timezone.utc)
+    outcome = result_outcome(auction, reason)
+    sold = outcome in SOLD_OUTCOMES
+    is_bulk = bool(auction.get("is_bulk"))
+    pokemon = auction["pokemon"].lower()
+    rarity = BULK_ROLLUP_KEY if is_bulk else get_rarity(pokemon)
+    started_on = auction.get("started_on")
+    await conn.execute(
+        """
+        INSERT INTO auction_results (
+            channel_id, host_id, host_name, pokemon, rarity, is_bulk, outcome,
+            winner_id, winner_name, final_price, autobuy, market_value, bid_count,
+            started_on, ended_on, duration_seconds, ended_at
+        )
+        VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15, $16, $17);
+        """,
+        auction["channel_id"],
+        auction["host_id"],
+        auction["host_name"],
+        pokemon,
+        rarity,
+        is_bulk,
+        outcome,
+        auction["highest_bidder_id"] if sold else None,
+        auction["highest_bidder"] if sold else None,
+        auction["highest_offer"] if sold else None,
+        auction["autobuy"],
+        auction["market_value"],
+        bid_count,
+        started_on,
+        ended_on,
+        ended_on - started_on if started_on else None,
+        ended_at,
+    )
+    if outcome not in LISTED_OUTCOMES:
+        return
+    await conn.execute(
+        """
+        INSERT INTO auction_result_daily (pokemon, day, rarity, listed, sold, sold_prices)
+        VALUES ($1, $2, $3, $4, $5, $6)
+        ON CONFLICT (pokemon, day) DO UPDATE SET
+            listed = auction_result_daily.listed + EXCLUDED.listed,
+            sold = auction_result_daily.sold + EXCLUDED.sold,
+            sold_prices = auction_result_daily.sold_prices || EXCLUDED.sold_prices;
+        """,
+        BULK_ROLLUP_KEY if is_bulk else pokemon,
+        ended_at.date(),
+        rarity,
+        1,
+        1 if sold else 0,
+        [auction["highest_offer"]] if sold else [],
+    )
+
+
+async def create_result_partition(conn, year: int, month: int, start: date, end: date):
+    """
+    Creates the partition of one month. Rows of that month already in the default partition
+    are moved into the new table before it is attached, in one transaction.
+    """
+    name = f"auction_results_y{year}m{month:02d}"
+    if await conn.fetchval("SELECT to_regclass($1) IS NOT NULL;", name):
+        return
+    async with conn.transaction():
+        await conn.execute(
+            f"CREATE TABLE {name} (LIKE auction_results INCLUDING DEFAULTS INCLUDING CONSTRAINTS);"
+        )
+        await conn.execute(
+            f"""
+            WITH moved AS (
+                DELETE FROM auction_results_default
+                WHERE ended_at >= '{start}' AND ended_at < '{end}'
+                RETURNING *
+            )
+            INSERT INTO {name} SELECT * FROM moved;
+            """
+        )
+        await conn.execute(
+            f"""
+            ALTER TABLE auction_results ATTACH PARTITION {name}
+            FOR VALUES FROM ('{start}') TO ('{end}');
+            """
+        )
+
+
+@timed_db
+async def ensure_result_partitions(bot: discord.Client, months_ahead: int = 1):
+    """Creates the monthly auction_results partitions of this month and the next ones."""
+    today = datetime.now(timezone.utc).date()
+    year, month = today.year, today.month
+    for _ in range(months_ahead + 1):
+        next_year, next_month = (year + 1, 1) if month == 12 else (year, month + 1)
+        if (year, month) not in _ensured_partitions:
+            try:
+                async with bot.pg_pool.acquire() as conn:
+                    await create_result_partition(
+                        conn,
+                        year,
+                        month,
+                        date(year, month, 1),
+                        date(next_year, next_month, 1),
+                    )
+                _ensured_partitions.add((year, month))
+            except Exception as e:
+                # One bad month must not keep the later ones from being created
+                pretty_log(
+                    "error",
+                    f"Error creating auction_results partition {year}-{month:02d}: {e}",
+                )
+        year, month = next_year, next_month
+
+
+@timed_db
+async def rebuild_result_rollup(bot: discord.Client) -> bool:
+    """Recomputes auction_result_daily from auction_results, for the first deploy or after manual fixes."""
+    try:
+        async with bot.pg_pool.acquire() as conn:
+            async with conn.transaction():
+                await conn.execute("DELETE FROM auction_result_daily;")
+                await conn.execute(
+                    """
+                    INSERT INTO auction_result_daily (pokemon, day, rarity, listed, sold, sold_prices)
+                    SELECT
+                        CASE WHEN is_bulk THEN 'bulk' ELSE pokemon END,
+                        (ended_at AT TIME ZONE 'UTC')::date,
+                        MAX(rarity),
+                        COUNT(*),
+                        COUNT(*) FILTER (WHERE outcome IN ('sold', 'autobought')),
+                        COALESCE(
+                            ARRAY_AGG(final_price) FILTER (WHERE outcome IN ('sold', 'autobought')),
+                            '{}'
+                        )
+                    FROM auction_results
+                    WHERE outcome IN ('sold', 'unsold', 'autobought')
+                    GROUP BY 1, 2;
+                    """
+                )
+        return True
+    except Exception as e:
+        pretty_log("error", f"Error rebuilding auction result rollup: {e}", include_trace=True)
+        return False
+
+
+# ❀ Analytics ❀
+@timed_db
+async def fetch_median_clearing_prices(
+    bot: discord.Client, pokemon_names: list[str], days: int = 30
+) -> dict[str, ClearingPrice]:
+    """Median final price of sold/autobought auctions per Pokémon over the last days, unsold ones excluded."""
+    if not pokemon_names:
+        return {}
+    try:
+        async with bot.pg_pool.acquire() as conn:
+            rows = await conn.fetch(
+                """
+                SELECT pokemon,
+                       percentile_cont(0.5) WITHIN GROUP (ORDER BY price) AS median,
+                       COUNT(*) AS sales
+                FROM auction_result_daily, unnest(sold_prices) AS price
+                WHERE pokemon = ANY($1) AND day >= CURRENT_DATE - $2::int
+                GROUP BY pokemon;
+                """,
+                [name.lower() for name in pokemon_names],
+                days,
+            )
+        return {
+            row["pokemon"]: ClearingPrice(row["pokemon"], int(row["median"]), row["sales"])
+            for row in rows
+        }
+    except Exception as e:
+        pretty_log("error", f"Error fetching median clearing prices: {e}", include_trace=True)
+        return {}
+
+
+async def fetch_median_clearing_price(
+    bot: discord.Client, pokemon: str, days: int = 30
+) -> ClearingPrice | None:
+    return (await fetch_median_clearing_prices(bot, [pokemon], days)).get(pokemon.lower())
+
+
+@timed_db
+async def fetch_sell_through_by_rarity(
+    bot: discord.Client, days: int = 30
+) -> dict[str, SellThrough]:
+    """Listed vs sold auctions per rarity over the last days (stopped and deleted channels don't count)."""
+    try:
+        async with bot.pg_pool.acquire() as conn:
+            rows = await conn.fetch(
+                """
+                SELECT rarity, SUM(listed) AS listed, SUM(sold) AS sold
+                FROM auction_result_daily
+                WHERE day >= CURRENT_DATE - $1::int
+                GROUP BY rarity;
+                """,
+                days,
+            )
+        return {
+            row["rarity"]: SellThrough(row["rarity"], int(row["listed"]), int(row["sold"]))
+            for row in rows
+        }
+    except Exception as e:
+        pretty_log("error", f"Error fetching sell-through by rarity: {e}", include_trace=True)
+        return {}
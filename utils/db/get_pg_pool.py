@@ -34,6 +34,12 @@ class SafePool:
             max_size=self.max_size,
         )
 
+    async def close(self):
+        """Waits for acquired connections to be released, then closes them."""
+        if self._pool:
+            await self._pool.close()
+            self._pool = None
+
     def acquire(self):
         if not self._pool:
             raise RuntimeError("SafePool not connected. Call connect() first.")
@@ -0,0 +1,145 @@
+import asyncio
+
+import asyncpg
+import discord
+
+from utils.logs.metrics import timed_db
+from utils.logs.pretty_log import pretty_log
+
+# SQL SCRIPT
+"""CREATE TABLE guild_config (
+    guild_id BIGINT NOT NULL,
+    key TEXT NOT NULL,
+    ids BIGINT[] NOT NULL,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    PRIMARY KEY (guild_id, key)
+);
+
+CREATE OR REPLACE FUNCTION notify_guild_config() RETURNS trigger AS $$
+BEGIN
+    PERFORM pg_notify('guild_config', COALESCE(NEW.guild_id, OLD.guild_id)::text);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER guild_config_notify
+AFTER INSERT OR UPDATE OR DELETE ON guild_config
+FOR EACH ROW EXECUTE FUNCTION notify_guild_config();"""
+# Keys are listed in constants/guild_config.py, rows override GUILD_CONFIG_DEFAULTS.
+# Editing a row (even from psql) notifies the bot, which reloads that guild's snapshot.
+
+GUILD_CONFIG_CHANNEL = "guild_config"
+
+_listen_conn: asyncpg.Connection | None = None
+_reload_tasks: set[asyncio.Task] = set()
+
+
+@timed_db
+async def fetch_guild_config_rows(
+    bot: discord.Client, guild_id: int | None = None
+) -> list[dict]:
+    """Rows of one guild, or of every guild when guild_id is None. Raises if the read fails."""
+    try:
+        async with bot.pg_pool.acquire() as conn:
+            if guild_id is None:
+                rows = await conn.fetch("SELECT guild_id, key, ids FROM guild_config;")
+            else:
+                rows = await conn.fetch(
+                    "SELECT guild_id, key, ids FROM guild_config WHERE guild_id = $1;",
+                    guild_id,
+                )
+        return [dict(row) for row in rows]
+    except Exception as e:
+        pretty_log("error", f"Error fetching guild config: {e}")
+        raise
+
+
+@timed_db
+async def upsert_guild_config(
+    bot: discord.Client, guild_id: int, key: str, ids: list[int]
+):
+    """Stores the ids of a config key, the NOTIFY trigger reloads the snapshot"""
+    try:
+        async with bot.pg_pool.acquire() as conn:
+            await conn.execute(
+                """
+                INSERT INTO guild_config (guild_id, key, ids)
+                VALUES ($1, $2, $3)
+                ON CONFLICT (guild_id, key) DO UPDATE SET
+                    ids = EXCLUDED.ids,
+                    updated_at = now();
+                """,
+                guild_id,
+                key,
+                list(ids),
+            )
+        pretty_log("db", f"Guild config {key} set for guild {guild_id}: {list(ids)}")
+    except Exception as e:
+        pretty_log("error", f"Error upserting guild config {key} for guild {guild_id}: {e}")
+        raise
+
+
+@timed_db
+async def delete_guild_config(bot: discord.Client, guild_id: int, key: str):
+    """Drops a config key, the guild falls back to the default ids"""
+    try:
+        async with bot.pg_pool.acquire() as conn:
+            await conn.execute(
+                "DELETE FROM guild_config WHERE guild_id = $1 AND key = $2;",
+                guild_id,
+                key,
+            )
+        pretty_log("db", f"Guild config {key} removed for guild {guild_id}")
+    except Exception as e:
+        pretty_log("error", f"Error deleting guild config {key} for guild {guild_id}: {e}")
+        raise
+
+
+# 🌸───────────────────────────────────────────────🌸
+#      LISTEN guild_config (hot reload)
+# 🌸───────────────────────────────────────────────🌸
+async def ensure_guild_config_listener(bot: discord.Client):
+    """
+    Keeps one dedicated connection LISTENing on guild_config, called every central loop tick.
+    After a (re)connect every guild is reloaded, in case a notification was missed.
+    """
+    global _listen_conn
+    if _listen_conn is not None and not _listen_conn.is_closed():
+        return
+
+    pool = getattr(bot, "pg_pool", None)
+    dsn = getattr(pool, "dsn", None)
+    if not dsn:
+        return  # No real Postgres pool, the snapshot is loaded once with the caches
+
+    from utils.cache.guild_config_cache import load_guild_config_cache, reload_guild_config
+
+    def on_notify(conn, pid, channel, payload):
+        try:
+            guild_id = int(payload)
+        except (TypeError, ValueError):
+            return
+        task = asyncio.create_task(reload_guild_config(bot, guild_id))
+        _reload_tasks.add(task)
+        task.add_done_callback(_reload_tasks.discard)
+
+    try:
+        _listen_conn = await asyncpg.connect(dsn=dsn, ssl=pool.ssl_context)
+        await _listen_conn.add_listener(GUILD_CONFIG_CHANNEL, on_notify)
+        pretty_log("db", f"Listening for {GUILD_CONFIG_CHANNEL} changes")
+    except Exception as e:
+        _listen_conn = None
+        pretty_log("error", f"Error starting guild config listener: {e}")
+        return
+    await load_guild_config_cache(bot)
+
+
+async def close_guild_config_listener():
+    global _listen_conn
+    if _listen_conn is None:
+        return
+    try:
+        await _listen_conn.close()
+    except Exception as e:
+        pretty_log("error", f"Error closing guild config listener: {e}")
+    _listen_conn = None
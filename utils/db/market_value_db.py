@@ -8,7 +8,8 @@ import discord
 from discord import app_commands
 
 from utils.cache.cache_list import market_value_cache, pokemon_list_cache
-from utils.logs.debug_log import debug_log, enable_debug
+from utils.logs.debug_log import debug_log, enable_debug, get_debug_logger
+from utils.logs.metrics import timed_db
 from utils.logs.pretty_log import pretty_log
 
 
@@ -36,6 +37,15 @@ def rebuild_pokemon_autocomplete_index() -> None:
     )
 
 
+def on_market_value_cache_changed(pokemon_name: str) -> None:
+    """Keeps caches derived from market_value_cache in sync after a write."""
+    from utils.cache.market_value_coverage import mark_market_value_present
+    from utils.essentials.auction_rules import invalidate_auction_rule
+
+    invalidate_auction_rule(pokemon_name)
+    mark_market_value_present(pokemon_name)
+
+
 def format_display_name_for_autocomplete(raw_name: str) -> str:
     SPECIAL_CASES = {
         "jangmo-o": "Jangmo-o",
@@ -65,6 +75,9 @@ def format_display_name_for_autocomplete(raw_name: str) -> str:
 
 
 # ==================== 🌟 Autocomplete Functions ==================== #
+autocomplete_log = get_debug_logger(__name__, "pokemon_autocomplete")
+
+
 async def pokemon_autocomplete(
     interaction: discord.Interaction, current: str
 ) -> list[app_commands.Choice[str]]:
@@ -73,14 +86,14 @@ async def pokemon_autocomplete(
     Matches both names and dex numbers.
     Uses a precomputed autocomplete index from pokemon_list_cache.
     """
-    debug_log(f"Autocomplete input: '{current}'")
+    autocomplete_log("Autocomplete input: '{}'", current)
 
     # Recover gracefully if autocomplete gets called before cache load.
     if not POKEMON_AUTOCOMPLETE_INDEX and pokemon_list_cache:
         rebuild_pokemon_autocomplete_index()
 
     current_simple = normalize_pokemon_search_text(current or "")
-    debug_log(f"Normalized input: '{current_simple}'")
+    autocomplete_log("Normalized input: '{}'", current_simple)
 
     results_with_name: list[tuple[str, app_commands.Choice[str]]] = []
     seen = set()
@@ -90,9 +103,9 @@ async def pokemon_autocomplete(
     if current_simple.isdigit():
         try:
             dex_query = int(current_simple)
-            debug_log(f"Parsed dex_query: {dex_query}")
+            autocomplete_log("Parsed dex_query: {}", dex_query)
         except ValueError:
-            debug_log("Failed to parse dex_query")
+            autocomplete_log("Failed to parse dex_query")
             dex_query = None
 
     for name, norm, display_name, dex in POKEMON_AUTOCOMPLETE_INDEX:
@@ -118,12 +131,12 @@ async def pokemon_autocomplete(
                 seen.add(display)
 
     if not results_with_name:
-        debug_log("No matches found")
+        autocomplete_log("No matches found")
         results_with_name.append(
             ("", app_commands.Choice(name="No matches found", value=current or ""))
         )
 
-    debug_log(f"Returning {len(results_with_name)} results")
+    autocomplete_log("Returning {} results", len(results_with_name))
     # Sort alphabetically by display name
     results_with_name.sort(key=lambda x: x[0])
     return [choice for _, choice in results_with_name]
@@ -152,6 +165,7 @@ def build_pokemon_list_from_cache():
     return pokemon_list_cache
 
 
+@timed_db
 async def update_rarity(bot, pokemon_name: str, rarity: str):
     """
     Update the rarity for a Pokémon in the market value table.
@@ -266,6 +280,7 @@ def fetch_image_link_cache(pokemon_name: str):
     return None
 
 
+@timed_db
 async def fetch_image_link_from_db(bot, pokemon_name: str):
     """
     Get image link for a Pokémon from database.
@@ -286,6 +301,7 @@ async def fetch_image_link_from_db(bot, pokemon_name: str):
         return None
 
 
+@timed_db
 async def fetch_dex_number_from_db(bot, pokemon_name: str):
     """
     Get dex number for a Pokémon from database.
@@ -309,6 +325,7 @@ async def fetch_dex_number_from_db(bot, pokemon_name: str):
 # --------------------
 #  Upsert market value data
 # --------------------
+@timed_db
 async def set_market_value(
     bot,
     pokemon_name: str,
@@ -379,6 +396,7 @@ def fetch_image_link_cache(pokemon_name: str):
     return None
 
 
+@timed_db
 async def update_market_value_via_listener(
     bot,
     pokemon_name: str,
@@ -511,6 +529,7 @@ async def update_market_value_via_listener(
                     + (f", image_link set" if image_link is not None else "")
                     + (f", is_exclusive set" if is_exclusive is not None else ""),
                 )
+            on_market_value_cache_changed(pokemon_name)
         pretty_log(
             tag="db",
             message=f"Updated market value for {pokemon_name} via listener: lowest_market={lowest_market:,}, listing_seen={listing_seen}, current_listing={current_listing:,}"
@@ -524,6 +543,7 @@ async def update_market_value_via_listener(
         )
 
 
+@timed_db
 async def update_dex_number(bot, pokemon_name: str, dex_number: int):
     """
     Update the dex number for a Pokémon in the market value table.
@@ -564,6 +584,7 @@ async def update_dex_number(bot, pokemon_name: str, dex_number: int):
         )
 
 
+@timed_db
 async def upsert_image_link(
     bot, pokemon_name: str, image_link: str, is_exclusive: bool = None
 ):
@@ -612,6 +633,7 @@ async def upsert_image_link(
                     "image_link": image_link,
                     "is_exclusive": is_exclusive if is_exclusive is not None else False,
                 }
+            on_market_value_cache_changed(pokemon_name)
 
         pretty_log(
             tag="db",
@@ -630,6 +652,7 @@ async def upsert_image_link(
         )
 
 
+@timed_db
 async def update_image_link(
     bot, pokemon_name: str, image_link: str, is_exclusive: bool = None
 ):
@@ -670,6 +693,7 @@ async def update_image_link(
                 market_value_cache[pokemon_name]["image_link"] = image_link
                 if is_exclusive is not None:
                     market_value_cache[pokemon_name]["is_exclusive"] = is_exclusive
+            on_market_value_cache_changed(pokemon_name)
 
         pretty_log(
             tag="db",
@@ -688,6 +712,7 @@ async def update_image_link(
         )
 
 
+@timed_db
 async def update_market_value(
     bot,
     pokemon_name: str,
@@ -741,6 +766,7 @@ async def update_market_value(
                     "image_link": image_link if image_link is not None else None,
                     "is_exclusive": is_exclusive if is_exclusive is not None else False,
                 }
+            on_market_value_cache_changed(pokemon_name)
 
         pretty_log(
             tag="db",
@@ -754,6 +780,7 @@ async def update_market_value(
         )
 
 
+@timed_db
 async def update_is_exclusive(
     bot, pokemon_name: str, is_exclusive: bool, image_link: str = None
 ):
@@ -790,6 +817,7 @@ async def update_is_exclusive(
                 market_value_cache[pokemon_name]["is_exclusive"] = is_exclusive
                 if image_link is not None:
                     market_value_cache[pokemon_name]["image_link"] = image_link
+            on_market_value_cache_changed(pokemon_name)
 
         pretty_log(
             tag="db",
@@ -807,6 +835,7 @@ async def update_is_exclusive(
 # --------------------
 #  Fetch single Pokémon market value
 # --------------------
+@timed_db
 async def fetch_market_value(bot, pokemon_name: str) -> dict | None:
     """
     Get market value data for a specific Pokémon.
@@ -829,6 +858,7 @@ async def fetch_market_value(bot, pokemon_name: str) -> dict | None:
 # --------------------
 #  Fetch all market values
 # --------------------
+@timed_db
 async def fetch_all_market_values(bot) -> list[dict]:
     """
     Return all market value data as list of dicts.
@@ -850,6 +880,7 @@ async def fetch_all_market_values(bot) -> list[dict]:
 # --------------------
 #  Fetch high value Pokémon (above threshold)
 # --------------------
+@timed_db
 async def fetch_high_value_pokemon(bot, min_price: int = 100000) -> list[dict]:
     """
     Get Pokémon with true_lowest above specified threshold.
@@ -872,6 +903,7 @@ async def fetch_high_value_pokemon(bot, min_price: int = 100000) -> list[dict]:
 # --------------------
 #  Delete old market data
 # --------------------
+@timed_db
 async def cleanup_old_market_data(bot, days_old: int = 30) -> bool:
     """
     Delete market value records older than specified days.
@@ -900,6 +932,7 @@ async def cleanup_old_market_data(bot, days_old: int = 30) -> bool:
 # --------------------
 #  Sync cache to database
 # --------------------
+@timed_db
 async def sync_market_cache_to_db(bot, market_cache: dict):
     """
     Sync entire market value cache to database.
@@ -953,6 +986,7 @@ async def sync_market_cache_to_db(bot, market_cache: dict):
         return False
 
 
+@timed_db
 async def check_and_load_market_cache(bot) -> dict:
     """
     Check if market value cache is loaded, if not load from database.
@@ -970,14 +1004,21 @@ async def check_and_load_market_cache(bot) -> dict:
 # --------------------
 #  Load database into cache
 # --------------------
-async def load_market_cache_from_db(bot) -> dict:
+@timed_db
+async def load_market_cache_from_db(bot, since: datetime | None = None) -> dict:
     """
     Load all market value data from database into cache format.
+    With since, only the rows updated after it (warm start from a cache snapshot).
     """
     try:
         cache = {}
         async with bot.pg_pool.acquire() as conn:
-            rows = await conn.fetch("SELECT * FROM market_value")
+            if since is None:
+                rows = await conn.fetch("SELECT * FROM market_value")
+            else:
+                rows = await conn.fetch(
+                    "SELECT * FROM market_value WHERE last_updated > $1", since
+                )
 
             for row in rows:
                 cache[row["pokemon_name"]] = {
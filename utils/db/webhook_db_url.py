@@ -1,5 +1,6 @@
 import discord
 
+from utils.logs.metrics import timed_db
 from utils.logs.pretty_log import pretty_log
 
 """CREATE TABLE webhook_url (
@@ -11,6 +12,7 @@ from utils.logs.pretty_log import pretty_log
 );"""
 
 
+@timed_db
 async def upsert_webhook_url(
     bot: discord.Client,
     channel: discord.TextChannel,
@@ -47,6 +49,7 @@ async def upsert_webhook_url(
                 bot_id=bot_id,
                 channel_id=channel_id,
                 url=url,
+                channel_name=channel_name,
             )
     except Exception as e:
         pretty_log(
@@ -56,6 +59,7 @@ async def upsert_webhook_url(
         )
 
 
+@timed_db
 async def fetch_all_webhook_urls(bot: discord.Client):
     bot_id = bot.user.id
     try:
@@ -91,6 +95,7 @@ async def fetch_all_webhook_urls(bot: discord.Client):
         return []
 
 
+@timed_db
 async def remove_webhook_url(
     bot: discord.Client,
     channel: discord.TextChannel,
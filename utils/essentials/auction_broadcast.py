@@ -1,22 +1,30 @@
 import discord
 
+from constants.guild_config import AUCTION_BROADCAST_CHANNEL
+from utils.cache.guild_config_cache import get_guild_config
 from utils.db.auction_db import update_broadcast_msg_id
 from utils.logs.pretty_log import pretty_log
-from constants.grand_line_auction_constants import GRAND_LINE_AUCTION_TEXT_CHANNELS
+
 TEST_BROADCAST_CHANNEL_ID = 1469896953709068550
-BROADCAST_CHANNEL_ID = GRAND_LINE_AUCTION_TEXT_CHANNELS.auction_broadcast
 
 
 async def broadcast_auction(
     bot: discord.Client,
     guild: discord.Guild,
     embed: discord.Embed,
+    auction_channel_id: int | None = None,
 ):
-    broadcast_channel = guild.get_channel(BROADCAST_CHANNEL_ID)
+    broadcast_channel_id = get_guild_config(guild.id).first_id(AUCTION_BROADCAST_CHANNEL)
+    broadcast_channel = (
+        guild.get_channel(broadcast_channel_id) if broadcast_channel_id else None
+    )
     # Send to broadcast channel if it exists
     if broadcast_channel:
         auction_msg = await broadcast_channel.send(embed=embed)
-        await update_broadcast_msg_id(bot, auction_msg.id, auction_msg.channel.id)
+        if auction_channel_id:
+            await update_broadcast_msg_id(
+                bot, channel_id=auction_channel_id, broadcast_msg_id=auction_msg.id
+            )
         # publish message
         try:
             await auction_msg.publish()
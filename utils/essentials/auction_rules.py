@@ -0,0 +1,175 @@
+# 🌸───────────────────────────────────────────────🌸
+#        Auction Rules (increment / duration tables)
+# 🌸───────────────────────────────────────────────🌸
+from bisect import bisect_left
+from typing import NamedTuple
+
+from constants.rarity import RARITY_MAP, get_rarity, is_mon_exclusive
+from utils.autocomplete.pokemon_autocomplete import format_price_w_coin
+from utils.cache.cache_list import auction_rule_cache, market_value_cache
+from utils.essentials.minimum_increment import (
+    LOW_RARITIES,
+    MIN_AUCTION_VALUE,
+    RARITIES_WITH_VARRYING_INCREMENT,
+    format_names_for_market_value_lookup,
+)
+from utils.logs.debug_log import get_debug_logger
+
+DEFAULT_INCREMENT = 50_000
+LOW_RARITY_EXCLUSIVE_INCREMENT = 30_000
+LOW_RARITY_BULK_INCREMENT = 20_000
+
+# 🎀 Breakpoint tables: value <= bounds[i] -> values[i], above the last bound -> values[-1]
+# 400k to 1m = 1 hour, 1.001m to 5m = 2 hours, 5.001m to 20m = 3 hours,
+# 20.001m to 150m = 4 hours, above 150m = 5 hours
+DURATION_BOUNDS = [MIN_AUCTION_VALUE - 1, 1_000_000, 5_000_000, 20_000_000, 150_000_000]
+DURATION_SECONDS = [0, 3_600, 7_200, 10_800, 14_400, 18_000]
+
+# Golden / Gigantamax rarities: up to 100m = 250k, above 100m = 500k
+VARYING_INCREMENT_BOUNDS = [100_000_000]
+VARYING_INCREMENTS = [250_000, 500_000]
+
+NO_MARKET_VALUE_ERROR = "No market value yet, Ask staff to set a market value for this Pokemon"
+
+rules_log = get_debug_logger(__name__, "evaluate_auction_rule")
+
+
+class AuctionRule(NamedTuple):
+    rarity: str
+    market_value: int
+    min_increment: int | None
+    max_duration_seconds: int
+    error: str | None
+
+
+def _lookup(bounds: list[int], values: list[int], value: int) -> int:
+    return values[bisect_left(bounds, value)]
+
+
+def _build_increment_tables() -> dict[str, tuple[list[int], list[int]]]:
+    tables = {}
+    for rarity, data in RARITY_MAP.items():
+        lowered = rarity.lower()
+        if any(r in lowered for r in RARITIES_WITH_VARRYING_INCREMENT):
+            tables[lowered] = (VARYING_INCREMENT_BOUNDS, VARYING_INCREMENTS)
+        else:
+            tables[lowered] = ([], [data.get("increment value", DEFAULT_INCREMENT)])
+    return tables
+
+
+INCREMENT_TABLES = _build_increment_tables()
+
+
+def _increment_table(lowered_rarity: str) -> tuple[list[int], list[int]]:
+    table = INCREMENT_TABLES.get(lowered_rarity)
+    if table is None:
+        # Unknown rarity key, same substring rule the old if/elif chain used
+        if any(r in lowered_rarity for r in RARITIES_WITH_VARRYING_INCREMENT):
+            table = (VARYING_INCREMENT_BOUNDS, VARYING_INCREMENTS)
+        else:
+            table = ([], [DEFAULT_INCREMENT])
+        INCREMENT_TABLES[lowered_rarity] = table
+    return table
+
+
+def max_duration_for_value(value: int) -> int:
+    """Maximum auction duration in seconds for a market value, 0 if below the auction minimum."""
+    return _lookup(DURATION_BOUNDS, DURATION_SECONDS, value)
+
+
+# ❀ Rule evaluation ❀
+def evaluate_auction_rule(
+    pokemon_name: str,
+    rarity: str,
+    market_value: int,
+    is_exclusive: bool,
+) -> AuctionRule:
+    """Increment, max duration and validation error for a single Pokémon auction."""
+    lowered_rarity = rarity.lower()
+    max_duration = max_duration_for_value(market_value)
+
+    if market_value < MIN_AUCTION_VALUE:
+        error = f"{pokemon_name}'s market value is {format_price_w_coin(market_value)}, Auction minimum value is {format_price_w_coin(MIN_AUCTION_VALUE)}"
+        return AuctionRule(rarity, market_value, 0, max_duration, error)
+
+    if lowered_rarity in LOW_RARITIES:
+        if is_exclusive:
+            return AuctionRule(
+                rarity, market_value, LOW_RARITY_EXCLUSIVE_INCREMENT, max_duration, None
+            )
+        error = "Pokemon is not auctionable because it's not exclusive and below Legendary rarity."
+        return AuctionRule(rarity, market_value, None, max_duration, error)
+
+    bounds, values = _increment_table(lowered_rarity)
+    increment = _lookup(bounds, values, market_value)
+    rules_log(
+        "{} ({}) value={:,} increment={:,}", pokemon_name, rarity, market_value, increment
+    )
+    return AuctionRule(rarity, market_value, increment, max_duration, None)
+
+
+def evaluate_bulk_auction_rule(
+    total_bulk_value: int, rarity: str, any_exclusive: bool
+) -> AuctionRule:
+    """Increment, max duration and validation error for a bulk auction."""
+    lowered_rarity = rarity.lower()
+    max_duration = max_duration_for_value(total_bulk_value)
+
+    if total_bulk_value < MIN_AUCTION_VALUE:
+        return AuctionRule(
+            rarity,
+            total_bulk_value,
+            0,
+            max_duration,
+            "Pokemon value is below minimum auction value",
+        )
+
+    if lowered_rarity in LOW_RARITIES:
+        increment = (
+            LOW_RARITY_EXCLUSIVE_INCREMENT if any_exclusive else LOW_RARITY_BULK_INCREMENT
+        )
+        return AuctionRule(rarity, total_bulk_value, increment, max_duration, None)
+
+    bounds, values = _increment_table(lowered_rarity)
+    increment = _lookup(bounds, values, total_bulk_value)
+    return AuctionRule(rarity, total_bulk_value, increment, max_duration, None)
+
+
+# ❀ Cached lookups ❀
+def get_auction_rule(pokemon: str, rarity: str) -> AuctionRule:
+    """
+    Pre-evaluated rule for a Pokémon, evaluated and cached on a miss.
+    Pokémon without a market value get an error rule that is not cached.
+    """
+    name = format_names_for_market_value_lookup(pokemon)
+    rule = auction_rule_cache.get(name)
+    if rule is not None and rule.rarity == rarity:
+        return rule
+
+    market_data = market_value_cache.get(name)
+    market_value = market_data.get("lowest_market") if market_data else None
+    if market_value is None:
+        return AuctionRule(rarity, 0, 0, 0, NO_MARKET_VALUE_ERROR)
+    rule = evaluate_auction_rule(name, rarity, market_value, is_mon_exclusive(name))
+    auction_rule_cache[name] = rule
+    return rule
+
+
+def invalidate_auction_rule(pokemon_name: str):
+    auction_rule_cache.pop(pokemon_name.lower(), None)
+
+
+def rebuild_auction_rule_cache() -> int:
+    """Evaluates the rules for every Pokémon in market_value_cache, returns number of rules built."""
+    rules = {}
+    for name, data in market_value_cache.items():
+        rarity = get_rarity(name)
+        market_value = data.get("lowest_market")
+        if not rarity or market_value is None:
+            continue
+        rules[name] = evaluate_auction_rule(
+            name, rarity, market_value, is_mon_exclusive(name)
+        )
+    auction_rule_cache.clear()
+    auction_rule_cache.update(rules)
+    return len(rules)
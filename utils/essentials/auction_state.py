@@ -0,0 +1,76 @@
+# 🌸───────────────────────────────────────────────🌸
+#      Auction State (active → ending → announced → archived)
+# 🌸───────────────────────────────────────────────🌸
+import time
+
+import discord
+
+from utils.cache.cache_list import auction_cache
+from utils.logs.metrics import METRICS
+
+# active    : running, takes bids
+# ending    : claimed by an ender, the ended message may or may not be out yet
+# announced : ended message posted, row still there until archived
+# archived  : row deleted (bid ledger closed), nothing left to do
+ACTIVE = "active"
+ENDING = "ending"
+ANNOUNCED = "announced"
+ARCHIVED = "archived"
+
+NEXT_STATE = {ACTIVE: ENDING, ENDING: ANNOUNCED, ANNOUNCED: ARCHIVED}
+# A transition older than this is considered abandoned and the reconciler takes it over
+ENDING_LEASE_SECONDS = 120
+
+METRICS.describe("auction_state_transitions_total", "Auction state changes, by target state")
+
+
+def auction_state(auction) -> str:
+    """State of an auction row or auction_cache entry, rows from before the column are active."""
+    return auction.get("state") or ACTIVE
+
+
+def is_auction_ending(channel_id: int) -> bool:
+    auction = auction_cache.get(channel_id)
+    return auction is not None and auction_state(auction) != ACTIVE
+
+
+async def advance_auction_state(
+    bot: discord.Client,
+    channel_id: int,
+    current: str,
+    target: str,
+) -> bool:
+    """
+    Moves the auction one step forward in the DB (compare-and-set) and mirrors it in the cache.
+    False means someone else moved it first or the write failed, the caller stops either way.
+    """
+    from utils.db.auction_db import transition_auction_state
+
+    if NEXT_STATE.get(current) != target or target == ARCHIVED:
+        raise ValueError(f"Invalid auction transition {current} -> {target}")
+    moved = await transition_auction_state(
+        bot, channel_id, current, target, changed_at=int(time.time())
+    )
+    if moved:
+        METRICS.inc("auction_state_transitions_total", state=target)
+        cached = auction_cache.get(channel_id)
+        if cached is not None:
+            cached["state"] = target
+    return moved
+
+
+async def take_over_auction_state(
+    bot: discord.Client, channel_id: int, current: str
+) -> bool:
+    """Renews the lease of a stuck ending/announced auction, only one worker gets it."""
+    from utils.db.auction_db import transition_auction_state
+
+    now = int(time.time())
+    return await transition_auction_state(
+        bot,
+        channel_id,
+        current,
+        current,
+        changed_at=now,
+        lease_before=now - ENDING_LEASE_SECONDS,
+    )
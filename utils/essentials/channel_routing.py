@@ -0,0 +1,85 @@
+# 🌸───────────────────────────────────────────────🌸
+#      Channel Routing (which categories take a listing)
+# 🌸───────────────────────────────────────────────🌸
+from typing import NamedTuple
+
+import discord
+
+from constants.rarity import RARITY_MAP
+from utils.cache.cache_list import channel_route_cache
+
+BULK_CATEGORY_NAME = "Bulk Auction"
+
+
+class ChannelRoute(NamedTuple):
+    allow_any: bool
+    category_ids: frozenset[int]
+    suggestion: str | None  # prerendered error listing the right categories
+
+
+def _category_names(guild: discord.Guild | None) -> dict[int, str]:
+    if guild is None:
+        return {}
+    return {category.id: category.name.title() for category in guild.categories}
+
+
+def build_channel_route(
+    rarity: str,
+    is_exclusive: bool,
+    is_bulk: bool,
+    is_speed: bool,
+    category_names: dict[int, str],
+) -> ChannelRoute:
+    # Speed auctions have their own channel and take every rarity
+    if is_speed:
+        return ChannelRoute(True, frozenset(), None)
+
+    category_ids = list(RARITY_MAP.get(rarity, {}).get("category", []))
+    if is_exclusive:
+        category_ids.extend(RARITY_MAP.get("exclusive", {}).get("category", []))
+    if is_bulk:
+        category_ids.extend(RARITY_MAP.get("bulk", {}).get("category", []))
+
+    names = [category_names.get(cat_id, str(cat_id).title()) for cat_id in category_ids]
+    # Ensure 'Bulk Auction' is always first if present
+    if BULK_CATEGORY_NAME in names:
+        names.remove(BULK_CATEGORY_NAME)
+        names.insert(0, BULK_CATEGORY_NAME)
+    suggestion = (
+        "❤️‍🩹 You can't auction this Pokémon in this channel. Please use one of the following categories for this Pokémon:\n"
+        + "\n".join(f"> - {name}" for name in names)
+        + "\n."
+    )
+    return ChannelRoute(False, frozenset(category_ids), suggestion)
+
+
+def rebuild_channel_routes(guild: discord.Guild | None) -> int:
+    """Builds the route of every rarity × exclusive × bulk × speed combo, returns the number of routes."""
+    category_names = _category_names(guild)
+    routes = {}
+    for rarity in RARITY_MAP:
+        for is_exclusive in (False, True):
+            for is_bulk in (False, True):
+                for is_speed in (False, True):
+                    key = (rarity, is_exclusive, is_bulk, is_speed)
+                    routes[key] = build_channel_route(*key, category_names)
+    channel_route_cache.clear()
+    channel_route_cache.update(routes)
+    return len(routes)
+
+
+def get_channel_route(
+    guild: discord.Guild | None,
+    rarity: str,
+    is_exclusive: bool,
+    is_bulk: bool = False,
+    is_speed: bool = False,
+) -> ChannelRoute:
+    key = (rarity, bool(is_exclusive), bool(is_bulk), bool(is_speed))
+    route = channel_route_cache.get(key)
+    if route is None:
+        # Rarity outside RARITY_MAP or table not built yet
+        route = channel_route_cache[key] = build_channel_route(
+            *key, _category_names(guild)
+        )
+    return route
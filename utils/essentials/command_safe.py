@@ -1,10 +1,12 @@
 import inspect
+import time
 import traceback
 
 import discord
 from discord.ext import commands
 
 from constants.grand_line_auction_constants import YUKI_USER_ID
+from utils.logs.metrics import METRICS
 from utils.logs.pretty_log import pretty_log
 
 
@@ -25,6 +27,7 @@ async def run_command_safe(
     ✅ Works with any combination of parameters (member, role, etc.).
     ✅ Logs trigger, success, and error messages with pretty_log.
     ✅ Sends ephemeral error message if something goes wrong (skips message for Yuki).
+    ✅ Records command_latency_ms / command_total per command.
     """
 
     target = ""
@@ -35,6 +38,7 @@ async def run_command_safe(
         if isinstance(first_arg, discord.Member):
             target = f" for {first_arg}"
 
+    start = time.perf_counter()
     try:
         pretty_log(
             "info",
@@ -44,12 +48,14 @@ async def run_command_safe(
         # 🔹 Call the actual command function
         await command_func(bot=bot, interaction=interaction, *args, **kwargs)
 
+        METRICS.inc("command_total", command=slash_cmd_name, outcome="ok")
         pretty_log(
             "success",
             f"✅ /{slash_cmd_name} completed{target}",
         )
     #
     except Exception as e:
+        METRICS.inc("command_total", command=slash_cmd_name, outcome="error")
         # Include who triggered the command in the traceback log
         tb_str = "".join(traceback.format_exception(type(e), e, e.__traceback__))
         user_info = (
@@ -75,3 +81,9 @@ async def run_command_safe(
                     "warn",
                     f"⚠️ Failed to notify {interaction.user}",
                 )
+    finally:
+        METRICS.observe(
+            "command_latency_ms",
+            (time.perf_counter() - start) * 1000,
+            command=slash_cmd_name,
+        )
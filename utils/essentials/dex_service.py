@@ -0,0 +1,80 @@
+# 🌸───────────────────────────────────────────────🌸
+#        Dex Service (name <-> dex number)
+# 🌸───────────────────────────────────────────────🌸
+from typing import Iterable, NamedTuple
+
+from constants.weakness_chart import weakness_chart as WEAKNESS_CHART
+from utils.logs.metrics import METRICS
+
+METRICS.describe("dex_lookup_misses_total", "Pokémon names without a dex number")
+
+# "♀" / "♂" -> "-f" / "-m", "mega x" / "gigantamax x" (also shiny) -> "mega-x" / "gigantamax-x"
+_GENDER_TABLE = str.maketrans({"♀": "-f", "♂": "-m"})
+
+
+class DexIndex(NamedTuple):
+    name_to_dex: dict[str, int]
+    # dex number -> every chart name with that number (forms, shiny, golden), index 0 unused
+    dex_to_names: list[tuple[str, ...]]
+
+
+def normalize_dex_name(pokemon_name: str) -> str:
+    name = pokemon_name.lower()
+    # Only pay for the rewrites when the name needs them, most names don't
+    if not name.isascii():
+        name = name.translate(_GENDER_TABLE)
+    if "mega " in name:
+        name = name.replace("mega ", "mega-")
+    if "gigantamax " in name:
+        name = name.replace("gigantamax ", "gigantamax-")
+    return name
+
+
+def _build_dex_index() -> DexIndex:
+    name_to_dex = {}
+    for name, data in WEAKNESS_CHART.items():
+        dex = data.get("dex")
+        if dex:
+            name_to_dex[name] = int(dex)  # "0006" -> 6
+
+    names_by_dex: list[list[str]] = [[] for _ in range(max(name_to_dex.values(), default=0) + 1)]
+    for name, dex in name_to_dex.items():
+        names_by_dex[dex].append(name)
+    return DexIndex(name_to_dex, [tuple(sorted(names)) for names in names_by_dex])
+
+
+_dex_index: DexIndex | None = None
+
+
+def get_dex_index() -> DexIndex:
+    # Built on first use, the weakness chart is only walked once
+    global _dex_index
+    if _dex_index is None:
+        _dex_index = _build_dex_index()
+    return _dex_index
+
+
+def get_dex_number(pokemon_name: str) -> int | None:
+    """Dex number of a Pokémon (any form), None when unknown"""
+    dex = get_dex_index().name_to_dex.get(normalize_dex_name(pokemon_name))
+    if dex is None:
+        METRICS.inc("dex_lookup_misses_total")
+    return dex
+
+
+def get_dex_numbers(pokemon_names: Iterable[str]) -> list[int | None]:
+    """Batch version of get_dex_number, one index lookup per name and one metric update"""
+    lookup = get_dex_index().name_to_dex.get
+    dex_numbers = [lookup(normalize_dex_name(name)) for name in pokemon_names]
+    misses = dex_numbers.count(None)
+    if misses:
+        METRICS.inc("dex_lookup_misses_total", misses)
+    return dex_numbers
+
+
+def get_names_by_dex(dex_number: int) -> tuple[str, ...]:
+    """Every normalized name (all forms) sharing a dex number"""
+    dex_to_names = get_dex_index().dex_to_names
+    if 0 < dex_number < len(dex_to_names):
+        return dex_to_names[dex_number]
+    return ()
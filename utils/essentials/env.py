@@ -0,0 +1,20 @@
+# 🌸───────────────────────────────────────────────🌸
+#        Env (settings read at call time)
+# 🌸───────────────────────────────────────────────🌸
+import os
+
+from dotenv import load_dotenv
+
+_dotenv_loaded = False
+
+
+def get_env(name: str, default: str | None = None) -> str | None:
+    """
+    Reads a setting when it is used instead of at import. main.py only loads .env after
+    every module is imported, so module-level os.getenv() calls would miss its values.
+    """
+    global _dotenv_loaded
+    if not _dotenv_loaded:
+        load_dotenv()
+        _dotenv_loaded = True
+    return os.getenv(name, default)
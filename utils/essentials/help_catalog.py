@@ -0,0 +1,166 @@
+# 🌸───────────────────────────────────────────────🌸
+#      Help Catalog (pre-rendered /commands pages)
+# 🌸───────────────────────────────────────────────🌸
+from typing import NamedTuple
+
+import discord
+from discord import app_commands
+from discord.ext import commands
+
+from constants.aesthetic import Dividers, Thumbnails
+from constants.grand_line_auction_constants import DEFAULT_EMBED_COLOR
+from utils.cache.cache_list import help_catalog_cache
+from utils.logs.pretty_log import pretty_log
+
+STAFF_THUMBNAIL = Thumbnails.pink_butterfly
+START_THUMBNAIL = Thumbnails.pink_flower
+PUBLIC_THUMBNAIL = Thumbnails.pink_cupcake
+PUBLIC_EMOJI = "🎀"
+STAFF_EMOJI = "🧁"
+MAIN_DIVIDER = Dividers.pink_flowers
+TITLE_EMOJI = "🌸"
+COMMANDS_PER_PAGE = 6
+# 🍭──────────────────────────────
+#   🎀 Category Settings
+# 🍭──────────────────────────────
+CATEGORY_CONFIG = {
+    "Public": {
+        "emoji": PUBLIC_EMOJI,
+        "label": "Public",
+        "color": 0xECBDC4,
+        "thumbnail": PUBLIC_THUMBNAIL,
+    },
+    "Staff": {
+        "emoji": STAFF_EMOJI,
+        "label": "Staff",
+        "color": 0xF4589A,
+        "thumbnail": STAFF_THUMBNAIL,
+    },
+}
+# Categories each permission tier can see, Owner tools are never listed
+TIER_CATEGORIES = {
+    "public": ("Public",),
+    "staff": ("Public", "Staff"),
+}
+
+
+class HelpEntry(NamedTuple):
+    full_name: str
+    description: str
+    category: str
+
+
+class HelpTier(NamedTuple):
+    fingerprint: tuple
+    home: discord.Embed  # without author, set per user
+    category_lines: list[str]
+    pages: dict[str, list[discord.Embed]]
+
+
+# 💠───────────────────────────────────────────────────────────────
+# [🧩 HELPER] Flatten commands and include group prefixes
+# ────────────────────────────────────────────────────────────────
+def flatten_commands(commands_list, parent_name="") -> list[HelpEntry]:
+    flattened = []
+    for cmd in commands_list:
+        if isinstance(cmd, app_commands.Group):
+            new_parent = f"{parent_name} {cmd.name}".strip()
+            flattened.extend(flatten_commands(cmd.commands, new_parent))
+        else:
+            flattened.append(
+                HelpEntry(
+                    full_name=f"/{parent_name} {cmd.name}" if parent_name else f"/{cmd.name}",
+                    description=cmd.description or "No description",
+                    category=(getattr(cmd, "extras", None) or {}).get("category", "Public"),
+                )
+            )
+    return flattened
+
+
+def cogs_fingerprint(bot: commands.Bot) -> tuple:
+    """Changes whenever a cog is loaded, unloaded or reloaded (new cog instance)"""
+    return tuple(id(cog) for cog in bot.cogs.values())
+
+
+def render_category_pages(category: str, entries: list[HelpEntry]) -> list[discord.Embed]:
+    cfg = CATEGORY_CONFIG[category]
+    max_page = max(0, (len(entries) - 1) // COMMANDS_PER_PAGE)
+    pages = []
+    for page in range(max_page + 1):
+        embed = discord.Embed(
+            title=f"{cfg['emoji']} {cfg['label']} Commands",
+            color=cfg["color"],
+        )
+        if cfg.get("thumbnail"):
+            embed.set_thumbnail(url=cfg["thumbnail"])
+        start = page * COMMANDS_PER_PAGE
+        for entry in entries[start : start + COMMANDS_PER_PAGE]:
+            embed.add_field(name=entry.full_name, value=entry.description, inline=False)
+        embed.set_image(url=MAIN_DIVIDER)
+        embed.set_footer(
+            text=f"📄 Page {page + 1} of {max_page + 1} • 🌷 {len(entries)} commands"
+        )
+        pages.append(embed)
+    return pages
+
+
+def render_home(category_lines: list[str]) -> discord.Embed:
+    embed = discord.Embed(
+        title=f"{TITLE_EMOJI} Command Categories",
+        description=(
+            "Choose a command group by clicking the buttons below! 🌷\n\n"
+            + "\n".join(category_lines)
+        ),
+        color=DEFAULT_EMBED_COLOR,
+    )
+    embed.set_image(url=MAIN_DIVIDER)
+    embed.set_thumbnail(url=START_THUMBNAIL)
+    return embed
+
+
+def rebuild_help_catalog(bot: commands.Bot) -> int:
+    """Walks the command tree once and renders the pages of every tier, returns the command count"""
+    entries = flatten_commands(bot.tree.get_commands())
+    by_category: dict[str, list[HelpEntry]] = {category: [] for category in CATEGORY_CONFIG}
+    for entry in entries:
+        if entry.category in by_category:
+            by_category[entry.category].append(entry)
+
+    fingerprint = cogs_fingerprint(bot)
+    tiers = {}
+    for tier, categories in TIER_CATEGORIES.items():
+        pages = {}
+        category_lines = []
+        for category in categories:
+            if not by_category[category]:
+                continue
+            pages[category] = render_category_pages(category, by_category[category])
+            cfg = CATEGORY_CONFIG[category]
+            category_lines.append(f"{cfg['emoji']} — {cfg['label']} Commands")
+        tiers[tier] = HelpTier(fingerprint, render_home(category_lines), category_lines, pages)
+
+    help_catalog_cache.clear()
+    help_catalog_cache.update(tiers)
+    return len(entries)
+
+
+def get_help_tier(bot: commands.Bot, is_staff: bool) -> HelpTier:
+    """Cached pages of the tier, rebuilt only after a cog (re)load"""
+    tier = help_catalog_cache.get("staff" if is_staff else "public")
+    if tier is None or tier.fingerprint != cogs_fingerprint(bot):
+        try:
+            rebuild_help_catalog(bot)
+        except Exception as e:
+            pretty_log("error", f"Error building help catalog: {e}", include_trace=True)
+            if tier is None:
+                raise
+            return tier
+        tier = help_catalog_cache["staff" if is_staff else "public"]
+    return tier
+
+
+def with_author(embed: discord.Embed, user: discord.abc.User) -> discord.Embed:
+    """Copy of a cached embed with the user as author, the cached one is never mutated"""
+    embed = embed.copy()
+    embed.set_author(name=user.display_name, icon_url=user.display_avatar.url)
+    return embed
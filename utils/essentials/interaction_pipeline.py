@@ -0,0 +1,97 @@
+# 🌸───────────────────────────────────────────────🌸
+#      Interaction Pipeline (defer first, check after)
+# 🌸───────────────────────────────────────────────🌸
+import functools
+
+import discord
+
+from utils.cache.cache_list import auction_cache, market_value_cache
+from utils.essentials.lifecycle import LIFECYCLE
+from utils.logs.metrics import METRICS, interaction_age_ms, measure
+from utils.logs.pretty_log import pretty_log
+from utils.visuals.pretty_defer import DEFER_HANDLE_KEY, command_label, pretty_defer
+
+# Discord drops interactions that get no response within 3 seconds
+INTERACTION_DEADLINE_MS = 3_000
+
+
+# ❀ Preconditions ❀
+# Each takes (bot, interaction) and returns an error message, or None if the command can run.
+async def caches_ready(bot, interaction: discord.Interaction) -> str | None:
+    """Warms the auction + market caches on a cold start, no DB roundtrip once they are loaded."""
+    if market_value_cache:
+        return None
+    from utils.group_commands_func.auction.start import (
+        check_and_load_auction_and_market_cache,
+    )
+
+    await check_and_load_auction_and_market_cache(bot)
+    if not market_value_cache:
+        return "Caches are still loading. Please try again in a moment."
+    return None
+
+
+async def no_active_auction(bot, interaction: discord.Interaction) -> str | None:
+    if interaction.channel_id in auction_cache:
+        return "There is already an ongoing auction in this channel."
+    return None
+
+
+# ❀ Decorator ❀
+def pre_defer(
+    content: str = "Please wait while Jigglypuff thinks...",
+    ephemeral: bool = True,
+    preconditions: tuple = (),
+):
+    """
+    Sends the pretty_defer loader before anything else runs, then the preconditions, then the command.
+    Apply in the cogs right under the command decorator. The command func's own pretty_defer call
+    picks up the same loader from interaction.extras.
+    """
+
+    def decorator(callback):
+        @functools.wraps(callback)
+        async def wrapper(self, interaction: discord.Interaction, *args, **kwargs):
+            command_name = command_label(interaction)
+            age = interaction_age_ms(interaction)
+            METRICS.observe("interaction_dispatch_age_ms", age, command=command_name)
+            if age >= INTERACTION_DEADLINE_MS:
+                METRICS.inc(
+                    "interactions_expired_total", command=command_name, stage="dispatch"
+                )
+                pretty_log(
+                    "warn",
+                    f"/{command_name} by {interaction.user} reached us {age:,.0f}ms after creation, skipped",
+                )
+                return
+
+            # Shutdown waits for tracked commands before closing the pool
+            with LIFECYCLE.track_command():
+                loader = await pretty_defer(
+                    interaction=interaction, content=content, ephemeral=ephemeral
+                )
+                if loader.expired:
+                    return
+                interaction.extras[DEFER_HANDLE_KEY] = loader
+
+                for check in preconditions:
+                    with measure("precondition_ms", check=check.__name__):
+                        error = await check(self.bot, interaction)
+                    if error:
+                        METRICS.inc(
+                            "precondition_failed_total",
+                            command=command_name,
+                            check=check.__name__,
+                        )
+                        interaction.extras.pop(DEFER_HANDLE_KEY, None)
+                        await loader.error(content=error)
+                        return
+
+                try:
+                    await callback(self, interaction, *args, **kwargs)
+                finally:
+                    interaction.extras.pop(DEFER_HANDLE_KEY, None)
+
+        return wrapper
+
+    return decorator
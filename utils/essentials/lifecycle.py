@@ -0,0 +1,177 @@
+# 🌸───────────────────────────────────────────────🌸
+#      Lifecycle (graceful shutdown and drain)
+# 🌸───────────────────────────────────────────────🌸
+import asyncio
+import contextlib
+import time
+from typing import NamedTuple
+
+import discord
+
+from utils.cache.cache_list import (
+    ongoing_bidding,
+    processing_auction_end,
+    processing_roll_back,
+    processing_update_ends_on,
+)
+from utils.logs.pretty_log import pretty_log
+
+SHUTDOWN_DEADLINE_SECONDS = 25  # Most hosts send SIGKILL 30s after SIGTERM
+DRAIN_POLL_SECONDS = 0.1
+SHUTTING_DOWN_MESSAGE = "Jigglypuff is restarting, please try again in a moment. 🌸"
+
+
+class ShutdownReport(NamedTuple):
+    commands_left: int  # commands still running at the deadline
+    channel_ops_left: int  # bids / ends / roll backs / end time updates still running
+    loop_stopped: bool  # central loop finished its tick instead of being cancelled
+    ends_on_pending: int  # soft close end times that could not be written
+    snapshot_saved: bool
+    webhooks_left: int
+    logs_shipped: int
+    seconds: float
+
+    def render(self) -> str:
+        return (
+            f"commands left {self.commands_left}, channel ops left {self.channel_ops_left}, "
+            f"central loop {'stopped' if self.loop_stopped else 'cancelled'}, "
+            f"end times pending {self.ends_on_pending}, "
+            f"snapshot {'saved' if self.snapshot_saved else 'skipped'}, "
+            f"webhooks left {self.webhooks_left}, logs shipped {self.logs_shipped}, "
+            f"in {self.seconds:.1f}s"
+        )
+
+
+def channel_ops_in_flight() -> int:
+    return (
+        len(ongoing_bidding)
+        + len(processing_auction_end)
+        + len(processing_roll_back)
+        + len(processing_update_ends_on)
+    )
+
+
+class Lifecycle:
+    """
+    Owns the shutdown order: stop accepting commands -> let running commands and
+    channel operations finish -> stop the central loop between ticks -> flush write-behind
+    buffers and the cache snapshot -> drain outbound webhooks and logs -> close connections.
+    Each step gets what is left of one shared deadline.
+    """
+
+    def __init__(self):
+        self.accepting = True
+        self.commands_in_flight = 0
+        self.report: ShutdownReport | None = None
+        self._shutdown_task: asyncio.Task | None = None
+
+    # ❀ Commands ❀
+    @contextlib.contextmanager
+    def track_command(self):
+        self.commands_in_flight += 1
+        try:
+            yield
+        finally:
+            self.commands_in_flight -= 1
+
+    async def admit(self, interaction: discord.Interaction) -> bool:
+        """Tree-wide interaction check, answers commands that arrive after shutdown started."""
+        if self.accepting:
+            return True
+        if interaction.type == discord.InteractionType.application_command:
+            with contextlib.suppress(discord.HTTPException):
+                await interaction.response.send_message(
+                    SHUTTING_DOWN_MESSAGE, ephemeral=True
+                )
+        return False
+
+    # ❀ Shutdown ❀
+    def request_shutdown(self, bot: discord.Client) -> asyncio.Task:
+        """Starts the shutdown once, later calls (SIGTERM + Ctrl+C) wait on the same task."""
+        if self._shutdown_task is None:
+            self._shutdown_task = asyncio.get_running_loop().create_task(
+                self.shutdown(bot)
+            )
+        return self._shutdown_task
+
+    async def _wait_until(self, condition, deadline: float) -> bool:
+        while not condition():
+            if time.monotonic() >= deadline:
+                return False
+            await asyncio.sleep(DRAIN_POLL_SECONDS)
+        return True
+
+    async def shutdown(
+        self, bot: discord.Client, timeout: float = SHUTDOWN_DEADLINE_SECONDS
+    ) -> ShutdownReport:
+        from utils.cache.cache_list import pending_ends_on_writes
+        from utils.cache.cache_snapshot import save_cache_snapshot
+        from utils.db.guild_config_db import close_guild_config_listener
+        from utils.functions.webhook_dispatcher import WEBHOOK_DISPATCHER
+        from utils.logs.log_shipper import LOG_SHIPPER
+        from utils.logs.metrics import stop_metrics_server
+        from utils.schedule.auction_schedule import flush_pending_ends_on
+
+        started = time.monotonic()
+        deadline = started + timeout
+
+        def remaining() -> float:
+            return max(deadline - time.monotonic(), 0.1)
+
+        self.accepting = False
+        pretty_log("ready", "Shutting down, no new commands are accepted")
+
+        # Running commands and per-channel operations finish on their own
+        await self._wait_until(
+            lambda: self.commands_in_flight == 0 and channel_ops_in_flight() == 0,
+            deadline,
+        )
+        commands_left = self.commands_in_flight
+        channel_ops_left = channel_ops_in_flight()
+
+        # The central loop finishes its current tick (no half ended auctions)
+        loop_stopped = True
+        central_loop = bot.get_cog("CentralLoop")
+        if central_loop is not None:
+            loop_stopped = await central_loop.stop_loop(timeout=remaining())
+
+        # Write-behind buffers
+        try:
+            if getattr(bot, "pg_pool", None) is not None:
+                await asyncio.wait_for(flush_pending_ends_on(bot), timeout=remaining())
+        except Exception as e:
+            pretty_log("error", f"Error flushing end times on shutdown: {e}")
+        snapshot_saved = await save_cache_snapshot()
+
+        # Outbound queues, logs last so everything above still ships
+        webhooks_left = await WEBHOOK_DISPATCHER.drain(timeout=remaining())
+        logs_shipped = await LOG_SHIPPER.drain(timeout=remaining())
+
+        # Connections
+        await close_guild_config_listener()
+        await stop_metrics_server()
+        pool = getattr(bot, "pg_pool", None)
+        if pool is not None:
+            try:
+                await asyncio.wait_for(pool.close(), timeout=remaining())
+            except Exception as e:
+                pretty_log("error", f"Error closing the Postgres pool: {e}")
+        if not bot.is_closed():
+            await bot.close()
+
+        self.report = ShutdownReport(
+            commands_left=commands_left,
+            channel_ops_left=channel_ops_left,
+            loop_stopped=loop_stopped,
+            ends_on_pending=len(pending_ends_on_writes),
+            snapshot_saved=snapshot_saved,
+            webhooks_left=webhooks_left,
+            logs_shipped=logs_shipped,
+            seconds=time.monotonic() - started,
+        )
+        # The log shipper is closed by now, this only reaches the console
+        pretty_log("ready", f"Shutdown drained: {self.report.render()}")
+        return self.report
+
+
+LIFECYCLE = Lifecycle()
@@ -0,0 +1,62 @@
+# 🌸───────────────────────────────────────────────🌸
+#        Proxy Bidding (max bids resolved in memory)
+# 🌸───────────────────────────────────────────────🌸
+from typing import NamedTuple
+
+from constants.auction import MIN_INITIAL_BID
+from utils.cache.cache_list import ProxyBid
+
+
+class ProxyOutcome(NamedTuple):
+    bidder_id: int
+    bidder_name: str
+    amount: int
+    autobought: bool
+
+
+def resolve_proxy_bids(
+    highest_bidder_id: int,
+    highest_offer: int,
+    minimum_increment: int,
+    autobuy: int,
+    proxies: dict[int, ProxyBid],
+) -> ProxyOutcome | None:
+    """
+    Plays out every competing max bid in one step and returns the final highest bid,
+    or None if the current highest bid stands.
+    The strongest ceiling wins (earliest on a tie) and pays one increment over the runner up,
+    never more than its own ceiling, capped at the autobuy price.
+    """
+    if not proxies:
+        return None
+
+    ranked = sorted(
+        proxies.items(), key=lambda item: (-item[1]["ceiling"], item[1]["placed_at"])
+    )
+    top_id, top = ranked[0]
+    runner_up = ranked[1][1]["ceiling"] if len(ranked) > 1 else 0
+    next_minimum = (
+        highest_offer + minimum_increment if highest_offer else MIN_INITIAL_BID
+    )
+
+    if top_id == highest_bidder_id:
+        # The leader only raises if another max bid is high enough to outbid them
+        if runner_up < next_minimum:
+            return None
+        amount = min(top["ceiling"], runner_up + minimum_increment)
+    else:
+        if top["ceiling"] < next_minimum:
+            return None
+        amount = next_minimum
+        if runner_up:
+            amount = max(amount, runner_up + minimum_increment)
+        amount = min(top["ceiling"], amount)
+
+    if amount <= highest_offer:
+        return None
+
+    autobought = False
+    if autobuy > 0 and amount >= autobuy:
+        amount = autobuy
+        autobought = True
+    return ProxyOutcome(top_id, top["bidder_name"], amount, autobought)
@@ -2,7 +2,15 @@
 import discord
 from discord import app_commands
 
-from constants.grand_line_auction_constants import GRAND_LINE_AUCTION_ROLES, KHY_USER_ID
+from constants.grand_line_auction_constants import KHY_USER_ID, YUKI_USER_ID
+from constants.guild_config import AUCTIONEER_ROLES, BOOSTER_ROLES, STAFF_ROLES
+from utils.cache.guild_config_cache import get_guild_config
+from utils.cache.member_resolver import MEMBER_RESOLVER, MemberSnapshot
+
+OWNER_USER_IDS = {YUKI_USER_ID, KHY_USER_ID}
+
+# interaction.extras key for the memoized role ids of interaction.user
+ROLE_IDS_KEY = "role_ids"
 
 
 # 🌸──────────────────────────────────────────────────────
@@ -12,20 +20,68 @@ class AuctioneerCheckFailure(app_commands.CheckFailure):
     pass
 
 
+class OwnerCheckFailure(app_commands.CheckFailure):
+    pass
+
+
 # 🌸──────────────────────────────────────────────────────
 # 🐾💫 Cute Error Messages by Server — Cottagecore Style 💫🌿
 # ───────────────────────────────────────────────────────
 ERROR_MESSAGES = {
     "auctioneer": "Only Auctioneers can use this command! If you think this is a mistake, please contact a Staff member.",
+    "owner": "Only Yuki or Khy is allowed to use this!",
 }
 
 
 # 🌸──────────────────────────────────────────────────────
-# 🔹 Helper function
+# 🔹 Helper functions
 # ───────────────────────────────────────────────────────
 def has_role(user_roles, role_id):
     """Check if user has a role ID"""
-    return role_id in [role.id for role in user_roles]
+    return any(role.id == role_id for role in user_roles)
+
+
+def interaction_role_ids(interaction: discord.Interaction) -> frozenset[int]:
+    """
+    Role ids of interaction.user, computed once per interaction. The payload member is
+    always current, so it also refreshes the member resolver snapshot.
+    """
+    role_ids = interaction.extras.get(ROLE_IDS_KEY)
+    if role_ids is None:
+        role_ids = MEMBER_RESOLVER.put(interaction.user).role_ids
+        interaction.extras[ROLE_IDS_KEY] = role_ids
+    return role_ids
+
+
+def member_role_ids(member: discord.Member | MemberSnapshot) -> frozenset[int]:
+    """Role ids of any member, from the resolver snapshot (dropped on on_member_update)."""
+    if isinstance(member, MemberSnapshot):
+        return member.role_ids
+    snapshot = MEMBER_RESOLVER.get_cached(member.id)
+    if snapshot is None:
+        snapshot = MEMBER_RESOLVER.put(member)
+    return snapshot.role_ids
+
+
+# Role id sets come from the guild config snapshot (home guild when guild_id is None),
+# every check is a set intersection against the member's frozenset of role ids
+def is_auctioneer(
+    user_id: int, role_ids: frozenset[int], guild_id: int | None = None
+) -> bool:
+    # Allow khy (user id: 952071312124313611)
+    return user_id == KHY_USER_ID or not role_ids.isdisjoint(
+        get_guild_config(guild_id).ids(AUCTIONEER_ROLES)
+    )
+
+
+def is_staff(user_id: int, role_ids: frozenset[int], guild_id: int | None = None) -> bool:
+    return user_id == KHY_USER_ID or not role_ids.isdisjoint(
+        get_guild_config(guild_id).ids(STAFF_ROLES)
+    )
+
+
+def is_booster(role_ids: frozenset[int], guild_id: int | None = None) -> bool:
+    return not role_ids.isdisjoint(get_guild_config(guild_id).ids(BOOSTER_ROLES))
 
 
 # 🌸──────────────────────────────────────────────────────
@@ -33,28 +89,27 @@ def has_role(user_roles, role_id):
 # ───────────────────────────────────────────────────────
 def auctioneer_only():
     async def predicate(interaction: discord.Interaction):
-        # Allow khy (user id: 952071312124313611)
-        if getattr(interaction.user, "id", None) == KHY_USER_ID:
-            return True
-        if not has_role(interaction.user.roles, GRAND_LINE_AUCTION_ROLES.auctioneer):
+        if not is_auctioneer(
+            interaction.user.id, interaction_role_ids(interaction), interaction.guild_id
+        ):
             raise AuctioneerCheckFailure(ERROR_MESSAGES["auctioneer"])
         return True
 
     return app_commands.check(predicate)
 
 
+def owner_only():
+    async def predicate(interaction: discord.Interaction):
+        if getattr(interaction.user, "id", None) not in OWNER_USER_IDS:
+            raise OwnerCheckFailure(ERROR_MESSAGES["owner"])
+        return True
+
+    return app_commands.check(predicate)
+
+
 # Check if user is staff member
-def is_staff_member(member: discord.Member) -> bool:
+def is_staff_member(member: discord.Member | MemberSnapshot) -> bool:
     """
     Checks if a member has any staff roles.
     """
-    # Allow khy (user id: 952071312124313611)
-    if getattr(member, "id", None) == KHY_USER_ID:
-        return True
-    staff_role_ids = [
-        GRAND_LINE_AUCTION_ROLES.auctioneer,
-        GRAND_LINE_AUCTION_ROLES.moderator,
-    ]
-    if any(role.id in staff_role_ids for role in member.roles):
-        return True
-    return False
+    return is_staff(getattr(member, "id", None), member_role_ids(member))
@@ -4,16 +4,19 @@ from datetime import datetime
 import discord
 from discord.ext import commands
 
-from constants.auction import AUCTION_CATEGORY_LIST, MIN_AUCTION_VALUE
+from constants.auction import MIN_AUCTION_VALUE
 from constants.grand_line_auction_constants import (
     GLA_SERVER_ID,
     GRAND_LINE_AUCTION_CATEGORIES,
-    GRAND_LINE_AUCTION_ROLES,
-    GRAND_LINE_AUCTION_TEXT_CHANNELS,
     KHY_CHANNEL_ID,
 )
+from constants.guild_config import (
+    AUCTION_CATEGORIES,
+    BOOSTER_AUCTION_CHANNEL,
+    STAFF_CATEGORIES,
+    TEST_AUCTION_CHANNEL,
+)
 from constants.rarity import (
-    RARITY_MAP,
     get_rarity,
     is_mon_auctionable,
     is_mon_exclusive,
@@ -27,17 +30,20 @@ from utils.cache.cache_list import (
     processing_roll_back,
     processing_update_ends_on,
 )
+from utils.cache.guild_config_cache import get_guild_config
 from utils.db.auction_db import upsert_auction
 from utils.db.market_value_db import (
     check_and_load_market_cache,
     fetch_lowest_market_value_cache,
 )
 from utils.essentials.auction_broadcast import broadcast_auction
+from utils.essentials.channel_routing import get_channel_route
 from utils.essentials.minimum_increment import (
     compute_maximum_auction_duration_seconds,
     compute_minimum_increment,
     format_names_for_market_value_lookup,
 )
+from utils.essentials.role_checks import is_booster, member_role_ids
 from utils.logs.debug_log import debug_log, enable_debug
 from utils.logs.pretty_log import pretty_log
 from utils.parser.duration_parser import format_seconds, parse_duration
@@ -58,24 +64,20 @@ CATEGORY_ORDER = {
 
 
 def is_auction_channel(channel: discord.TextChannel, user: discord.Member) -> bool:
-    server_booster_role = channel.guild.get_role(
-        GRAND_LINE_AUCTION_ROLES.server_booster
-    )
-    if channel.id == GRAND_LINE_AUCTION_TEXT_CHANNELS.test_auction:
+    config = get_guild_config(channel.guild.id)
+    if channel.id in config.ids(TEST_AUCTION_CHANNEL):
         return True, None
-    if channel.id == GRAND_LINE_AUCTION_TEXT_CHANNELS.booster_auction:
-        if server_booster_role and server_booster_role in user.roles:
+    if channel.id in config.ids(BOOSTER_AUCTION_CHANNEL):
+        if is_booster(member_role_ids(user), channel.guild.id):
             return True, None
         else:
             return (
                 False,
                 "This channel is reserved for server boosters. Please use the appropriate auction channel for your auction.",
             )
-    if (
-        channel.category.id in AUCTION_CATEGORY_LIST
-        or channel.category.id == GRAND_LINE_AUCTION_CATEGORIES.STAFF
-        or channel.category.id == GRAND_LINE_AUCTION_CATEGORIES.PRIV_CHANNELS
-    ):
+    if channel.category_id in config.ids(
+        AUCTION_CATEGORIES
+    ) or channel.category_id in config.ids(STAFF_CATEGORIES):
         return True, None
     return (
         False,
@@ -90,45 +92,17 @@ def check_if_right_channel_rarity(
     is_bulk: bool = False,
     is_speed: bool = False,
 ) -> tuple[bool, str | None]:
-    if is_speed:
+    route = get_channel_route(channel.guild, rarity, is_exclusive, is_bulk, is_speed)
+    if route.allow_any:
         return True, None
 
-    if not TESTING_CATEGORIES and (
-        channel.id == GRAND_LINE_AUCTION_TEXT_CHANNELS.test_auction
-        or channel.category.id == GRAND_LINE_AUCTION_CATEGORIES.STAFF
-        or channel.category.id == GRAND_LINE_AUCTION_CATEGORIES.PRIV_CHANNELS
-    ):
-        return True, None
+    if not TESTING_CATEGORIES:
+        config = get_guild_config(channel.guild.id)
+        if channel.id in config.ids(
+            TEST_AUCTION_CHANNEL
+        ) or channel.category_id in config.ids(STAFF_CATEGORIES):
+            return True, None
 
-    category_id = channel.category.id
-    category_rarity_list = RARITY_MAP.get(rarity, {}).get("category", []).copy()
-    if is_exclusive:
-        exclusive_category = RARITY_MAP.get("exclusive", {}).get("category", [])
-        category_rarity_list.extend(exclusive_category)
-    if is_bulk:
-        bulk_category = RARITY_MAP.get("bulk", {}).get("category", [])
-        category_rarity_list.extend(bulk_category)
-    if category_id in category_rarity_list:
+    if channel.category_id in route.category_ids:
         return True, None
-
-    valid_category_names = []
-    for cat_id in category_rarity_list:
-        cat_obj = discord.utils.get(channel.guild.categories, id=cat_id)
-        if cat_obj:
-            valid_category_names.append(cat_obj.name.title())
-        else:
-            valid_category_names.append(str(cat_id).title())
-    # Ensure 'Bulk Auction' is always first if present
-    bulk_name = "Bulk Auction"
-    sorted_names = valid_category_names.copy()
-    if bulk_name in sorted_names:
-        sorted_names.remove(bulk_name)
-        sorted_names = [bulk_name] + sorted_names
-    bullet_lines = [f"> - {name}" for name in sorted_names]
-    valid_names_str = "\n".join(bullet_lines)
-    suggested_category = (
-        "❤️‍🩹 You can't auction this Pokémon in this channel. Please use one of the following categories for this Pokémon:\n"
-        + valid_names_str
-        + "\n."
-    )
-    return False, suggested_category
+    return False, route.suggestion
@@ -0,0 +1,221 @@
+# 🌸───────────────────────────────────────────────🌸
+#        Webhook Dispatcher (fire-and-forget sends)
+# 🌸───────────────────────────────────────────────🌸
+import asyncio
+import random
+
+import aiohttp
+import discord
+
+from utils.cache.cache_list import WebhookRecord, webhook_url_cache
+from utils.logs.pretty_log import pretty_log
+
+MAX_QUEUED_WEBHOOKS = 500  # Sends waiting for a worker, extra sends are dropped
+WEBHOOK_WORKERS = 2
+MAX_SEND_ATTEMPTS = 5
+MAX_BACKOFF_SECONDS = 30
+
+
+class _WebhookJob:
+    __slots__ = ("channel", "content", "embed", "attempts")
+
+    def __init__(self, channel: discord.TextChannel, content, embed):
+        self.channel = channel
+        self.content = content
+        self.embed = embed
+        self.attempts = 0
+
+
+def _webhook_name_for(channel: discord.TextChannel) -> str:
+    if "log" in channel.name.lower():
+        return "Jigglypuff Logs 🌸"
+    return "Jigglypuff"
+
+
+def _is_retryable(error: discord.HTTPException) -> bool:
+    return error.status == 429 or error.status >= 500
+
+
+class WebhookDispatcher:
+    """
+    Sends webhook messages in the background.
+    - One shared aiohttp session, one cached Webhook object per channel
+    - Bounded queue, callers never wait on the Discord roundtrip
+    - Retries 429/5xx with backoff, recreates webhooks that were deleted
+    """
+
+    def __init__(
+        self, max_queued: int = MAX_QUEUED_WEBHOOKS, workers: int = WEBHOOK_WORKERS
+    ):
+        self.max_queued = max_queued
+        self.worker_count = workers
+        self.bot: discord.Client | None = None
+        self.session: aiohttp.ClientSession | None = None
+        # key = (bot_id, channel_id) -> (url, Webhook), rebuilt if the cached url changes
+        self.webhooks: dict[tuple[int, int], tuple[str, discord.Webhook]] = {}
+        self.avatar_bytes: bytes | None = None
+        self.dropped = 0
+        self.sent = 0
+        self._queue: asyncio.Queue | None = None
+        self._workers: list[asyncio.Task] = []
+
+    # ❀ Enqueue ❀
+    def enqueue(
+        self,
+        bot: discord.Client,
+        channel: discord.TextChannel,
+        content: str = None,
+        embed: discord.Embed = None,
+    ) -> bool:
+        self.bot = bot
+        self._ensure_workers()
+        try:
+            self._queue.put_nowait(_WebhookJob(channel, content, embed))
+            return True
+        except asyncio.QueueFull:
+            self.dropped += 1
+            pretty_log(
+                tag="warn",
+                message=f"⚠️ Webhook queue full, dropped send to '{channel.name}' (ID: {channel.id})",
+                label="🌐 WEBHOOK SEND",
+            )
+            return False
+
+    def _ensure_workers(self):
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.max_queued)
+        self._workers = [task for task in self._workers if not task.done()]
+        loop = asyncio.get_running_loop()
+        while len(self._workers) < self.worker_count:
+            self._workers.append(loop.create_task(self._worker()))
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession()
+        return self.session
+
+    # ❀ Workers ❀
+    async def _worker(self):
+        while True:
+            job = await self._queue.get()
+            try:
+                await self._deliver(job)
+            except Exception as e:
+                pretty_log(
+                    tag="error",
+                    message=f"❌ Webhook send to '{job.channel.name}' failed: {e}",
+                    label="🌐 WEBHOOK SEND",
+                    include_trace=True,
+                )
+            finally:
+                self._queue.task_done()
+
+    async def _deliver(self, job: _WebhookJob):
+        while True:
+            job.attempts += 1
+            webhook = await self._get_webhook(job.channel)
+            if webhook is None:
+                pretty_log(
+                    tag="info",
+                    message=f"⚠️ Falling back to direct channel send for channel '{job.channel.name}' (ID: {job.channel.id}) due to webhook creation failure",
+                    label="🌐 WEBHOOK SEND",
+                )
+                await job.channel.send(content=job.content, embed=job.embed)
+                return
+
+            try:
+                await webhook.send(content=job.content, embed=job.embed)
+                self.sent += 1
+                return
+            except discord.NotFound:
+                # Webhook was deleted from the channel, recreate it on the next attempt
+                await self._forget_webhook(job.channel)
+                if job.attempts >= MAX_SEND_ATTEMPTS:
+                    raise
+            except discord.HTTPException as e:
+                if not _is_retryable(e) or job.attempts >= MAX_SEND_ATTEMPTS:
+                    raise
+                await asyncio.sleep(_backoff_seconds(job.attempts))
+
+    # ❀ Webhook lookup ❀
+    async def _get_webhook(
+        self, channel: discord.TextChannel
+    ) -> discord.Webhook | None:
+        key = (self.bot.user.id, channel.id)
+        cached = self.webhooks.get(key)
+        record = webhook_url_cache.get(key)
+
+        if cached is not None and record and cached[0] == record["url"]:
+            return cached[1]
+
+        if record is None:
+            url = await self.create_webhook(channel)
+            if not url:
+                return None
+            record = WebhookRecord(url=url, channel_name=channel.name)
+            webhook_url_cache[key] = record
+
+        webhook = discord.Webhook.from_url(record["url"], session=self._get_session())
+        self.webhooks[key] = (record["url"], webhook)
+        return webhook
+
+    async def create_webhook(
+        self, channel: discord.TextChannel, name: str | None = None
+    ) -> str | None:
+        from utils.db.webhook_db_url import upsert_webhook_url
+
+        name = name or _webhook_name_for(channel)
+        try:
+            if self.avatar_bytes is None and self.bot.user.avatar:
+                self.avatar_bytes = await self.bot.user.avatar.read()
+            webhook = await channel.create_webhook(name=name, avatar=self.avatar_bytes)
+        except Exception as e:
+            pretty_log(
+                "error",
+                f"Failed to create webhook in channel '{channel.name}': {e}",
+            )
+            return None
+
+        pretty_log(
+            "info",
+            f"Webhook '{name}' created in channel '{channel.name}' (ID: {channel.id})",
+        )
+        # Store the webhook URL in the database
+        await upsert_webhook_url(self.bot, channel, webhook.url)
+        return webhook.url
+
+    async def _forget_webhook(self, channel: discord.TextChannel):
+        from utils.db.webhook_db_url import remove_webhook_url
+
+        key = (self.bot.user.id, channel.id)
+        self.webhooks.pop(key, None)
+        webhook_url_cache.pop(key, None)
+        pretty_log(
+            tag="warn",
+            message=f"⚠️ Webhook for '{channel.name}' (ID: {channel.id}) was deleted, recreating",
+            label="🌐 WEBHOOK SEND",
+        )
+        await remove_webhook_url(self.bot, channel)
+
+    # ❀ Shutdown ❀
+    async def drain(self, timeout: float = 10.0) -> int:
+        """Wait for queued sends, then stop workers and close the session. Returns sends left unsent."""
+        pending = 0
+        if self._queue is not None:
+            try:
+                await asyncio.wait_for(self._queue.join(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pending = self._queue.qsize()
+        for task in self._workers:
+            task.cancel()
+        self._workers.clear()
+        if self.session and not self.session.closed:
+            await self.session.close()
+        return pending
+
+
+def _backoff_seconds(attempt: int) -> float:
+    return min(2**attempt, MAX_BACKOFF_SECONDS) + random.uniform(0, 1)
+
+
+WEBHOOK_DISPATCHER = WebhookDispatcher()
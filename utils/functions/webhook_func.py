@@ -1,10 +1,8 @@
-from datetime import datetime
-
 import discord
 
-from constants.grand_line_auction_constants import GRAND_LINE_AUCTION_TEXT_CHANNELS
-from utils.cache.cache_list import webhook_url_cache
-from utils.db.webhook_db_url import upsert_webhook_url
+from constants.guild_config import AUCTION_LOG_CHANNEL
+from utils.cache.guild_config_cache import get_guild_config
+from utils.functions.webhook_dispatcher import WEBHOOK_DISPATCHER
 from utils.logs.pretty_log import pretty_log
 
 
@@ -13,11 +11,12 @@ async def send_auction_log(
     embed: discord.Embed = None,
     content: str = None,
 ):
-    auction_log_channel = bot.get_channel(GRAND_LINE_AUCTION_TEXT_CHANNELS.auction_log)
+    auction_log_channel_id = get_guild_config().first_id(AUCTION_LOG_CHANNEL)
+    auction_log_channel = bot.get_channel(auction_log_channel_id)
     if not auction_log_channel:
         pretty_log(
             tag="error",
-            message=f"❌ Auction log channel with ID {GRAND_LINE_AUCTION_TEXT_CHANNELS.auction_log} not found.",
+            message=f"❌ Auction log channel with ID {auction_log_channel_id} not found.",
             label="🌐 WEBHOOK SEND",
         )
         return
@@ -31,25 +30,14 @@ async def send_auction_log(
 
 
 async def create_webhook_func(
-    bot, channel: discord.TextChannel, name: str
+    bot, channel: discord.TextChannel, name: str = None
 ) -> str | None:
-    try:
-
-        avatar_bytes = await bot.user.avatar.read()
-        webhook = await channel.create_webhook(name=name, avatar=avatar_bytes)
-        pretty_log(
-            "info",
-            f"Webhook '{name}' created in channel '{channel.name}' (ID: {channel.id})",
-        )
-        # Store the webhook URL in the database
-        await upsert_webhook_url(bot, channel, webhook.url)
-
-    except Exception as e:
-        pretty_log(
-            "error",
-            f"Failed to create webhook in channel '{channel.name}': {e}",
-        )
-    return webhook.url if webhook else None
+    """
+    Creates a webhook in the channel and stores its URL, avatar bytes are read once and reused.
+    Without a name it gets the dispatcher's default for the channel.
+    """
+    WEBHOOK_DISPATCHER.bot = bot
+    return await WEBHOOK_DISPATCHER.create_webhook(channel, name=name)
 
 
 async def send_webhook(
@@ -58,41 +46,8 @@ async def send_webhook(
     content: str = None,
     embed: discord.Embed = None,
 ):
-    bot_id = bot.user.id
-    channel_id = channel.id
-    key = (bot_id, channel_id)
-    webhook_url_row = webhook_url_cache.get(key)
-    # Handle legacy cache value (string) and correct dict structure
-    if webhook_url_row is None:
-        channel_name = channel.name
-        if "log" in channel_name.lower():
-            webhook_name = "Jigglypuff Logs 🌸"
-        else:
-            webhook_name = "Jigglypuff"
-        webhook_url = await create_webhook_func(bot, channel, webhook_name)
-        if not webhook_url:
-            pretty_log(
-                tag="info",
-                message=f"⚠️ Falling back to direct channel send for channel '{channel.name}' (ID: {channel.id}) due to webhook creation failure",
-                label="🌐 WEBHOOK SEND",
-            )
-            await channel.send(content=content, embed=embed)
-            return
-        # Update cache for immediate use
-        webhook_url_cache[key] = {
-            "channel_name": channel_name,
-            "url": webhook_url,
-        }
-        webhook_url_row = webhook_url_cache[key]
-    # If cache value is a string (legacy), convert to dict
-    elif isinstance(webhook_url_row, str):
-        webhook_url_cache[key] = {
-            "channel_name": channel.name,
-            "url": webhook_url_row,
-        }
-        webhook_url_row = webhook_url_cache[key]
-
-    webhook_url = webhook_url_row["url"]
-    if webhook_url:
-        webhook = discord.Webhook.from_url(webhook_url, client=bot)
-        await webhook.send(content=content, embed=embed, wait=True)
+    """
+    Queues a webhook send and returns immediately.
+    The dispatcher reuses cached webhooks, retries 429/5xx and recreates deleted webhooks.
+    """
+    WEBHOOK_DISPATCHER.enqueue(bot, channel, content=content, embed=embed)
@@ -2,6 +2,7 @@ from .banner import send_auction_house_banner_func
 from .bid import bid_func
 from .stop import stop_auction_func
 from .info import auction_info_func
+from .proxy_bid import proxy_bid_func
 from .roll_back import roll_back_func
 from .start import start_auction_func
 from .update_ends_on import update_ends_on_func
@@ -11,6 +12,7 @@ __all__ = [
     "start_auction_func",
     "stop_auction_func",
     "bid_func",
+    "proxy_bid_func",
     "update_ends_on_func",
     "roll_back_func",
     "auction_info_func",
@@ -6,15 +6,20 @@ from discord.ext import commands
 from utils.autocomplete.pokemon_autocomplete import format_price_w_coin
 from utils.cache.auction_cache import get_auction_cache
 from utils.cache.cache_list import ongoing_bidding
-from utils.db.auction_db import delete_auction, update_auction_bid
+from utils.cache.member_resolver import MEMBER_RESOLVER, departed_member
+from utils.db.auction_bids_db import persist_bids
+from utils.db.auction_db import delete_auction
+from utils.db.auction_results_db import AUTOBOUGHT
 from utils.functions.webhook_func import send_auction_log
 from utils.group_commands_func.auction.stop import send_auction_house_banner
 from utils.logs.debug_log import debug_log, enable_debug
 from utils.logs.pretty_log import pretty_log
 from utils.parser.number_parser import parse_compact_number
+from utils.schedule.auction_schedule import extend_auction_deadline, soft_close_deadline
 from utils.visuals.pretty_defer import pretty_defer
 
-from .start import is_being_processed, make_auction_embed
+from .proxy_bid import resolve_proxy_outcome
+from .start import is_being_processed, is_speed_auction, make_auction_embed
 
 INITIAL_MIN_BID = 100_000
 
@@ -62,122 +67,171 @@ async def bid_func(
         return
     # Mark this auction as being processed
     ongoing_bidding.add(interaction.channel.id)
+    try:
+        # Validate bid amount
+        amount_value = parse_compact_number(amount)
+        if not amount_value or amount_value <= 0:
+            await loader.error(content="Please enter a valid bid amount.")
+            return
 
-    # Validate bid amount
-    amount_value = parse_compact_number(amount)
-    if not amount_value or amount_value <= 0:
-        ongoing_bidding.remove(interaction.channel_id)
-        await loader.error(content="Please enter a valid bid amount.")
-        return
-
-    # Get values
-    autobuy = auction["autobuy"]
-    highest_offer = auction["highest_offer"]
-    highest_bidder_id = auction["highest_bidder_id"]
-    minimum_increment = auction["minimum_increment"]
-    is_bulk = auction.get("is_bulk", False)
-    host_id = auction["host_id"]
-    host = guild.get_member(host_id)
-    is_initial_bid = False
-    is_autobought = False
-    last_bidder_mention = None
-    total_minimum = highest_offer + minimum_increment
-    context = "initial_bid"
-    debug_log(f"Bid check: amount_value={amount_value}, total_minimum={total_minimum}")
-    # Invalid bids lower than the current highest offer
-    if amount_value < highest_offer:
-        ongoing_bidding.remove(interaction.channel.id)
-        await loader.error(
-            content=f"Your bid must be higher than the current highest offer of {format_price_w_coin(highest_offer)}."
+        # Get values
+        autobuy = auction["autobuy"]
+        highest_offer = auction["highest_offer"]
+        highest_bidder_id = auction["highest_bidder_id"]
+        minimum_increment = auction["minimum_increment"]
+        is_bulk = auction.get("is_bulk", False)
+        host_id = auction["host_id"]
+        host = await MEMBER_RESOLVER.resolve(guild, host_id) or departed_member(
+            host_id, auction.get("host_name")
         )
-        return
+        is_initial_bid = False
+        is_autobought = False
+        last_bidder_mention = None
+        total_minimum = highest_offer + minimum_increment
+        context = "initial_bid"
+        debug_log(f"Bid check: amount_value={amount_value}, total_minimum={total_minimum}")
+        # Invalid bids lower than the current highest offer
+        if amount_value < highest_offer:
+            await loader.error(
+                content=f"Your bid must be higher than the current highest offer of {format_price_w_coin(highest_offer)}."
+            )
+            return
+
+        # Check if bid meets or exceeds autobuy price
+        if autobuy > 0 and amount_value >= autobuy:
+            amount_value = autobuy  # Cap the bid at the autobuy price
+            is_autobought = True
 
-    # Check if bid meets or exceeds autobuy price
-    if autobuy > 0 and amount_value >= autobuy:
-        amount_value = autobuy  # Cap the bid at the autobuy price
-        is_autobought = True
+        # Check if initial bid
+        elif highest_offer == 0:
+            is_initial_bid = True
+            if amount_value < INITIAL_MIN_BID:
+                await loader.error(
+                    content=f"The initial bid must be at least {format_price_w_coin(INITIAL_MIN_BID)}."
+                )
+                return
 
-    # Check if initial bid
-    elif highest_offer == 0:
-        is_initial_bid = True
-        if amount_value < INITIAL_MIN_BID:
-            ongoing_bidding.remove(interaction.channel_id)
+        # Check if bid is less than current highest offer + minimum increment
+
+        elif amount_value < total_minimum:
             await loader.error(
-                content=f"The initial bid must be at least {format_price_w_coin(INITIAL_MIN_BID)}."
+                content=f"Your bid must be at least {format_price_w_coin(total_minimum)} (current highest offer + minimum increment)."
             )
             return
 
-    # Check if bid is less than current highest offer + minimum increment
-
-    elif amount_value < total_minimum:
-        ongoing_bidding.remove(interaction.channel_id)
-        await loader.error(
-            content=f"Your bid must be at least {format_price_w_coin(total_minimum)} (current highest offer + minimum increment)."
-        )
-        return
+        if not is_initial_bid:
+            last_bidder_mention = f"<@{highest_bidder_id}>"
+            context = "outbid"
+        if is_autobought:
+            # Update auction in database
+            context = "autobought"
+
+        # Max bids answer this bid right away, only the final state is posted
+        bidder = interaction.user
+        final_amount = amount_value
+        proxy_outcome = None
+        if not is_autobought:
+            proxy_outcome, proxy_bidder = await resolve_proxy_outcome(
+                bot=bot,
+                guild=guild,
+                channel_id=interaction.channel_id,
+                auction=auction,
+                highest_bidder_id=interaction.user.id,
+                highest_offer=amount_value,
+            )
+        if proxy_outcome:
+            final_amount = proxy_outcome.amount
+            is_autobought = proxy_outcome.autobought
+            if proxy_outcome.bidder_id != interaction.user.id:
+                bidder = proxy_bidder
+                last_bidder_mention = interaction.user.mention
+                context = "outbid"
+            if is_autobought:
+                context = "autobought"
+
+        # Soft close, a late bid pushes the end time back (not needed if the auction is over)
+        new_ends_on = None
+        if not is_autobought:
+            new_ends_on = soft_close_deadline(
+                channel_id=interaction.channel_id,
+                ends_on=ends_on,
+                now=current_time,
+                is_speed=is_speed_auction(interaction.channel),
+            )
 
-    if not is_initial_bid:
-        last_bidder_mention = f"<@{highest_bidder_id}>"
-        context = "outbid"
-    if is_autobought:
-        # Update auction in database
-        context = "autobought"
+        # Create embed for bid confirmation
+        try:
+            new_embed, content = make_auction_embed(
+                bot=bot,
+                user=host,
+                pokemon=auction["pokemon"],
+                unix_end=str(new_ends_on or ends_on),
+                accepted_pokemon=auction["accepted_list"],
+                gif_url=auction["image_link"],
+                context=context,
+                min_increment=minimum_increment,
+                highest_offer=final_amount,
+                highest_bidder=bidder,
+                last_bidder_mention=last_bidder_mention,
+                autobuy=autobuy,
+                is_bulk=is_bulk,
+            )
+        except Exception as e:
+            pretty_log("error", f"Error creating auction embed: {e}", include_trace=True)
+            await loader.error(content="An error occurred while placing your bid.")
+            return
 
-    # Create embed for bid confirmation
-    try:
-        new_embed, content = make_auction_embed(
-            bot=bot,
-            user=host,
-            pokemon=auction["pokemon"],
-            unix_end=str(auction["ends_on"]),
-            accepted_pokemon=auction["accepted_list"],
-            gif_url=auction["image_link"],
-            context=context,
-            min_increment=minimum_increment,
-            highest_offer=amount_value,
-            highest_bidder=interaction.user,
-            last_bidder_mention=last_bidder_mention,
-            autobuy=autobuy,
-            is_bulk=is_bulk,
-        )
-    except Exception as e:
-        ongoing_bidding.remove(interaction.channel_id)
-        pretty_log("error", f"Error creating auction embed: {e}", include_trace=True)
-        await loader.error(content="An error occurred while placing your bid.")
-        return
+        # The bid and the max bid answering it are stored together, only the final leader shows
+        bids = [
+            (
+                interaction.user.id,
+                interaction.user.name,
+                amount_value,
+                "autobuy" if is_autobought and not proxy_outcome else "bid",
+            )
+        ]
+        if proxy_outcome:
+            bids.append(
+                (proxy_outcome.bidder_id, proxy_outcome.bidder_name, final_amount, "proxy")
+            )
+        try:
+            await persist_bids(bot=bot, channel_id=interaction.channel_id, bids=bids)
+        except Exception as e:
+            pretty_log("error", f"Error updating auction bid: {e}", include_trace=True)
+            await loader.error(content="An error occurred while placing your bid.")
+            return
 
-    try:
-        await update_auction_bid(
-            bot=bot,
-            channel_id=interaction.channel_id,
-            highest_bidder_id=interaction.user.id,
-            highest_bidder=interaction.user.name,
-            highest_offer=amount_value,
-        )
+        if new_ends_on:
+            extend_auction_deadline(interaction.channel_id, ends_on, new_ends_on)
+            extension_note = f"⏰ Late bid! The auction now ends <t:{new_ends_on}:R>."
+            content = f"{content}\n{extension_note}" if content else extension_note
+            pretty_log(
+                "auction",
+                f"Soft close extended auction in channel {interaction.channel.name} by {new_ends_on - ends_on}s",
+            )
 
-    except Exception as e:
-        ongoing_bidding.remove(interaction.channel_id)
-        pretty_log("error", f"Error updating auction bid: {e}", include_trace=True)
-        await loader.error(content="An error occurred while placing your bid.")
-        return
+        # Send updated embed
+        await interaction.channel.send(embed=new_embed)
+        if content:
+            await interaction.channel.send(content=content)
+        if bidder is not interaction.user:
+            await loader.success(
+                content=f"Your bid has been placed, but a max bid immediately raised it to {format_price_w_coin(final_amount)}."
+            )
+        else:
+            await loader.success(content="Your bid has been placed successfully!")
+        if is_autobought:
+            # Remove from db
+            await delete_auction(bot, channel_id=interaction.channel_id, reason=AUTOBOUGHT)
+            await send_auction_house_banner(interaction.channel)
+            await send_auction_log(
+                bot=bot,
+                embed=new_embed,
+            )
 
-    # Send updated embed
-    await interaction.channel.send(embed=new_embed)
-    if content:
-        await interaction.channel.send(content=content)
-    await loader.success(content="Your bid has been placed successfully!")
-    if is_autobought:
-        # Remove from db
-        await delete_auction(bot, channel_id=interaction.channel_id)
-        await send_auction_house_banner(interaction.channel)
-        ongoing_bidding.remove(interaction.channel_id)
-        await send_auction_log(
-            bot=bot,
-            embed=new_embed,
+        pretty_log(
+            "auction",
+            f"User {interaction.user} placed a bid of {format_price_w_coin(amount_value)} in channel {interaction.channel.name} Autobought: {is_autobought}",
         )
-
-    ongoing_bidding.remove(interaction.channel_id)
-    pretty_log(
-        "auction",
-        f"User {interaction.user} placed a bid of {format_price_w_coin(amount_value)} in channel {interaction.channel.name} Autobought: {is_autobought}",
-    )
+    finally:
+        ongoing_bidding.discard(interaction.channel_id)
@@ -1,13 +1,38 @@
 import discord
 
 from constants.grand_line_auction_constants import GLA_SERVER_ID
+from utils.autocomplete.pokemon_autocomplete import format_price_w_coin
+from utils.cache.auction_bids_cache import get_bid_history
 from utils.cache.auction_cache import get_auction_cache
+from utils.cache.member_resolver import MEMBER_RESOLVER
 from utils.group_commands_func.auction.start import make_auction_embed
 from utils.logs.pretty_log import pretty_log
 from utils.visuals.pretty_defer import pretty_defer
 
 from .start import is_being_processed
 
+BID_HISTORY_LIMIT = 5
+BID_KIND_LABELS = {
+    "autobuy": " (autobuy)",
+    "roll_back": " (rolled back)",
+    "proxy": " (max bid)",
+}
+
+
+def format_bid_history(channel_id: int) -> str | None:
+    """Latest bids from the in-memory bid stack, newest first."""
+    history = get_bid_history(channel_id)
+    if not history:
+        return None
+    lines = [
+        f"{format_price_w_coin(bid['amount'])} by <@{bid['bidder_id']}> <t:{bid['placed_at']}:R>"
+        f"{BID_KIND_LABELS.get(bid['kind'], '')}"
+        for bid in history[:BID_HISTORY_LIMIT]
+    ]
+    if len(history) > BID_HISTORY_LIMIT:
+        lines.append(f"+{len(history) - BID_HISTORY_LIMIT} earlier bids")
+    return "\n".join(lines)
+
 
 async def auction_info_func(bot: discord.Client, interaction: discord.Interaction):
     channel = interaction.channel
@@ -31,18 +56,10 @@ async def auction_info_func(bot: discord.Client, interaction: discord.Interactio
     # Get auction details
     host_id = auction["host_id"]
     is_bulk = auction.get("is_bulk", False)
-    host = guild.get_member(host_id)
-    if not host:
-        # Fetch discord use
-        host = await guild.fetch_member(host_id)
     highest_bidder_id = auction["highest_bidder_id"]
-    highest_bidder = None
-    if highest_bidder_id:
-        highest_bidder = guild.get_member(highest_bidder_id)
-        if not highest_bidder:
-            highest_bidder = await guild.fetch_member(highest_bidder_id)
-            if not highest_bidder:
-                highest_bidder = None
+    members = await MEMBER_RESOLVER.resolve_many(guild, [host_id, highest_bidder_id])
+    host = members.get(host_id)
+    highest_bidder = members.get(highest_bidder_id)
 
     # Send auction ended message
     try:
@@ -61,6 +78,9 @@ async def auction_info_func(bot: discord.Client, interaction: discord.Interactio
             min_increment=auction["minimum_increment"],
             is_bulk=is_bulk,
         )
+        bid_history = format_bid_history(channel_id)
+        if bid_history:
+            embed.add_field(name="Bid History", value=bid_history, inline=False)
         await loader.success(content="", embed=embed, add_check_emoji=False)
         pretty_log(
             tag="auction",
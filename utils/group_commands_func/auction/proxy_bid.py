@@ -0,0 +1,235 @@
+import time
+
+import discord
+from discord.ext import commands
+
+from constants.auction import MIN_INITIAL_BID
+from utils.autocomplete.pokemon_autocomplete import format_price_w_coin
+from utils.cache.auction_cache import get_auction_cache
+from utils.cache.auction_proxy_cache import get_proxy_bids
+from utils.cache.cache_list import ongoing_bidding
+from utils.cache.member_resolver import (
+    MEMBER_RESOLVER,
+    MemberSnapshot,
+    departed_member,
+)
+from utils.db.auction_bids_db import persist_bid
+from utils.db.auction_db import delete_auction
+from utils.db.auction_results_db import AUTOBOUGHT
+from utils.db.auction_proxy_db import (
+    delete_proxy_bid,
+    proxy_bidding_enabled,
+    upsert_proxy_bid,
+)
+from utils.essentials.proxy_bidding import ProxyOutcome, resolve_proxy_bids
+from utils.functions.webhook_func import send_auction_log
+from utils.group_commands_func.auction.stop import send_auction_house_banner
+from utils.logs.pretty_log import pretty_log
+from utils.parser.number_parser import parse_compact_number
+from utils.schedule.auction_schedule import extend_auction_deadline, soft_close_deadline
+from utils.visuals.pretty_defer import pretty_defer
+
+from .start import is_being_processed, is_speed_auction, make_auction_embed
+
+
+async def resolve_proxy_outcome(
+    bot: commands.Bot,
+    guild: discord.Guild,
+    channel_id: int,
+    auction: dict,
+    highest_bidder_id: int,
+    highest_offer: int,
+) -> tuple[ProxyOutcome, MemberSnapshot] | tuple[None, None]:
+    """
+    Resolves the max bids of this auction against the given highest bid.
+    Max bids of members who left the server are deleted and skipped.
+    """
+    while True:
+        outcome = resolve_proxy_bids(
+            highest_bidder_id=highest_bidder_id,
+            highest_offer=highest_offer,
+            minimum_increment=auction["minimum_increment"],
+            autobuy=auction["autobuy"],
+            proxies=get_proxy_bids(channel_id),
+        )
+        if not outcome:
+            return None, None
+        member = await MEMBER_RESOLVER.resolve(guild, outcome.bidder_id)
+        if member:
+            return outcome, member
+        await delete_proxy_bid(bot, channel_id, outcome.bidder_id)
+
+
+async def proxy_bid_func(
+    bot: commands.Bot,
+    interaction: discord.Interaction,
+    max_bid: str,
+):
+    """
+    Registers (or raises) a private max bid. Competing max bids are resolved in one step
+    and only the final highest bid is posted and persisted.
+    """
+    guild = interaction.guild
+    channel_id = interaction.channel_id
+    loader = await pretty_defer(
+        interaction=interaction, content="Registering your max bid...", ephemeral=True
+    )
+    if not proxy_bidding_enabled():
+        await loader.error(content="Max bids are not available right now.")
+        return
+
+    auction = get_auction_cache(channel_id)
+    if not auction:
+        await loader.error(content="This channel does not have an active auction.")
+        return
+    ends_on = auction["ends_on"]
+    current_time = int(time.time())
+    if current_time >= ends_on:
+        await loader.error(content="This auction has already ended.")
+        return
+    if interaction.user.id == auction["host_id"]:
+        await loader.error(content="You cannot bid on your own auction.")
+        return
+
+    ceiling = parse_compact_number(max_bid)
+    if not ceiling or ceiling <= 0:
+        await loader.error(content="Please enter a valid max bid.")
+        return
+    highest_offer = auction["highest_offer"]
+    is_leader = auction["highest_bidder_id"] == interaction.user.id
+    next_minimum = (
+        highest_offer + auction["minimum_increment"]
+        if highest_offer
+        else MIN_INITIAL_BID
+    )
+    if ceiling <= highest_offer or (not is_leader and ceiling < next_minimum):
+        await loader.error(
+            content=f"Your max bid must be at least {format_price_w_coin(next_minimum)}."
+        )
+        return
+
+    processing_message = is_being_processed(channel_id)
+    if processing_message:
+        await loader.error(content=processing_message)
+        return
+    ongoing_bidding.add(channel_id)
+    try:
+        try:
+            await upsert_proxy_bid(
+                bot=bot,
+                channel_id=channel_id,
+                bidder_id=interaction.user.id,
+                bidder_name=interaction.user.name,
+                ceiling=ceiling,
+            )
+        except Exception as e:
+            pretty_log("error", f"Error placing max bid: {e}", include_trace=True)
+            await loader.error(
+                content="An error occurred while registering your max bid."
+            )
+            return
+
+        # The max bid is stored and live from here, a failure below is only about the update
+        try:
+            outcome, bidder = await resolve_proxy_outcome(
+                bot=bot,
+                guild=guild,
+                channel_id=channel_id,
+                auction=auction,
+                highest_bidder_id=auction["highest_bidder_id"],
+                highest_offer=highest_offer,
+            )
+            if outcome:
+                await post_proxy_outcome(bot, interaction, auction, outcome, bidder)
+        except Exception as e:
+            pretty_log(
+                "error", f"Error posting max bid outcome: {e}", include_trace=True
+            )
+            await loader.error(
+                content=f"Your max bid of {format_price_w_coin(ceiling)} is registered, but posting the auction update failed."
+            )
+            return
+    finally:
+        ongoing_bidding.discard(channel_id)
+
+    auction = get_auction_cache(channel_id) or auction
+    if auction["highest_bidder_id"] == interaction.user.id:
+        status = f"You are the highest bidder at {format_price_w_coin(auction['highest_offer'])}."
+    else:
+        status = "Another max bid is still higher than yours."
+    await loader.success(
+        content=f"Your max bid of {format_price_w_coin(ceiling)} is registered. {status}"
+    )
+    pretty_log(
+        "auction",
+        f"User {interaction.user} registered a max bid in channel {interaction.channel.name}",
+    )
+
+
+async def post_proxy_outcome(
+    bot: commands.Bot,
+    interaction: discord.Interaction,
+    auction: dict,
+    outcome: ProxyOutcome,
+    bidder: MemberSnapshot,
+):
+    """Persists the resolved highest bid and posts it, ends the auction if it hit autobuy."""
+    channel_id = interaction.channel_id
+    previous_bidder_id = auction["highest_bidder_id"]
+    ends_on = auction["ends_on"]
+    new_ends_on = None
+    if not outcome.autobought:
+        new_ends_on = soft_close_deadline(
+            channel_id=channel_id,
+            ends_on=ends_on,
+            now=int(time.time()),
+            is_speed=is_speed_auction(interaction.channel),
+        )
+
+    if outcome.autobought:
+        context = "autobought"
+    elif previous_bidder_id and previous_bidder_id != outcome.bidder_id:
+        context = "outbid"
+    elif previous_bidder_id:
+        # The leader's own max bid answered a lower one
+        context = "update_bid"
+    else:
+        context = "initial_bid"
+    new_embed, content = make_auction_embed(
+        bot=bot,
+        user=await MEMBER_RESOLVER.resolve(interaction.guild, auction["host_id"])
+        or departed_member(auction["host_id"], auction.get("host_name")),
+        pokemon=auction["pokemon"],
+        unix_end=str(new_ends_on or ends_on),
+        accepted_pokemon=auction["accepted_list"],
+        gif_url=auction["image_link"],
+        context=context,
+        min_increment=auction["minimum_increment"],
+        highest_offer=outcome.amount,
+        highest_bidder=bidder,
+        last_bidder_mention=f"<@{previous_bidder_id}>" if previous_bidder_id else None,
+        autobuy=auction["autobuy"],
+        is_bulk=auction.get("is_bulk", False),
+    )
+    await persist_bid(
+        bot=bot,
+        channel_id=channel_id,
+        bidder_id=outcome.bidder_id,
+        bidder_name=outcome.bidder_name,
+        amount=outcome.amount,
+        kind="proxy",
+    )
+    if new_ends_on:
+        extend_auction_deadline(channel_id, ends_on, new_ends_on)
+
+    await interaction.channel.send(embed=new_embed)
+    if content:
+        await interaction.channel.send(content=content)
+    if outcome.autobought:
+        await delete_auction(bot, channel_id=channel_id, reason=AUTOBOUGHT)
+        await send_auction_house_banner(interaction.channel)
+        await send_auction_log(bot=bot, embed=new_embed)
+    pretty_log(
+        "auction",
+        f"Max bids resolved to {format_price_w_coin(outcome.amount)} by {outcome.bidder_name} in channel {interaction.channel.name}",
+    )
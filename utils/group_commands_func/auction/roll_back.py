@@ -17,11 +17,11 @@ from utils.autocomplete.pokemon_autocomplete import (
 )
 from utils.cache.auction_cache import get_auction_cache
 from utils.cache.cache_list import (
-    ongoing_bidding,
     processing_auction_end,
     processing_roll_back,
 )
-from utils.db.auction_db import delete_auction, update_auction_bid, upsert_auction
+from utils.cache.member_resolver import MEMBER_RESOLVER
+from utils.db.auction_bids_db import persist_bid, undo_last_bid
 from utils.db.market_value_db import fetch_lowest_market_value_cache
 from utils.essentials.auction_broadcast import broadcast_auction
 from utils.essentials.minimum_increment import (
@@ -41,11 +41,14 @@ from .start import is_being_processed, make_auction_embed
 async def roll_back_func(
     bot: commands.Bot,
     interaction: discord.Interaction,
-    member: discord.Member,
-    amount: str,
+    member: discord.Member = None,
+    amount: str = None,
 ):
-    """Handles the logic for rolling back a bid in an auction. Only usable by auctioneers."""
-    guild = interaction.guild
+    """
+    Handles the logic for rolling back a bid in an auction. Only usable by auctioneers.
+    - No member/amount: undoes the latest bid and restores the previous highest bidder.
+    - member + amount: sets that member's bid as the highest bid.
+    """
     channel_id = interaction.channel.id
     loader = await pretty_defer(
         interaction=interaction, content="Rolling back the bid...", ephemeral=False
@@ -64,6 +67,16 @@ async def roll_back_func(
         await loader.error(content="This auction has already ended.")
         return
 
+    if (member is None) != (amount is None):
+        await loader.error(
+            content="Provide both a member and an amount, or neither to undo the latest bid."
+        )
+        return
+
+    if member is None:
+        await undo_latest_bid(bot, interaction, loader, auction)
+        return
+
     host_id = auction["host_id"]
     highest_bidder_id = auction["highest_bidder_id"]
     if member.id == host_id:
@@ -85,24 +98,38 @@ async def roll_back_func(
         await loader.error(content=processing_message)
         return
     # Mark this auction as being processed
-    ongoing_bidding.add(interaction.channel.id)
     processing_roll_back.add(channel_id)
+    try:
+        await _roll_back_to_member(
+            bot, interaction, loader, auction, member, amount, channel_name
+        )
+    finally:
+        processing_roll_back.discard(channel_id)
 
+
+async def _roll_back_to_member(
+    bot: commands.Bot,
+    interaction: discord.Interaction,
+    loader,
+    auction: dict,
+    member: discord.Member,
+    amount: str,
+    channel_name: str,
+):
+    guild = interaction.guild
+    channel_id = interaction.channel.id
     try:
         amount_value = parse_compact_number(amount)
     except ValueError:
-        processing_roll_back.remove(channel_id)
         await loader.error(
             content="Invalid amount format. Please enter a valid number (e.g. '1k', '1.5m')."
         )
         return
-    if amount_value <= 0:
-        processing_roll_back.remove(channel_id)
+    if not amount_value or amount_value <= 0:
         await loader.error(content="Please enter a valid amount greater than 0.")
         return
 
     if amount_value < MIN_INITIAL_BID:
-        processing_roll_back.remove(channel_id)
         await loader.error(
             content=f"The rolled back bid must be at least {format_price_w_coin(MIN_INITIAL_BID)}."
         )
@@ -110,7 +137,7 @@ async def roll_back_func(
     # Get details
     pokemon = auction["pokemon"]
     host_id = auction["host_id"]
-    host = guild.get_member(host_id)
+    host = await MEMBER_RESOLVER.resolve(guild, host_id)
     autobuy = auction["autobuy"]
     is_bulk = auction.get("is_bulk", False)
 
@@ -131,7 +158,6 @@ async def roll_back_func(
             is_bulk=is_bulk,
         )
     except Exception as e:
-        processing_roll_back.remove(channel_id)
         content = f"Error creating auction embed: {str(e)}"
         await loader.error(content=content)
         pretty_log(
@@ -141,21 +167,21 @@ async def roll_back_func(
         return
     # Update auction in database
     try:
-        await update_auction_bid(
+        await persist_bid(
             bot=bot,
             channel_id=channel_id,
-            highest_bidder_id=member.id,
-            highest_offer=amount_value,
+            bidder_id=member.id,
+            bidder_name=member.name,
+            amount=amount_value,
+            kind="roll_back",
         )
         await interaction.channel.send(embed=embed)
         await loader.success(content="Bid rolled back successfully.")
-        processing_roll_back.remove(channel_id)
         pretty_log(
             "auction",
             f"Bid rolled back to {format_price_w_coin(amount_value)} for {member.display_name} by {interaction.user.name} in channel {channel_name}",
         )
     except Exception as e:
-        processing_roll_back.remove(channel_id)
         content = f"Error updating auction bid in database: {str(e)}"
         await loader.error(content=content)
         pretty_log(
@@ -163,3 +189,74 @@ async def roll_back_func(
             f"Error updating auction bid in database during bid roll back in channel {channel_name}: {str(e)}",
         )
         return
+
+
+async def undo_latest_bid(
+    bot: commands.Bot,
+    interaction: discord.Interaction,
+    loader,
+    auction: dict,
+):
+    """Pops the latest bid off the bid stack and restores the previous highest bidder."""
+    guild = interaction.guild
+    channel_id = interaction.channel.id
+    channel_name = interaction.channel.name
+
+    processing_message = is_being_processed(channel_id)
+    if processing_message:
+        await loader.error(content=processing_message)
+        return
+    processing_roll_back.add(channel_id)
+    try:
+        result = await undo_last_bid(bot, channel_id)
+    except Exception as e:
+        await loader.error(content=f"Error updating auction bid in database: {str(e)}")
+        return
+    finally:
+        processing_roll_back.discard(channel_id)
+
+    if result is None:
+        await loader.error(content="There are no recorded bids to roll back.")
+        return
+    undone, restored = result
+
+    restored_bidder_id = restored["bidder_id"] if restored else 0
+    members = await MEMBER_RESOLVER.resolve_many(
+        guild, [auction["host_id"], restored_bidder_id]
+    )
+    restored_member = members.get(restored_bidder_id)
+    host = members.get(auction["host_id"])
+    restored_amount = restored["amount"] if restored else 0
+    try:
+        embed, _ = make_auction_embed(
+            bot=bot,
+            user=host,
+            pokemon=auction["pokemon"],
+            autobuy=auction["autobuy"],
+            unix_end=str(auction["ends_on"]),
+            accepted_pokemon=auction["accepted_list"],
+            highest_offer=restored_amount,
+            min_increment=auction["minimum_increment"],
+            highest_bidder=restored_member,
+            gif_url=auction["image_link"],
+            context="roll_back",
+            is_bulk=auction.get("is_bulk", False),
+        )
+        await interaction.channel.send(embed=embed)
+    except Exception as e:
+        pretty_log(
+            "error",
+            f"Error sending rolled back auction embed in channel {channel_name}: {str(e)}",
+        )
+
+    if restored:
+        summary = f"highest bid is now {format_price_w_coin(restored_amount)} by {restored['bidder_name']}"
+    else:
+        summary = "there are no bids left"
+    await loader.success(
+        content=f"Rolled back {undone['bidder_name']}'s bid of {format_price_w_coin(undone['amount'])}, {summary}."
+    )
+    pretty_log(
+        "auction",
+        f"Latest bid ({format_price_w_coin(undone['amount'])} by {undone['bidder_name']}) undone by {interaction.user.name} in channel {channel_name}",
+    )
@@ -8,9 +8,9 @@ from constants.auction import MIN_AUCTION_VALUE
 from constants.grand_line_auction_constants import (
     GLA_SERVER_ID,
     GRAND_LINE_AUCTION_ROLES,
-    GRAND_LINE_AUCTION_TEXT_CHANNELS,
     KHY_CHANNEL_ID,
 )
+from constants.guild_config import SPEED_AUCTION_CHANNEL
 from constants.rarity import (
     RARITY_MAP,
     get_rarity,
@@ -25,15 +25,14 @@ from utils.cache.cache_list import (
     processing_roll_back,
     processing_update_ends_on,
 )
+from utils.cache.guild_config_cache import get_guild_config
+from utils.cache.member_resolver import avatar_url_of
 from utils.db.auction_db import upsert_auction
-from utils.db.market_value_db import (
-    check_and_load_market_cache,
-    fetch_lowest_market_value_cache,
-)
+from utils.db.market_value_db import check_and_load_market_cache
 from utils.essentials.auction_broadcast import broadcast_auction
+from utils.essentials.auction_rules import get_auction_rule
+from utils.essentials.auction_state import is_auction_ending
 from utils.essentials.minimum_increment import (
-    compute_maximum_auction_duration_seconds,
-    compute_minimum_increment,
     format_names_for_market_value_lookup,
 )
 from utils.functions.auction import check_if_right_channel_rarity, is_auction_channel
@@ -65,7 +64,7 @@ def is_speed_auction(channel: discord.TextChannel) -> bool:
     if TESTING_SPEED_AUCTION:
         return True
 
-    if channel.id == GRAND_LINE_AUCTION_TEXT_CHANNELS.speed_auction:
+    if channel.id in get_guild_config(channel.guild.id).ids(SPEED_AUCTION_CHANNEL):
         return True
     else:
         return False
@@ -82,7 +81,7 @@ def is_being_processed(channel_id: int) -> str | None:
     """Returns a custom error message if the auction in the given channel is being processed, otherwise None."""
     if channel_id in ongoing_bidding:
         return "Another bid is currently being processed. Please wait a moment and try again."
-    if channel_id in processing_auction_end:
+    if channel_id in processing_auction_end or is_auction_ending(channel_id):
         return "This auction is currently being ended. You cannot place a bid at this time."
     if channel_id in processing_roll_back:
         return "A bid rollback is currently being processed for this auction. Please wait a moment and try again."
@@ -150,7 +149,7 @@ def make_auction_embed(
         color=color,
         timestamp=datetime.now(),
     )
-    embed.set_author(name=f"{user.name}'s Auction", icon_url=user.avatar.url)
+    embed.set_author(name=f"{user.name}'s Auction", icon_url=avatar_url_of(user))
     if message_link:
         embed.add_field(
             name="Auction Link",
@@ -251,24 +250,10 @@ async def start_auction_func(
         interaction=interaction, content="Starting auction...", ephemeral=False
     )
 
-    from utils.cache.auction_cache import (
-        if_user_has_ongoing_auction_cache,
-        is_there_ongoing_auction_cache,
-    )
-
-    # Check if caches are populated
-    auc, market = await check_and_load_auction_and_market_cache(bot)
-    if auc is None or market is None:
-        await loader.error(
-            content="Caches are still loading. Please try again in a moment."
-        )
-        return
+    from utils.cache.auction_cache import if_user_has_ongoing_auction_cache
 
-    if is_there_ongoing_auction_cache(interaction.channel.id):
-        await loader.error(
-            content="There is already an ongoing auction in this channel."
-        )
-        return
+    # Cache warm-up and the ongoing auction check run in the interaction pipeline
+    # preconditions (caches_ready, no_active_auction) before this is called
 
     try:
         user = interaction.user
@@ -307,8 +292,9 @@ async def start_auction_func(
             await send_to_khy_channel(interaction.guild, content=content)
             return
 
-        # Compute minimum increment to validate auctionability and get duration limit
-        min_increment, msg = compute_minimum_increment(pokemon, rarity)
+        # Pre-evaluated auction rule: increment, duration limit and validation in one lookup
+        rule = get_auction_rule(pokemon, rarity)
+        min_increment, msg = rule.min_increment, rule.error
         if min_increment == 0:
             debug_log(f"Could not compute minimum increment for {pokemon}.")
             await loader.error(content=msg)
@@ -319,19 +305,8 @@ async def start_auction_func(
             return
         debug_log(f"Minimum increment for {pokemon} is {min_increment}.")
 
-        # Ensure consistent formatting for market value lookup
-        from utils.essentials.minimum_increment import (
-            format_names_for_market_value_lookup,
-        )
-
-        formatted_pokemon = format_names_for_market_value_lookup(pokemon)
-        lowest_market_value = fetch_lowest_market_value_cache(formatted_pokemon)
-        debug_log(
-            f"Lowest market value for {formatted_pokemon} is {lowest_market_value}."
-        )
-        max_duration_seconds = compute_maximum_auction_duration_seconds(
-            lowest_market_value
-        )
+        lowest_market_value = rule.market_value
+        max_duration_seconds = rule.max_duration_seconds
         debug_log(
             f"Maximum auction duration for {pokemon} is {max_duration_seconds} seconds."
         )
@@ -482,6 +457,7 @@ async def start_auction_func(
                 bot=bot,
                 guild=interaction.guild,
                 embed=broadcast_embed,
+                auction_channel_id=interaction.channel.id,
             )
 
     except Exception as e:
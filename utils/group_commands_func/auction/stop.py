@@ -5,6 +5,7 @@ from discord.ext import commands
 
 from constants.aesthetic import Images
 from utils.db.auction_db import delete_auction, fetch_auction_by_channel_id
+from utils.db.auction_results_db import STOPPED
 from utils.essentials.minimum_increment import format_names_for_market_value_lookup
 from utils.logs.debug_log import debug_log, enable_debug
 from utils.logs.pretty_log import pretty_log
@@ -39,7 +40,7 @@ async def stop_auction_func(
     else:
         formatted_display = "Bulk Pokemon"
     # Delete the auction from the database
-    await delete_auction(bot, channel_id)
+    await delete_auction(bot, channel_id, reason=STOPPED)
     channel_name = (
         interaction.channel.name if interaction.channel else "Unknown Channel"
     )
@@ -6,6 +6,7 @@ from discord.ext import commands
 
 from utils.cache.auction_cache import get_auction_cache
 from utils.cache.cache_list import processing_update_ends_on
+from utils.cache.member_resolver import MEMBER_RESOLVER
 from utils.db.auction_db import update_ends_on
 from utils.logs.debug_log import debug_log, enable_debug
 from utils.logs.pretty_log import pretty_log
@@ -72,18 +73,12 @@ async def update_ends_on_func(
     pokemon = auction["pokemon"]
     is_bulk = auction.get("is_bulk", False)
     host_id = auction["host_id"]
-    host = guild.get_member(host_id)
     autobuy = auction["autobuy"]
     highest_offer = auction["highest_offer"]
     highest_bidder_id = auction["highest_bidder_id"]
-    highest_bidder = None
-    if highest_bidder_id:
-        highest_bidder = guild.get_member(highest_bidder_id)
-        if not highest_bidder:
-            # Fetch user object
-            highest_bidder = await bot.fetch_user(highest_bidder_id)
-            if not highest_bidder:
-                highest_bidder = None
+    members = await MEMBER_RESOLVER.resolve_many(guild, [host_id, highest_bidder_id])
+    host = members.get(host_id)
+    highest_bidder = members.get(highest_bidder_id)
 
     # Create embed with new rolled back bid details
     try:
@@ -1,6 +1,4 @@
-import re
 import time
-from collections import defaultdict
 
 import discord
 from discord.ext import commands
@@ -8,14 +6,13 @@ from discord.ext import commands
 from constants.aesthetic import Images
 from constants.auction import MAX_SPEED_AUCTION_SECONDS
 from constants.grand_line_auction_constants import GRAND_LINE_AUCTION_ROLES
-from constants.rarity import RARITY_MAP, get_rarity, is_mon_auctionable
+from constants.rarity import RARITY_MAP
 from utils.autocomplete.pokemon_autocomplete import format_price_w_coin
 from utils.db.auction_db import upsert_auction
 from utils.essentials.auction_broadcast import broadcast_auction
+from utils.essentials.auction_rules import evaluate_bulk_auction_rule
 from utils.essentials.minimum_increment import (
     MIN_AUCTION_VALUE,
-    compute_maximum_auction_duration_seconds,
-    compute_minimum_increment_for_bulk,
     compute_total_bulk_value,
 )
 from utils.functions.auction import check_if_right_channel_rarity, is_auction_channel
@@ -24,12 +21,12 @@ from utils.group_commands_func.auction.start import (
     TESTING,
     TESTING_BROADCAST,
     TESTING_DURATION,
-    check_and_load_auction_and_market_cache,
     is_speed_auction,
     make_auction_embed,
 )
 from utils.logs.debug_log import debug_log, enable_debug
 from utils.logs.pretty_log import pretty_log
+from utils.parser.bulk_parser import parse_bulk_list
 from utils.parser.duration_parser import format_seconds, parse_duration
 from utils.parser.number_parser import parse_compact_number
 from utils.visuals.pretty_defer import pretty_defer
@@ -38,6 +35,7 @@ from utils.visuals.pretty_defer import pretty_defer
 
 
 MAX_DURATION_SECONDS = 18_000
+MAX_LISTED_ERRORS = 15  # Keeps the error message under Discord's 2000 chars
 
 
 def extract_pokemon_list_and_validate(pokemon):
@@ -45,49 +43,9 @@ def extract_pokemon_list_and_validate(pokemon):
     Extracts a list of Pokémon from a comma-separated string.
     Accepts entries like '2 shiny cottonee' and combines duplicates.
     Invalidates entries like 'shiny cottonee 2'.
-    Returns: valid_pokemon (list of (name, qty)), invalid_pokemon (list), rarities (list), total_count (int)
+    Returns: valid_pokemon (list of (name, qty)), errors (list of BulkError), rarities (list), total_count (int)
     """
-    valid_pokemon = []
-    invalid_pokemon = []
-    rarities = []
-    count_map = defaultdict(int)
-    total_count = 0
-
-    if not pokemon:
-        return [], [], [], 0
-
-    for p in pokemon.split(","):
-        p = p.strip().lower()
-        if not p:
-            continue
-        # Match "quantity pokemon" (quantity can be compact number)
-        match = re.match(r"^([\d,.a-z]+)\s+(.+)$", p)
-        if match:
-            qty_raw = match.group(1).replace(",", "")
-            name = match.group(2).strip()
-            qty = parse_compact_number(qty_raw)
-            # Reject if name ends with a number (e.g., "shiny cottonee 2") or qty is invalid
-            if re.search(r"\d+$", name) or qty is None:
-                invalid_pokemon.append(p)
-                continue
-        else:
-            # Reject if number at end
-            if re.search(r"\d+$", p):
-                invalid_pokemon.append(p)
-                continue
-            qty = 1
-            name = p
-
-        if is_mon_auctionable(name):
-            rarity = get_rarity(name)
-            rarities.append(rarity)
-            count_map[name] += qty
-            total_count += qty
-        else:
-            invalid_pokemon.append(p)
-
-    valid_pokemon = [(name, count) for name, count in count_map.items()]
-    return valid_pokemon, invalid_pokemon, rarities, total_count
+    return parse_bulk_list(pokemon)
 
 
 async def bulk_start_auction_func(
@@ -105,18 +63,10 @@ async def bulk_start_auction_func(
         interaction=interaction, content="Generating embed...", ephemeral=False
     )
 
-    from utils.cache.auction_cache import (
-        if_user_has_ongoing_auction_cache,
-        is_there_ongoing_auction_cache,
-    )
+    from utils.cache.auction_cache import if_user_has_ongoing_auction_cache
 
-    # Check if caches are populated
-    auc, market = await check_and_load_auction_and_market_cache(bot)
-    if auc is None or market is None:
-        await loader.error(
-            content="Caches are still loading. Please try again in a moment."
-        )
-        return
+    # Cache warm-up and the ongoing auction check run in the interaction pipeline
+    # preconditions (caches_ready, no_active_auction) before this is called
 
     # Check if auction channel
     passed, error_msg = is_auction_channel(interaction.channel, interaction.user)
@@ -124,13 +74,6 @@ async def bulk_start_auction_func(
         await loader.error(content=error_msg)
         return
 
-    # Check if ongoing auction in channel
-    if is_there_ongoing_auction_cache(interaction.channel.id):
-        await loader.error(
-            content="There is already an ongoing auction in this channel."
-        )
-        return
-
     try:
         user = interaction.user
         debug_log(
@@ -152,8 +95,14 @@ async def bulk_start_auction_func(
         if invalid_pokemon:
             debug_log(f"Invalid Pokémon in the list: {invalid_pokemon}")
             content = (
-                f"We couldn't find the following pokemon in our list: {', '.join(invalid_pokemon)}\n"
-                f"Kindly check the spelling, prefix, or check if the pokemon is in game. Contact auctioneer if you think this is a mistake.\n"
+                "We couldn't use the following entries of your list:\n"
+                + "\n".join(f"> - {error}" for error in invalid_pokemon[:MAX_LISTED_ERRORS])
+                + (
+                    f"\n> - ...and {len(invalid_pokemon) - MAX_LISTED_ERRORS} more"
+                    if len(invalid_pokemon) > MAX_LISTED_ERRORS
+                    else ""
+                )
+                + "\nKindly check the spelling, prefix, or check if the pokemon is in game. Contact auctioneer if you think this is a mistake.\n"
             )
             await loader.error(content=content)
             return
@@ -198,10 +147,9 @@ async def bulk_start_auction_func(
             await loader.error(content=content)
             return
 
-        # Compute minimum increment to validate auctionability and get duration limit
-        min_increment, msg = compute_minimum_increment_for_bulk(
-            total_bulk_value, rarity, any_exclusive
-        )
+        # Evaluate auction rule: increment, duration limit and validation in one call
+        rule = evaluate_bulk_auction_rule(total_bulk_value, rarity, any_exclusive)
+        min_increment, msg = rule.min_increment, rule.error
         if min_increment == 0:
             debug_log(f"Could not compute minimum increment for {pokemon}.")
             await loader.error(content=msg)
@@ -212,10 +160,7 @@ async def bulk_start_auction_func(
             return
         debug_log(f"Minimum increment for {pokemon} is {min_increment}.")
 
-        # Compute maximum duration for the bulk based on its total value
-        max_duration_seconds = compute_maximum_auction_duration_seconds(
-            total_bulk_value
-        )
+        max_duration_seconds = rule.max_duration_seconds
         debug_log(
             f"Maximum auction duration for {pokemon} is {max_duration_seconds} seconds."
         )
@@ -356,6 +301,7 @@ async def bulk_start_auction_func(
                 bot=bot,
                 guild=interaction.guild,
                 embed=broadcast_embed,
+                auction_channel_id=interaction.channel.id,
             )
 
     except Exception as e:
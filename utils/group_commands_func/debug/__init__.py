@@ -0,0 +1,9 @@
+from .metrics import metrics_func
+from .toggle import debug_list_func, debug_path_autocomplete, debug_toggle_func
+
+__all__ = [
+    "debug_toggle_func",
+    "debug_list_func",
+    "debug_path_autocomplete",
+    "metrics_func",
+]
@@ -0,0 +1,81 @@
+import io
+import time
+
+import discord
+
+from utils.logs.metrics import METRICS, STARTED_AT, format_labels
+
+MAX_MESSAGE_LENGTH = 2000
+
+
+def _format_uptime(seconds: float) -> str:
+    hours, remainder = divmod(int(seconds), 3600)
+    minutes, seconds = divmod(remainder, 60)
+    return f"{hours}h {minutes}m {seconds}s"
+
+
+def render_metrics_report(name_filter: str = None) -> str:
+    """Plain-text snapshot of every metric, histograms as count/p50/p90/p99/max in ms."""
+    name_filter = (name_filter or "").lower()
+    lines = [f"uptime {_format_uptime(time.time() - STARTED_AT)}", ""]
+
+    histogram_lines = []
+    for name, series in sorted(METRICS.histograms.items()):
+        for key, histogram in sorted(series.items()):
+            label = f"{name}{format_labels(key)}"
+            if name_filter and name_filter not in label.lower():
+                continue
+            histogram_lines.append(
+                f"{label}\n"
+                f"  n={histogram.count:,} p50={histogram.percentile(50):.1f} "
+                f"p90={histogram.percentile(90):.1f} p99={histogram.percentile(99):.1f} "
+                f"max={histogram.max:.1f}"
+            )
+    if histogram_lines:
+        lines.append("── latency (ms) ──")
+        lines.extend(histogram_lines)
+        lines.append("")
+
+    counter_lines = []
+    for name, series in sorted(METRICS.counters.items()):
+        for key, value in sorted(series.items()):
+            label = f"{name}{format_labels(key)}"
+            if name_filter and name_filter not in label.lower():
+                continue
+            counter_lines.append(f"{label} {value:,}")
+    if counter_lines:
+        lines.append("── counters ──")
+        lines.extend(counter_lines)
+        lines.append("")
+
+    gauge_lines = []
+    for name, series in sorted(METRICS.read_gauges().items()):
+        for key, value in series.items():
+            label = f"{name}{format_labels(key)}"
+            if name_filter and name_filter not in label.lower():
+                continue
+            gauge_lines.append(f"{label} {value:,.0f}")
+    if gauge_lines:
+        lines.append("── gauges ──")
+        lines.extend(gauge_lines)
+
+    return "\n".join(lines).strip()
+
+
+# 🌸──────────────────────────────────────────────────────
+# 🔹 /metrics
+# ───────────────────────────────────────────────────────
+async def metrics_func(bot, interaction: discord.Interaction, name_filter: str = None):
+    """Shows live percentiles, counters and gauges, as a .txt file if it doesn't fit."""
+    report = render_metrics_report(name_filter)
+    content = f"```\n{report}\n```"
+    if len(content) <= MAX_MESSAGE_LENGTH:
+        await interaction.response.send_message(content, ephemeral=True)
+        return
+
+    file = discord.File(io.BytesIO(report.encode("utf-8")), filename="metrics.txt")
+    await interaction.response.send_message(
+        "Metrics snapshot is too long for one message, attached as a file.",
+        file=file,
+        ephemeral=True,
+    )
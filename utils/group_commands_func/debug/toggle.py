@@ -0,0 +1,61 @@
+import discord
+from discord import app_commands
+
+from utils.logs.debug_log import debug_enabled, known_debug_paths, toggle_debug
+from utils.logs.pretty_log import pretty_log
+
+
+# 🌸──────────────────────────────────────────────────────
+# 🔹 Autocomplete for known debug paths
+# ───────────────────────────────────────────────────────
+async def debug_path_autocomplete(
+    interaction: discord.Interaction, current: str
+) -> list[app_commands.Choice[str]]:
+    current = (current or "").lower()
+    choices = []
+    for path in known_debug_paths():
+        if current in path.lower():
+            state = "🟢" if debug_enabled(path) else "⚪"
+            choices.append(app_commands.Choice(name=f"{state} {path}"[:100], value=path))
+        if len(choices) >= 25:
+            break
+    return choices
+
+
+# 🌸──────────────────────────────────────────────────────
+# 🔹 /debug toggle
+# ───────────────────────────────────────────────────────
+async def debug_toggle_func(
+    bot,
+    interaction: discord.Interaction,
+    func_path: str,
+):
+    """Flips debug logging for a function path (module.function) at runtime."""
+    func_path = func_path.strip()
+    if "." not in func_path:
+        await interaction.response.send_message(
+            "Use the full path, e.g. `utils.db.market_value_db.pokemon_autocomplete`.",
+            ephemeral=True,
+        )
+        return
+
+    enabled = toggle_debug(func_path)
+    state = "enabled 🟢" if enabled else "disabled ⚪"
+    pretty_log("info", f"Debug logging {state} for {func_path} by {interaction.user}")
+    await interaction.response.send_message(
+        f"Debug logging {state} for `{func_path}`", ephemeral=True
+    )
+
+
+# 🌸──────────────────────────────────────────────────────
+# 🔹 /debug list
+# ───────────────────────────────────────────────────────
+async def debug_list_func(bot, interaction: discord.Interaction):
+    enabled = [path for path in known_debug_paths() if debug_enabled(path)]
+    if not enabled:
+        content = "No debug logging is enabled."
+    else:
+        content = "**Debug logging enabled for:**\n" + "\n".join(
+            f"- `{path}`" for path in enabled
+        )
+    await interaction.response.send_message(content[:2000], ephemeral=True)
@@ -7,11 +7,12 @@ from discord.ext import commands
 from discord.ui import Button, View
 
 from constants.grand_line_auction_constants import DEFAULT_EMBED_COLOR, KHY_CHANNEL_ID
-from constants.paldea_galar_dict import get_dex_number_by_name
-from constants.rarity import RARITY_MAP, get_rarity, in_game_mons_list
 from utils.cache.cache_list import market_value_cache
-from utils.db.market_value_db import fetch_market_value_cache
-from utils.essentials.minimum_increment import format_names_for_market_value_lookup
+from utils.cache.market_value_coverage import (
+    coverage_counts,
+    export_coverage_gaps_csv,
+    missing_market_value_lines,
+)
 from utils.logs.debug_log import debug_log, enable_debug
 from utils.logs.pretty_log import pretty_log
 from utils.visuals.pretty_defer import pretty_defer
@@ -55,7 +56,9 @@ class Paginator(View):
             await self.update_page(interaction)
 
 
-async def market_value_filter_func(bot: commands.Bot, interaction: discord.Interaction):
+async def market_value_filter_func(
+    bot: commands.Bot, interaction: discord.Interaction, export_csv: bool = False
+):
     """Filters in game mons with no market value data."""
     loader = await pretty_defer(
         interaction=interaction,
@@ -68,39 +71,14 @@ async def market_value_filter_func(bot: commands.Bot, interaction: discord.Inter
             content="Market value data is currently unavailable. Please try again later."
         )
         return
-    total_in_game_mons = len(in_game_mons_list)
+    total_in_game_mons, _ = coverage_counts()
     pretty_log(
         "info",
         f"Total in-game mons to filter: {total_in_game_mons} mons found.",
     )
 
-    filtered_mons = []
-    no_value_mons = []
-    priority_no_value_mons = []
-    low_priority_no_value_mons = []
-    for mon in in_game_mons_list:
-        dex = get_dex_number_by_name(mon)
-        dex_str = dex if dex is not None else "N/A"
-        formatted_name = format_names_for_market_value_lookup(mon)
-        mon = mon.title()  # Capitalize for better display
-        mon_str = f"{mon} #{dex_str}"
-        if formatted_name in market_value_cache:
-            filtered_mons.append(mon_str)
-        else:
-            # Check rarity and prioritize golden, shiny, mega, gmax, shiny mega, and shiny gmax mons in the no value list
-            rarity = get_rarity(mon)
-            if rarity in [
-                "golden",
-                "shiny",
-                "mega",
-                "gigantamax",
-                "shiny mega",
-                "shiny gigantamax",
-            ]:
-                priority_no_value_mons.append(mon_str)
-            else:
-                low_priority_no_value_mons.append(mon_str)
-            no_value_mons = priority_no_value_mons + low_priority_no_value_mons
+    # Coverage index is kept in sync on every market value write
+    no_value_mons = missing_market_value_lines()
 
     if len(no_value_mons) == 0:
         await loader.success(
@@ -166,6 +144,14 @@ async def market_value_filter_func(bot: commands.Bot, interaction: discord.Inter
             view=Paginator(embeds),
             ephemeral=False,
         )
+        if export_csv:
+            stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            await interaction.followup.send(
+                file=discord.File(
+                    export_coverage_gaps_csv(),
+                    filename=f"market_value_gaps_{stamp}.csv",
+                )
+            )
     except Exception as e:
         debug_log(f"Error sending market value filter embeds: {e}")
         await loader.error(
@@ -7,7 +7,6 @@ from discord import app_commands
 from discord.ext import commands
 
 from constants.grand_line_auction_constants import KHY_CHANNEL_ID
-from constants.paldea_galar_dict import get_dex_number_by_name
 from constants.rarity import RARITY_MAP, get_rarity, is_mon_exclusive
 from utils.autocomplete.pokemon_autocomplete import (
     format_price_w_coin,
@@ -21,6 +20,7 @@ from utils.db.market_value_db import (
     update_market_value,
 )
 from utils.essentials.auction_broadcast import broadcast_auction
+from utils.essentials.dex_service import get_dex_number
 from utils.logs.debug_log import debug_log, enable_debug
 from utils.logs.pretty_log import pretty_log
 from utils.parser.number_parser import parse_compact_number
@@ -64,7 +64,7 @@ async def update_market_value_func(
     rarity = get_rarity(pokemon)
     rarity_emoji = RARITY_MAP.get(rarity, {}).get("emoji", "")
     color = RARITY_MAP.get(rarity, {}).get("color", 0xFFFFFF)
-    dex = get_dex_number_by_name(pokemon)
+    dex = get_dex_number(pokemon)
     dex = str(dex) if dex is not None else "N/A"
     clean_name = strip_prefixes(pokemon)
 
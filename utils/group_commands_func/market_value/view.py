@@ -7,7 +7,6 @@ from discord import app_commands
 from discord.ext import commands
 
 from constants.grand_line_auction_constants import KHY_CHANNEL_ID
-from constants.paldea_galar_dict import get_dex_number_by_name
 from constants.rarity import RARITY_MAP, get_rarity, is_mon_auctionable
 from utils.autocomplete.pokemon_autocomplete import (
     format_price_w_coin,
@@ -16,6 +15,7 @@ from utils.autocomplete.pokemon_autocomplete import (
 from utils.db.auction_db import upsert_auction
 from utils.db.market_value_db import fetch_market_value_cache
 from utils.essentials.auction_broadcast import broadcast_auction
+from utils.essentials.dex_service import get_dex_number
 from utils.logs.debug_log import debug_log, enable_debug
 from utils.logs.pretty_log import pretty_log
 from utils.parser.duration_parser import parse_duration
@@ -126,7 +126,7 @@ async def view_market_value_func(
     is_exclusive = market_data.get("is_exclusive", False)
     rarity = get_rarity(pokemon)
     rarity_emoji = RARITY_MAP.get(rarity, {}).get("emoji", "")
-    dex = get_dex_number_by_name(pokemon)
+    dex = get_dex_number(pokemon)
     dex = str(dex) if dex is not None else "N/A"
     clean_name = strip_prefixes(market_formatted_name)
     formatted_pokemon = (
@@ -30,6 +30,7 @@ from utils.essentials.minimum_increment import (
     format_names_for_market_value_lookup,
 )
 from utils.logs.debug_log import debug_log, enable_debug
+from utils.logs.metrics import timed_listener
 from utils.logs.pretty_log import pretty_log
 
 from .mh_lookup_listener import extract_pokemon_name_before_hash
@@ -37,6 +38,7 @@ from .mh_lookup_listener import extract_pokemon_name_before_hash
 enable_debug(f"{__name__}.dex_listener")
 
 
+@timed_listener
 async def dex_listener(bot, message: discord.Message):
     """Listens to dex command and updates the image link in the market value cache if it differs from the one in the command output."""
     embed = message.embeds[0] if message.embeds else None
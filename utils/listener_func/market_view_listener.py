@@ -16,7 +16,8 @@ from utils.db.market_value_db import (
     fetch_pokemon_exclusivity_cache,
     update_market_value_via_listener,
 )
-from utils.logs.debug_log import debug_log, enable_debug
+from utils.logs.debug_log import debug_log, enable_debug, get_debug_logger
+from utils.logs.metrics import timed_listener
 from utils.logs.pretty_log import pretty_log
 
 from .price_data_listener import pink_check_react_if_khy
@@ -41,6 +42,9 @@ def extract_pokemon_name_from_author(author_name: str) -> str | None:
     return None
 
 
+listing_log = get_debug_logger(__name__, "parse_first_market_listing")
+
+
 def parse_first_market_listing(
     embed_description: str,
 ) -> Optional[Tuple[str, int, int]]:
@@ -77,10 +81,10 @@ def parse_first_market_listing(
     rarity_emojis = ["common", "uncommon", "rare", "superrare", "legendary"]
 
     for idx, line in enumerate(embed_description.splitlines()):
-        debug_log(f"Parsing line {idx}: {line}")
+        listing_log("Parsing line {}: {}", idx, line)
         match = listing_pattern.search(line)
         if match:
-            debug_log(f"Regex matched line {idx}: {line}")
+            listing_log("Regex matched line {}: {}", idx, line)
             emoji_block = match.group(1)  # all emojis before name
             pokemon_name = match.group(2)
             price_each = int(match.group(3).replace(",", ""))
@@ -94,7 +98,7 @@ def parse_first_market_listing(
                     emoji_names.append(parts[1].lower())
                 else:
                     emoji_names.append(parts[0].lower())
-            debug_log(f"Emoji names found: {emoji_names}")
+            listing_log("Emoji names found: {}", emoji_names)
 
             # Remove rarity emojis
             filtered = [e for e in emoji_names if e not in rarity_emojis]
@@ -131,13 +135,14 @@ def parse_first_market_listing(
                             form_prefix += " "
                         form_prefix += form_label
             full_name = f"{form_prefix} {pokemon_name}".strip()
-            debug_log(f"Final parsed name: {full_name}")
+            listing_log("Final parsed name: {}", full_name)
             return (full_name, price_each, date_listed)
 
-    debug_log("No regex match found in any line.")
+    listing_log("No regex match found in any line.")
     return None
 
 
+@timed_listener
 async def market_view_listener(bot: discord.Client, message: discord.Message):
     """
     Listener function to process market view messages and update market values in the database.
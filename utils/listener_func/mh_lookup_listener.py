@@ -29,6 +29,7 @@ from utils.essentials.minimum_increment import (
     format_names_for_market_value_lookup,
 )
 from utils.logs.debug_log import debug_log, enable_debug
+from utils.logs.metrics import timed_listener
 from utils.logs.pretty_log import pretty_log
 
 from .price_data_listener import pink_check_react_if_khy
@@ -61,6 +62,7 @@ def extract_lowest_market_from_embed(embed) -> int | None:
     return None
 
 
+@timed_listener
 async def lookup_listener(bot, message: discord.Message):
     """Listens to mh lookup command outputs and updates market value cache accordingly."""
     embed = message.embeds[0] if message.embeds else None
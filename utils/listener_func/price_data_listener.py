@@ -27,6 +27,7 @@ from utils.essentials.minimum_increment import (
     format_names_for_market_value_lookup,
 )
 from utils.logs.debug_log import debug_log, enable_debug
+from utils.logs.metrics import timed_listener
 from utils.logs.pretty_log import pretty_log
 
 # enable_debug(f"{__name__}.price_data_listener")
@@ -95,6 +96,7 @@ def extract_price_from_embed(embed: discord.Embed) -> Optional[int]:
     return None
 
 
+@timed_listener
 async def price_data_listener(bot: discord.Client, message: discord.Message):
     """Listens to price data embeds"""
     embed = message.embeds[0] if message.embeds else None
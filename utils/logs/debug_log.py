@@ -1,5 +1,5 @@
 # utils/loggers/smart_debug.py
-import inspect
+import sys
 from datetime import datetime
 import discord
 
@@ -7,49 +7,130 @@ import discord
 # 🔹 Global Debug Toggles
 # -----------------------------
 DEBUG_TOGGLES: dict[str, bool] = {}
+_ENABLED_KEYS: set[str] = set()
+
+# 🌸 pastel pink + underline for highlights
+COLOR_PASTEL_PINK = "\033[38;2;255;182;193m\033[4m"
+COLOR_RESET = "\033[0m"
+
+
+class DebugLogger:
+    """
+    Per-function debug logger, the enabled flag is resolved once and
+    flipped by enable_debug/disable_debug, so a disabled call is a single attribute check.
+    Pass values as arguments instead of an f-string, they are only formatted when enabled.
+
+    Usage:
+        log = get_debug_logger(__name__, "compute_minimum_increment")
+        log("value={:,} increment={:,}", value, increment)
+        if log.enabled:  # skip computing expensive arguments
+            log("{}", expensive())
+    """
+
+    __slots__ = ("key", "func_name", "enabled")
+
+    def __init__(self, key: str, func_name: str):
+        self.key = key
+        self.func_name = func_name
+        self.enabled = DEBUG_TOGGLES.get(key, False)
+
+    def __call__(
+        self, message: str, *args, highlight: bool = False, force: bool = False
+    ):
+        if not self.enabled and not force:
+            return
+        _emit(self.func_name, message.format(*args) if args else message, highlight)
+
+
+# key = "module.function"
+DEBUG_LOGGERS: dict[str, DebugLogger] = {}
+# code object -> "module.function", so debug_log resolves its caller once per call site
+_CALL_SITE_KEYS: dict = {}
+
+
+def get_debug_logger(module_name: str, func_name: str) -> DebugLogger:
+    key = f"{module_name}.{func_name}"
+    logger = DEBUG_LOGGERS.get(key)
+    if logger is None:
+        logger = DebugLogger(key, func_name)
+        DEBUG_LOGGERS[key] = logger
+    return logger
+
+
+def _set_debug(func_path: str, value: bool):
+    DEBUG_TOGGLES[func_path] = value
+    if value:
+        _ENABLED_KEYS.add(func_path)
+    else:
+        _ENABLED_KEYS.discard(func_path)
+    logger = DEBUG_LOGGERS.get(func_path)
+    if logger:
+        logger.enabled = value
 
 
 def enable_debug(func_path: str):
-    DEBUG_TOGGLES[func_path] = True
+    _set_debug(func_path, True)
 
 
 def disable_debug(func_path: str):
-    DEBUG_TOGGLES[func_path] = False
+    _set_debug(func_path, False)
 
 
 def debug_enabled(func_path: str) -> bool:
     return DEBUG_TOGGLES.get(func_path, False)
 
 
+def toggle_debug(func_path: str) -> bool:
+    """Flips the debug toggle for a function path, returns the new value."""
+    new_value = not debug_enabled(func_path)
+    _set_debug(func_path, new_value)
+    return new_value
+
+
+def known_debug_paths() -> list[str]:
+    """All function paths that have a logger or a toggle, used for autocomplete."""
+    return sorted(set(DEBUG_LOGGERS) | set(DEBUG_TOGGLES) | set(_CALL_SITE_KEYS.values()))
+
+
+def _emit(func_name: str, message: str, highlight: bool):
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    log_line = f"[{timestamp}] [🧪 {func_name}] {message}"
+
+    if highlight:
+        log_line = f"{COLOR_PASTEL_PINK}{log_line}{COLOR_RESET}"
+
+    print(log_line)
+
+
 # -----------------------------
 # 🔹 Core debug_log
 # -----------------------------
 def debug_log(
-    message: str, highlight: bool = False, disabled: bool = False, force: bool = False
+    message: str,
+    *args,
+    highlight: bool = False,
+    disabled: bool = False,
+    force: bool = False,
 ):
+    """Logs when the caller's toggle is on, args are str.format()ed into message only then."""
     if disabled:
         return
-
-    stack = inspect.stack()
-    caller_frame = stack[1]
-    func_name = caller_frame.function
-    module_name = caller_frame.frame.f_globals.get("__name__", "__main__")
-    key = f"{module_name}.{func_name}"
-
-    if not debug_enabled(key) and not force:
+    # Nothing enabled anywhere, skip frame lookup entirely
+    if not _ENABLED_KEYS and not force:
         return
 
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    log_line = f"[{timestamp}] [🧪 {func_name}] {message}"
-
-    # 🌸 pastel pink + underline for highlights
-    COLOR_PASTEL_PINK = "\033[38;2;255;182;193m\033[4m"
-    COLOR_RESET = "\033[0m"
+    caller = sys._getframe(1)
+    code = caller.f_code
+    key = _CALL_SITE_KEYS.get(code)
+    if key is None:
+        module_name = caller.f_globals.get("__name__", "__main__")
+        key = f"{module_name}.{code.co_name}"
+        _CALL_SITE_KEYS[code] = key
 
-    if highlight:
-        log_line = f"{COLOR_PASTEL_PINK}{log_line}{COLOR_RESET}"
+    if key not in _ENABLED_KEYS and not force:
+        return
 
-    print(log_line)
+    _emit(code.co_name, message.format(*args) if args else message, highlight)
 
 
 # -----------------------------
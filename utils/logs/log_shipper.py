@@ -0,0 +1,201 @@
+# 🌸───────────────────────────────────────────────🌸
+#          Log Shipper (batched Discord + JSON sink)
+# 🌸───────────────────────────────────────────────🌸
+import asyncio
+import io
+import json
+import time
+from collections import OrderedDict, deque
+from datetime import datetime
+
+import discord
+
+from utils.essentials.env import get_env
+
+# 🎀 Severity ranking used for backpressure (lowest gets dropped first)
+SEVERITY = {
+    "warn": 1,
+    "error": 2,
+    "critical": 3,
+}
+
+MAX_PENDING_LOGS = 200  # Max distinct entries waiting to be shipped
+BATCH_WINDOW_SECONDS = 5  # Collect a burst for this long before shipping
+MAX_DISCORD_MESSAGE_LENGTH = 2000
+MAX_JSON_PENDING = 5_000  # Max JSON records waiting to be written to disk
+
+# Local JSON sink, set JIGGLY_LOG_FILE in .env to enable
+JSON_LOG_FILE_ENV = "JIGGLY_LOG_FILE"
+
+
+class _PendingLog:
+    __slots__ = ("severity", "text", "count", "first_seen", "last_seen")
+
+    def __init__(self, severity: int, text: str):
+        self.severity = severity
+        self.text = text
+        self.count = 1
+        self.first_seen = time.time()
+        self.last_seen = self.first_seen
+
+
+class LogShipper:
+    """
+    Ships warn/error/critical logs to a Discord channel without flooding it.
+    - Bounded buffer, identical messages are aggregated ("x37")
+    - One send per batch window (message, or a .txt attachment if too long)
+    - When full, the lowest severity entries are dropped first
+    """
+
+    def __init__(self, max_pending: int = MAX_PENDING_LOGS):
+        self.max_pending = max_pending
+        self.pending: "OrderedDict[str, _PendingLog]" = OrderedDict()
+        self.dropped: dict[int, int] = {}
+        self.json_pending: deque[str] = deque(maxlen=MAX_JSON_PENDING)
+        self.json_path_override: str | None = None
+        self.channel_getter = None
+        self.shipped_batches = 0
+        self._wakeup: asyncio.Event | None = None
+        self._task: asyncio.Task | None = None
+
+    @property
+    def json_path(self) -> str | None:
+        return self.json_path_override or get_env(JSON_LOG_FILE_ENV)
+
+    # ❀ Enqueue ❀
+    def enqueue(self, tag: str, text: str):
+        severity = SEVERITY.get(tag, 1)
+        entry = self.pending.get(text)
+        if entry:
+            entry.count += 1
+            entry.last_seen = time.time()
+            entry.severity = max(entry.severity, severity)
+            self._wake()
+            return
+
+        if len(self.pending) >= self.max_pending and not self._make_room(severity):
+            self.dropped[severity] = self.dropped.get(severity, 0) + 1
+            return
+
+        self.pending[text] = _PendingLog(severity, text)
+        self._wake()
+
+    def enqueue_json(self, record: dict):
+        if not self.json_path:
+            return
+        try:
+            self.json_pending.append(json.dumps(record, default=str, ensure_ascii=False))
+        except Exception:
+            return
+        self._wake()
+
+    def _make_room(self, incoming_severity: int) -> bool:
+        """Evict the oldest entry with the lowest severity, if it's not above the incoming one."""
+        lowest_key = None
+        lowest_severity = None
+        for key, entry in self.pending.items():
+            if lowest_severity is None or entry.severity < lowest_severity:
+                lowest_key = key
+                lowest_severity = entry.severity
+                if lowest_severity == 1:
+                    break
+        if lowest_key is None or lowest_severity > incoming_severity:
+            return False
+        del self.pending[lowest_key]
+        self.dropped[lowest_severity] = self.dropped.get(lowest_severity, 0) + 1
+        return True
+
+    # ❀ Background flusher ❀
+    def _wake(self):
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # No loop yet, entries stay buffered until one is running
+        if self._task is None or self._task.done():
+            self._wakeup = asyncio.Event()
+            self._task = loop.create_task(self._run())
+        self._wakeup.set()
+
+    async def _run(self):
+        while True:
+            await self._wakeup.wait()
+            await asyncio.sleep(BATCH_WINDOW_SECONDS)
+            self._wakeup.clear()
+            await self.flush()
+
+    async def flush(self) -> int:
+        """Ship everything currently buffered, returns number of entries sent or written."""
+        shipped = await self._flush_json()
+        if not self.pending:
+            return shipped
+        channel = self.channel_getter() if self.channel_getter else None
+        if channel is None:
+            return shipped  # Keep entries until the channel is available
+
+        batch = list(self.pending.values())
+        dropped = dict(self.dropped)
+        self.pending.clear()
+        self.dropped.clear()
+
+        content, file = render_batch(batch, dropped)
+        try:
+            if file:
+                await channel.send(content=content, file=file)
+            else:
+                await channel.send(content=content)
+            self.shipped_batches += 1
+            shipped += sum(entry.count for entry in batch)
+        except Exception as e:
+            print(f"[❌ Logger Error] Failed to ship {len(batch)} log(s): {e}")
+        return shipped
+
+    async def _flush_json(self) -> int:
+        if not self.json_path or not self.json_pending:
+            return 0
+        lines = list(self.json_pending)
+        self.json_pending.clear()
+        try:
+            await asyncio.to_thread(_append_lines, self.json_path, lines)
+            return len(lines)
+        except Exception as e:
+            print(f"[❌ Logger Error] Failed to write JSON logs: {e}")
+            return 0
+
+    async def drain(self, timeout: float = 5.0) -> int:
+        """Flush immediately and stop the background task, returns number of entries shipped."""
+        try:
+            shipped = await asyncio.wait_for(self.flush(), timeout=timeout)
+        except asyncio.TimeoutError:
+            shipped = 0
+        if self._task and not self._task.done():
+            self._task.cancel()
+        return shipped
+
+
+def _append_lines(path: str, lines: list[str]):
+    with open(path, "a", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
+
+
+def render_batch(batch: list[_PendingLog], dropped: dict[int, int]):
+    """Render a batch into (content, file). File is only used when it doesn't fit one message."""
+    batch.sort(key=lambda entry: (-entry.severity, entry.first_seen))
+    lines = []
+    for entry in batch:
+        suffix = f" (x{entry.count})" if entry.count > 1 else ""
+        lines.append(f"{entry.text}{suffix}")
+
+    total_dropped = sum(dropped.values())
+    footer = f"\n⚠️ Dropped {total_dropped} low priority log(s) under load." if total_dropped else ""
+    content = "\n".join(lines) + footer
+    if len(content) <= MAX_DISCORD_MESSAGE_LENGTH:
+        return content, None
+
+    total = sum(entry.count for entry in batch)
+    summary = f"🚨 {total} log(s) in the last {BATCH_WINDOW_SECONDS}s, see attachment.{footer}"
+    stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    data = io.BytesIO("\n\n".join(lines).encode("utf-8"))
+    return summary[:MAX_DISCORD_MESSAGE_LENGTH], discord.File(data, filename=f"logs_{stamp}.txt")
+
+
+LOG_SHIPPER = LogShipper()
@@ -0,0 +1,273 @@
+# 🌸───────────────────────────────────────────────🌸
+#        Metrics (counters, histograms, gauges)
+# 🌸───────────────────────────────────────────────🌸
+import functools
+import math
+import time
+from contextlib import contextmanager
+
+from utils.essentials.env import get_env
+
+# Histogram precision: sub-buckets per power of two (32 -> ~3% relative error)
+SUB_BUCKETS = 32
+
+# Local Prometheus text endpoint, set METRICS_PORT (and optionally METRICS_HOST) in .env to enable
+DEFAULT_METRICS_HOST = "127.0.0.1"
+
+STARTED_AT = time.time()
+
+
+def _label_key(labels: dict) -> tuple:
+    return tuple(sorted(labels.items())) if labels else ()
+
+
+def format_labels(key: tuple, extra: tuple = ()) -> str:
+    pairs = key + extra
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{v}"' for k, v in pairs) + "}"
+
+
+class Histogram:
+    """
+    Log-linear histogram (HDR style): each power of two is split into SUB_BUCKETS
+    equal buckets, so percentiles keep the same relative error from 0.01ms to minutes.
+    Recording is a frexp and a dict increment.
+    """
+
+    __slots__ = ("buckets", "count", "total", "min", "max")
+
+    def __init__(self):
+        self.buckets: dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def record(self, value: float):
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        if value <= 0:
+            index = -(2**31)
+        else:
+            mantissa, exponent = math.frexp(value)
+            index = exponent * SUB_BUCKETS + int((mantissa - 0.5) * 2 * SUB_BUCKETS)
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+
+    @staticmethod
+    def _bucket_value(index: int) -> float:
+        if index == -(2**31):
+            return 0.0
+        exponent, sub = divmod(index, SUB_BUCKETS)
+        return math.ldexp(0.5 + (sub + 0.5) / (2 * SUB_BUCKETS), exponent)
+
+    def percentile(self, pct: float) -> float:
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(pct / 100 * self.count))
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                return min(max(self._bucket_value(index), self.min), self.max)
+        return self.max
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+
+class MetricsRegistry:
+    def __init__(self):
+        # name -> {label_key: value}
+        self.counters: dict[str, dict[tuple, int]] = {}
+        self.histograms: dict[str, dict[tuple, Histogram]] = {}
+        self.gauges: dict[str, dict[tuple, float]] = {}
+        # name -> callable returning the current value, read at snapshot time
+        self.gauge_callbacks: dict[str, callable] = {}
+        self.help: dict[str, str] = {}
+
+    # ❀ Recording ❀
+    def inc(self, name: str, amount: int = 1, **labels):
+        series = self.counters.setdefault(name, {})
+        key = _label_key(labels)
+        series[key] = series.get(key, 0) + amount
+
+    def observe(self, name: str, value: float, **labels):
+        series = self.histograms.setdefault(name, {})
+        key = _label_key(labels)
+        histogram = series.get(key)
+        if histogram is None:
+            histogram = series[key] = Histogram()
+        histogram.record(value)
+
+    def set_gauge(self, name: str, value: float, **labels):
+        self.gauges.setdefault(name, {})[_label_key(labels)] = value
+
+    def register_gauge(self, name: str, callback, help_text: str = None):
+        self.gauge_callbacks[name] = callback
+        if help_text:
+            self.help[name] = help_text
+
+    def describe(self, name: str, help_text: str):
+        self.help[name] = help_text
+
+    def reset(self):
+        self.counters.clear()
+        self.histograms.clear()
+        self.gauges.clear()
+
+    # ❀ Reading ❀
+    def read_gauges(self) -> dict[str, dict[tuple, float]]:
+        gauges = {name: dict(series) for name, series in self.gauges.items()}
+        for name, callback in self.gauge_callbacks.items():
+            try:
+                gauges[name] = {(): float(callback())}
+            except Exception:
+                continue
+        return gauges
+
+    def counter_value(self, name: str, **labels) -> int:
+        return self.counters.get(name, {}).get(_label_key(labels), 0)
+
+    def histogram(self, name: str, **labels) -> Histogram | None:
+        return self.histograms.get(name, {}).get(_label_key(labels))
+
+    def render_prometheus(self) -> str:
+        lines = []
+        for name, series in sorted(self.counters.items()):
+            lines.append(f"# HELP {name} {self.help.get(name, name)}")
+            lines.append(f"# TYPE {name} counter")
+            for key, value in series.items():
+                lines.append(f"{name}{format_labels(key)} {value}")
+        for name, series in sorted(self.read_gauges().items()):
+            lines.append(f"# HELP {name} {self.help.get(name, name)}")
+            lines.append(f"# TYPE {name} gauge")
+            for key, value in series.items():
+                lines.append(f"{name}{format_labels(key)} {value}")
+        for name, series in sorted(self.histograms.items()):
+            lines.append(f"# HELP {name} {self.help.get(name, name)}")
+            lines.append(f"# TYPE {name} summary")
+            for key, histogram in series.items():
+                for quantile in (0.5, 0.9, 0.99):
+                    value = histogram.percentile(quantile * 100)
+                    labels = format_labels(key, (("quantile", quantile),))
+                    lines.append(f"{name}{labels} {value:.3f}")
+                lines.append(f"{name}_sum{format_labels(key)} {histogram.total:.3f}")
+                lines.append(f"{name}_count{format_labels(key)} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+
+METRICS = MetricsRegistry()
+
+METRICS.describe("command_latency_ms", "Slash command duration in run_command_safe")
+METRICS.describe("command_total", "Slash commands run, by outcome")
+METRICS.describe("defer_latency_ms", "Interaction age when the first response was sent")
+METRICS.describe("interaction_dispatch_age_ms", "Interaction age when the command callback started")
+METRICS.describe("interactions_expired_total", "Interactions that missed the 3 second deadline")
+METRICS.describe("precondition_ms", "Interaction pipeline precondition duration")
+METRICS.describe("precondition_failed_total", "Commands stopped by a precondition")
+METRICS.describe("db_query_ms", "utils/db helper duration")
+METRICS.describe("db_errors_total", "utils/db helpers that raised")
+METRICS.describe("listener_latency_ms", "Listener function duration")
+METRICS.describe("listener_errors_total", "Listener functions that raised")
+METRICS.describe("loop_task_ms", "Central loop task duration")
+METRICS.describe("loop_tick_ms", "Central loop tick duration")
+
+
+# ❀ Helpers ❀
+@contextmanager
+def measure(name: str, **labels):
+    """Records the block duration in milliseconds, errors included."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        METRICS.observe(name, (time.perf_counter() - start) * 1000, **labels)
+
+
+def interaction_age_ms(interaction) -> float:
+    """Milliseconds since Discord created the interaction."""
+    created_at = getattr(interaction, "created_at", None)
+    if created_at is None:
+        return 0.0
+    return max(0.0, (time.time() - created_at.timestamp()) * 1000)
+
+
+def _timed_async(metric: str, error_metric: str, label: str):
+    def decorator(func):
+        labels = {label: func.__name__}
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return await func(*args, **kwargs)
+            except Exception:
+                METRICS.inc(error_metric, **labels)
+                raise
+            finally:
+                METRICS.observe(metric, (time.perf_counter() - start) * 1000, **labels)
+
+        return wrapper
+
+    return decorator
+
+
+def timed_db(func):
+    """Times a utils/db helper into db_query_ms{helper=...}."""
+    return _timed_async("db_query_ms", "db_errors_total", "helper")(func)
+
+
+def timed_listener(func):
+    """Times a listener function into listener_latency_ms{listener=...}."""
+    return _timed_async("listener_latency_ms", "listener_errors_total", "listener")(func)
+
+
+# ❀ Prometheus endpoint ❀
+_metrics_runner = None
+
+
+async def start_metrics_server(port: int | str | None = None) -> bool:
+    """Serves /metrics in Prometheus text format on METRICS_HOST:port. No-op without a port."""
+    global _metrics_runner
+    port = port or get_env("METRICS_PORT")
+    host = get_env("METRICS_HOST", DEFAULT_METRICS_HOST)
+    if not port or _metrics_runner is not None:
+        return False
+
+    from aiohttp import web
+
+    from utils.logs.pretty_log import pretty_log
+
+    async def handle_metrics(request):
+        return web.Response(
+            text=METRICS.render_prometheus(),
+            content_type="text/plain",
+            charset="utf-8",
+        )
+
+    app = web.Application()
+    app.router.add_get("/metrics", handle_metrics)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    try:
+        await web.TCPSite(runner, host, int(port)).start()
+    except OSError as e:
+        await runner.cleanup()
+        pretty_log("error", f"Metrics endpoint failed to start on port {port}: {e}")
+        return False
+    _metrics_runner = runner
+    pretty_log("ready", f"Metrics endpoint listening on {host}:{port}/metrics")
+    return True
+
+
+async def stop_metrics_server():
+    global _metrics_runner
+    if _metrics_runner is not None:
+        await _metrics_runner.cleanup()
+        _metrics_runner = None
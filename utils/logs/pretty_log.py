@@ -1,17 +1,21 @@
 # 🌸───────────────────────────────────────────────🌸
 #                Pretty Logger (Pink)
 # 🌸───────────────────────────────────────────────🌸
+import sys
 import traceback
 from datetime import datetime
 from discord.ext import commands
 import discord
 
+from utils.logs.log_shipper import LOG_SHIPPER
+
 BOT_INSTANCE: commands.Bot | None = None
 
 
 def set_jiggly_bot(bot: commands.Bot):
     global BOT_INSTANCE
     BOT_INSTANCE = bot
+    LOG_SHIPPER.channel_getter = lambda: bot.get_channel(CRITICAL_LOG_CHANNEL_ID)
 
 
 # 🎀 Pink aesthetic tags (warn/critical keep non-pink)
@@ -58,7 +62,10 @@ def pretty_log(
     bot: commands.Bot = None,
     include_trace: bool = True,
 ):
-    """Pretty pink logger with Discord integration."""
+    """
+    Pretty pink logger with Discord integration.
+    Warn/error/critical logs are batched by the log shipper instead of sent one by one.
+    """
 
     # 🌸 Build prefix only if tag is not empty
     prefix = PINK_TAGS.get(tag, tag) if tag else None
@@ -79,24 +86,36 @@ def pretty_log(
     log_message = f"{color}[{now}] {prefix_part}{label_str}{message}{COLOR_RESET}"
     print(log_message)
 
-    # show traceback
-    if include_trace and tag in ("error", "critical"):
-        traceback.print_exc()
+    # show traceback (only if there is an exception being handled)
+    trace = None
+    if include_trace and tag in ("error", "critical") and sys.exc_info()[0]:
+        trace = traceback.format_exc()
+        print(trace, end="")
+
+    # structured JSON sink (no-op unless JIGGLY_LOG_FILE is set)
+    LOG_SHIPPER.enqueue_json(
+        {
+            "time": datetime.now().isoformat(timespec="seconds"),
+            "tag": tag,
+            "label": label,
+            "message": message,
+            "trace": trace,
+        }
+    )
 
-    # send to Discord channel if critical
-    bot_to_use = bot or BOT_INSTANCE
-    if bot_to_use and tag in ("critical", "error", "warn"):
+    # queue for Discord channel if warn/error/critical (batched by the log shipper)
+    if tag in ("critical", "error", "warn"):
         try:
-            channel = bot_to_use.get_channel(CRITICAL_LOG_CHANNEL_ID)
-            if channel:
-                full_message = f"{prefix_part}{label_str}{message}"
-                if include_trace and tag in ("error", "critical"):
-                    full_message += f"\n```py\n{traceback.format_exc()}```"
-                if len(full_message) > 2000:
-                    full_message = full_message[:1997] + "..."
-                bot_to_use.loop.create_task(channel.send(full_message))
+            if bot and LOG_SHIPPER.channel_getter is None:
+                set_jiggly_bot(bot)
+            full_message = f"{prefix_part}{label_str}{message}"
+            if trace:
+                full_message += f"\n```py\n{trace}```"
+            if len(full_message) > 2000:
+                full_message = full_message[:1997] + "..."
+            LOG_SHIPPER.enqueue(tag, full_message)
         except Exception:
             print(
-                f"{COLOR_ERROR}[❌ Logger Error] Failed to send log to channel{COLOR_RESET}"
+                f"{COLOR_ERROR}[❌ Logger Error] Failed to queue log for channel{COLOR_RESET}"
             )
             traceback.print_exc()
@@ -0,0 +1,97 @@
+import re
+from typing import NamedTuple
+
+from constants.rarity import resolve_auctionable_rarities
+
+# One grammar per comma separated entry: [quantity] name
+#   quantity = digits [. digits] [k|m|b]   e.g. 2, 1.5k
+#   name     = anything else, must not end with a number
+ENTRY_RE = re.compile(
+    r"(?:(?P<qty>\d+(?:\.\d+)?[kmb]?)\s+|(?P<bad_qty>\d\S*)\s+)?(?P<name>.+)"
+)
+QTY_MULTIPLIERS = {"": 1, "k": 1_000, "m": 1_000_000, "b": 1_000_000_000}
+MAX_QUANTITY = 10_000_000_000  # Same safety range as parse_compact_number
+
+
+class BulkError(NamedTuple):
+    text: str
+    start: int  # character positions in the raw input, end exclusive
+    end: int
+    reason: str
+
+    def __str__(self):
+        return f"`{self.text}` (chars {self.start + 1}-{self.end}): {self.reason}"
+
+
+class BulkParseResult(NamedTuple):
+    valid_pokemon: list[tuple[str, int]]  # (name, quantity), duplicates combined
+    errors: list[BulkError]
+    rarities: list[str]  # one per valid entry
+    total_count: int
+
+
+def parse_quantity(raw: str) -> int | None:
+    suffix = raw[-1] if raw[-1] in "kmb" else ""
+    number = float(raw[: len(raw) - len(suffix)]) * QTY_MULTIPLIERS[suffix]
+    if number <= 0 or number > MAX_QUANTITY:
+        return None
+    return int(number)
+
+
+def parse_bulk_list(raw_list: str) -> BulkParseResult:
+    """
+    Tokenizes a bulk list like '2 shiny cottonee, 1.5k caterpie, golden abra' in one pass,
+    then resolves every distinct name in one batch call. Entries that fail keep their
+    character positions so the error can point at them.
+    """
+    if not raw_list:
+        return BulkParseResult([], [], [], 0)
+
+    errors: list[BulkError] = []
+    parsed: list[tuple[str, int, int, int]] = []  # (name, qty, start, end)
+    text = raw_list.lower()
+    pos = 0
+    length = len(text)
+    while pos <= length:
+        comma = text.find(",", pos)
+        if comma == -1:
+            comma = length
+        raw = text[pos:comma]
+        entry = raw.strip()
+        if entry:
+            start = pos + (len(raw) - len(raw.lstrip()))
+            end = start + len(entry)
+            match = ENTRY_RE.fullmatch(entry)
+            name = match.group("name").strip()
+            qty_raw = match.group("qty")
+            if match.group("bad_qty"):
+                errors.append(BulkError(entry, start, end, "invalid quantity"))
+            elif name[-1].isdigit():
+                errors.append(
+                    BulkError(entry, start, end, "put the quantity before the name")
+                )
+            else:
+                qty = parse_quantity(qty_raw) if qty_raw else 1
+                if qty is None:
+                    errors.append(BulkError(entry, start, end, "invalid quantity"))
+                else:
+                    parsed.append((name, qty, start, end))
+        pos = comma + 1
+
+    rarity_by_name = resolve_auctionable_rarities(name for name, _, _, _ in parsed)
+    count_map: dict[str, int] = {}
+    rarities = []
+    total_count = 0
+    for name, qty, start, end in parsed:
+        rarity = rarity_by_name[name]
+        if rarity is None:
+            errors.append(
+                BulkError(text[start:end], start, end, "not found or not auctionable")
+            )
+            continue
+        rarities.append(rarity)
+        count_map[name] = count_map.get(name, 0) + qty
+        total_count += qty
+
+    errors.sort(key=lambda error: error.start)
+    return BulkParseResult(list(count_map.items()), errors, rarities, total_count)
@@ -0,0 +1,129 @@
+# 🍰────────────────────────────────────────────
+#     ⏰ Auction Schedule (soft close, last minute pings)
+# 🍰────────────────────────────────────────────
+import heapq
+
+import discord
+
+from constants.auction import (
+    LAST_MINUTE_PING_SECONDS,
+    SOFT_CLOSE_EXTENSION_SECONDS,
+    SOFT_CLOSE_MAX_EXTENSION_SECONDS,
+    SOFT_CLOSE_MODE,
+    SOFT_CLOSE_WINDOW_SECONDS,
+)
+from utils.cache.cache_list import (
+    auction_cache,
+    last_minute_ping_heap,
+    pending_ends_on_writes,
+    soft_close_extended,
+)
+from utils.logs.metrics import METRICS
+from utils.logs.pretty_log import pretty_log
+
+METRICS.describe("soft_close_extensions_total", "Bids that extended an auction deadline")
+METRICS.describe("soft_close_flush_total", "Coalesced end time writes, by outcome")
+
+
+# ❀ Soft close ❀
+def soft_close_applies(is_speed: bool) -> bool:
+    if SOFT_CLOSE_MODE == "all":
+        return True
+    if SOFT_CLOSE_MODE == "speed":
+        return is_speed
+    return False
+
+
+def soft_close_deadline(
+    channel_id: int, ends_on: int, now: int, is_speed: bool
+) -> int | None:
+    """
+    New end time if a bid placed at `now` falls in the soft close window, otherwise None.
+    Keeps at least SOFT_CLOSE_EXTENSION_SECONDS on the clock, capped per auction.
+    """
+    if not soft_close_applies(is_speed):
+        return None
+    remaining = ends_on - now
+    if remaining <= 0 or remaining > SOFT_CLOSE_WINDOW_SECONDS:
+        return None
+
+    budget = SOFT_CLOSE_MAX_EXTENSION_SECONDS - soft_close_extended.get(channel_id, 0)
+    extension = min(SOFT_CLOSE_EXTENSION_SECONDS - remaining, budget)
+    if extension <= 0:
+        return None
+    return ends_on + extension
+
+
+def extend_auction_deadline(channel_id: int, old_ends_on: int, new_ends_on: int):
+    """
+    Applies a soft close extension to auction_cache right away and queues the DB write.
+    Repeated extensions of the same auction before the next flush overwrite each other.
+    """
+    from utils.cache.auction_cache import update_auction_ends_on_cache
+
+    update_auction_ends_on_cache(channel_id, new_ends_on)
+    soft_close_extended[channel_id] = soft_close_extended.get(channel_id, 0) + (
+        new_ends_on - old_ends_on
+    )
+    pending_ends_on_writes[channel_id] = new_ends_on
+    METRICS.inc("soft_close_extensions_total")
+
+
+async def flush_pending_ends_on(bot: discord.Client):
+    """Writes every queued end time in one batch. Run before anything reads ends_on from the DB."""
+    if not pending_ends_on_writes:
+        return
+    from utils.db.auction_db import update_ends_on_many
+
+    deadlines = dict(pending_ends_on_writes)
+    pending_ends_on_writes.clear()
+    if await update_ends_on_many(bot, deadlines):
+        METRICS.inc("soft_close_flush_total", outcome="ok")
+        return
+
+    METRICS.inc("soft_close_flush_total", outcome="error")
+    # Put them back for the next tick, unless the end time changed meanwhile
+    for channel_id, ends_on in deadlines.items():
+        auction = auction_cache.get(channel_id)
+        if auction and auction["ends_on"] == ends_on:
+            pending_ends_on_writes.setdefault(channel_id, ends_on)
+    pretty_log(
+        "warn",
+        f"Soft close end times for {len(deadlines)} channel(s) will be retried next tick",
+    )
+
+
+# ❀ Last minute pings ❀
+def arm_last_minute_ping(channel_id: int, ends_on: int):
+    """Schedules the last minute ping, call whenever an auction starts or its end time moves."""
+    heapq.heappush(last_minute_ping_heap, (ends_on - LAST_MINUTE_PING_SECONDS, channel_id))
+
+
+def rebuild_last_minute_ping_schedule():
+    """Re-arms every auction in auction_cache that still needs its ping, after a cache load."""
+    last_minute_ping_heap.clear()
+    last_minute_ping_heap.extend(
+        (auction["ends_on"] - LAST_MINUTE_PING_SECONDS, channel_id)
+        for channel_id, auction in auction_cache.items()
+        if not auction.get("last_minute_pinged")
+    )
+    heapq.heapify(last_minute_ping_heap)
+
+
+def pop_due_last_minute_pings(now: int) -> list[int]:
+    """
+    Channels whose last minute ping is due. Their last_minute_pinged flag is flipped in
+    auction_cache here, before any await, so a ping can't go out twice.
+    """
+    due = []
+    while last_minute_ping_heap and last_minute_ping_heap[0][0] <= now:
+        _, channel_id = heapq.heappop(last_minute_ping_heap)
+        auction = auction_cache.get(channel_id)
+        if not auction or auction.get("last_minute_pinged"):
+            continue
+        if auction["ends_on"] - LAST_MINUTE_PING_SECONDS > now:
+            # End time moved back since this entry was armed, the new entry is already queued
+            continue
+        auction["last_minute_pinged"] = True
+        due.append(channel_id)
+    return due
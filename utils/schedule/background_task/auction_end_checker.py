@@ -1,87 +1,147 @@
+import asyncio
+import time
+
 import discord
 
-from constants.grand_line_auction_constants import GLA_SERVER_ID
-from utils.cache.cache_list import processing_auction_end
-from utils.db.auction_db import delete_auction, fetch_all_due_auctions
+from constants.guild_config import HOME_GUILD_ID
+from utils.cache.cache_list import auction_cache, processing_auction_end
+from utils.cache.member_resolver import (
+    MEMBER_RESOLVER,
+    MemberSnapshot,
+    departed_member,
+)
+from utils.db.auction_db import (
+    delete_auction,
+    fetch_all_due_auctions,
+    fetch_stuck_auctions,
+)
+from utils.db.auction_results_db import CHANNEL_DELETED, ENDED
+from utils.essentials.auction_state import (
+    ACTIVE,
+    ANNOUNCED,
+    ENDING,
+    ENDING_LEASE_SECONDS,
+    advance_auction_state,
+    auction_state,
+    take_over_auction_state,
+)
 from utils.group_commands_func.auction.stop import send_auction_house_banner
 from utils.group_commands_func.auction.start import make_auction_embed
 from utils.logs.pretty_log import pretty_log
-from utils.essentials.minimum_increment import (
-    compute_maximum_auction_duration_seconds,
-    compute_minimum_increment,
-    format_names_for_market_value_lookup,
-)
 from utils.functions.webhook_func import send_auction_log
 
+MAX_CONCURRENT_ENDINGS = 5  # Auctions ended in parallel per tick
+MAX_ANNOUNCE_ATTEMPTS = 5  # Then the auction is archived without its ended message
+
+# channel_id -> failed announce attempts, only kept while the auction is stuck in ending
+announce_failures: dict[int, int] = {}
+
+
 async def check_and_end_due_auctions(bot: discord.Client):
     due_auctions = await fetch_all_due_auctions(bot)
     if not due_auctions:
         return
-    guild = bot.get_guild(GLA_SERVER_ID)
+    now = int(time.time())
+    # Extended by soft close after the last flush, the cache is ahead of the DB
+    due_auctions = [
+        auction
+        for auction in due_auctions
+        if not (
+            (cached := auction_cache.get(auction["channel_id"]))
+            and cached["ends_on"] > now
+        )
+    ]
+    await end_auctions(bot, due_auctions, take_over=False)
+
+
+async def reconcile_auction_endings(bot: discord.Client):
+    """Finishes endings left half way (crash, restart, failed send) once their lease ran out."""
+    stuck = await fetch_stuck_auctions(bot, int(time.time()) - ENDING_LEASE_SECONDS)
+    stuck = [auction for auction in stuck if auction_state(auction) != ACTIVE]
+    if stuck:
+        pretty_log("warn", f"Resuming {len(stuck)} auction ending(s) left half way")
+        await end_auctions(bot, stuck, take_over=True)
+
+
+async def end_auctions(bot: discord.Client, auctions, take_over: bool):
+    if not auctions:
+        return
+    guild = bot.get_guild(HOME_GUILD_ID)
     if not guild:
         return
-    for auction in due_auctions:
-        channel_id = auction["channel_id"]
-        processing_auction_end.add(channel_id)  # Add to processing set to prevent
+    # Hosts and highest bidders of the whole batch in one lookup
+    members = await MEMBER_RESOLVER.resolve_many(
+        guild,
+        [a["host_id"] for a in auctions] + [a["highest_bidder_id"] for a in auctions],
+    )
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_ENDINGS)
+
+    async def end_one(auction):
+        async with semaphore:
+            await end_auction(bot, guild, auction, members, take_over)
+
+    await asyncio.gather(*(end_one(auction) for auction in auctions))
+
+
+async def end_auction(
+    bot: discord.Client,
+    guild: discord.Guild,
+    auction,
+    members: dict[int, MemberSnapshot],
+    take_over: bool = False,
+):
+    """
+    Walks one auction through ending -> announced -> archived, resuming from whatever
+    state the row is in. Every step is a compare-and-set, so a second ender (another tick,
+    the reconciler after a restart) stops at the first step it loses. The ended message is
+    at-least-once: a crash between sending it and recording announced posts it again.
+    """
+    channel_id = auction["channel_id"]
+    if channel_id in processing_auction_end:
+        return  # Already being ended by this process
+    processing_auction_end.add(channel_id)
+    try:
+        state = auction_state(auction)
+        if state == ACTIVE:
+            if not await advance_auction_state(bot, channel_id, ACTIVE, ENDING):
+                return
+            state = ENDING
+        elif not take_over or not await take_over_auction_state(bot, channel_id, state):
+            return  # Mid-transition auctions are only resumed by the reconciler
+
         channel = guild.get_channel(channel_id)
         if not channel:
             # Remove auction from database if channel no longer exists
-            await delete_auction(bot, channel_id)
-            pretty_log(
-                tag="auction",
-                message=f"Deleted auction with channel ID {channel_id} because the channel no longer exists.",
-                bot=bot,
-            )
-            processing_auction_end.remove(channel_id)
-            continue
-        # Get auction details
-        host_id = auction["host_id"]
-        is_bulk = auction.get("is_bulk", False)
-        host = guild.get_member(host_id)
-        if not host:
-            # Fetch discord use
-            host = await guild.fetch_member(host_id)
-        highest_bidder_id = auction["highest_bidder_id"]
-        highest_bidder = None
-        if highest_bidder_id:
-            highest_bidder = guild.get_member(highest_bidder_id)
-            if not highest_bidder:
-                highest_bidder = await guild.fetch_member(highest_bidder_id)
-                if not highest_bidder:
-                    highest_bidder = None
-
-        # Remove auction from database
+            if await delete_auction(bot, channel_id, reason=CHANNEL_DELETED):
+                pretty_log(
+                    tag="auction",
+                    message=f"Deleted auction with channel ID {channel_id} because the channel no longer exists.",
+                    bot=bot,
+                )
+            return
+
         try:
-            await delete_auction(bot, channel_id)
+            embed, content = make_ended_embed(bot, auction, members)
         except Exception as e:
-            pretty_log(
-                tag="error",
-                message=f"Error deleting auction with channel ID {channel_id}: {e}",
-                include_trace=True,
-                bot=bot,
-            )
-            processing_auction_end.remove(channel_id)
-            continue
-        # Send auction ended message
-        try:
-            embed, content = make_auction_embed(
-                bot=bot,
-                user=host,
-                pokemon=auction["pokemon"],
-                unix_end=auction["ends_on"],
-                autobuy=auction["autobuy"],
-                accepted_pokemon=auction["accepted_list"],
-                gif_url=auction["image_link"],
-                highest_offer=auction["highest_offer"] if highest_bidder else 0,
-                highest_bidder=highest_bidder if highest_bidder else None,
-                last_bidder_mention=auction.get("last_bidder_mention", None),
-                context="ended",
-                min_increment=auction["minimum_increment"],
-                is_bulk=is_bulk,
-            )
-            await channel.send(embed=embed)
-            await channel.send(content=content)
-            processing_auction_end.remove(channel_id)
+            # Counts toward the give up limit too, or the auction would stay in ending forever
+            if state == ENDING and not record_announce_failure(
+                bot, channel_id, "building the auction ended message", e
+            ):
+                return
+            embed = content = None
+        if state == ENDING:
+            if embed is not None and not await announce_auction_end(
+                bot, channel, channel_id, embed, content
+            ):
+                return  # Stays in ending, the reconciler retries after the lease
+            if not await advance_auction_state(bot, channel_id, ENDING, ANNOUNCED):
+                return
+            state = ANNOUNCED
+
+        if state == ANNOUNCED:
+            # Archive: the row goes away, the bid ledger is closed
+            if not await delete_auction(bot, channel_id, reason=ENDED):
+                return  # Stays in announced, the reconciler retries after the lease
             await send_auction_house_banner(channel)
             pretty_log(
                 tag="auction",
@@ -89,17 +149,85 @@ async def check_and_end_due_auctions(bot: discord.Client):
                 bot=bot,
             )
             # Send auction log to auction log channel
-            await send_auction_log(
-                bot=bot,
-                embed=embed,
-            )
+            if embed is not None:
+                await send_auction_log(
+                    bot=bot,
+                    embed=embed,
+                )
+    except Exception as e:
+        pretty_log(
+            tag="error",
+            message=f"Error ending auction in channel ID {channel_id}: {e}",
+            include_trace=True,
+            bot=bot,
+        )
+    finally:
+        processing_auction_end.discard(channel_id)
 
-        except Exception as e:
-            pretty_log(
-                tag="error",
-                message=f"Error sending auction ended message for channel ID {channel_id}: {e}",
-                include_trace=True,
-                bot=bot,
-            )
-            processing_auction_end.remove(channel_id)
-            continue
+
+def make_ended_embed(bot: discord.Client, auction, members: dict[int, MemberSnapshot]):
+    """Ended embed and message, hosts and bidders who left the server are named from the row."""
+    host = members.get(auction["host_id"]) or departed_member(
+        auction["host_id"], auction["host_name"]
+    )
+    highest_bidder = None
+    if auction["highest_bidder_id"]:
+        highest_bidder = members.get(auction["highest_bidder_id"]) or departed_member(
+            auction["highest_bidder_id"], auction["highest_bidder"]
+        )
+    return make_auction_embed(
+        bot=bot,
+        user=host,
+        pokemon=auction["pokemon"],
+        unix_end=auction["ends_on"],
+        autobuy=auction["autobuy"],
+        accepted_pokemon=auction["accepted_list"],
+        gif_url=auction["image_link"],
+        highest_offer=auction["highest_offer"] if highest_bidder else 0,
+        highest_bidder=highest_bidder if highest_bidder else None,
+        last_bidder_mention=auction.get("last_bidder_mention", None),
+        context="ended",
+        min_increment=auction["minimum_increment"],
+        is_bulk=auction.get("is_bulk", False),
+    )
+
+
+async def announce_auction_end(
+    bot: discord.Client,
+    channel: discord.TextChannel,
+    channel_id: int,
+    embed: discord.Embed,
+    content: str,
+) -> bool:
+    """Sends the ended message, gives up (and lets the auction be archived) after a few tries."""
+    try:
+        await channel.send(embed=embed)
+        await channel.send(content=content)
+        announce_failures.pop(channel_id, None)
+        return True
+    except Exception as e:
+        return record_announce_failure(
+            bot, channel_id, "sending auction ended message", e
+        )
+
+
+def record_announce_failure(
+    bot: discord.Client, channel_id: int, action: str, e: Exception
+) -> bool:
+    """Counts a failed announce attempt, True once the auction should be archived without it."""
+    attempts = announce_failures[channel_id] = announce_failures.get(channel_id, 0) + 1
+    if attempts >= MAX_ANNOUNCE_ATTEMPTS:
+        announce_failures.pop(channel_id, None)
+        pretty_log(
+            tag="critical",
+            message=f"Gave up announcing the end of the auction in channel ID {channel_id} after {attempts} attempts: {e}",
+            bot=bot,
+        )
+        return True
+    pretty_log(
+        tag="error",
+        message=f"Error {action} for channel ID {channel_id} (attempt {attempts}): {e}",
+        include_trace=True,
+        bot=bot,
+    )
+    return False
@@ -1,46 +1,58 @@
+import time
+
 import discord
 
-from constants.grand_line_auction_constants import (
-    GLA_SERVER_ID,
-    GRAND_LINE_AUCTION_ROLES,
-    GRAND_LINE_AUCTION_TEXT_CHANNELS,
-)
-from utils.cache.cache_list import processing_auction_end
-from utils.db.auction_db import (
-    delete_auction,
-    fetch_auctions_ending_within_10_mins,
-    update_last_minute_pinged,
+from constants.guild_config import (
+    HOME_GUILD_ID,
+    LAST_MINUTE_PING_ROLES,
+    SPEED_AUCTION_CHANNEL,
 )
+from utils.cache.cache_list import auction_cache, processing_auction_end
+from utils.cache.guild_config_cache import get_guild_config
+from utils.db.auction_db import delete_auction, set_last_minute_pinged_many
+from utils.db.auction_results_db import CHANNEL_DELETED
 from utils.logs.pretty_log import pretty_log
+from utils.schedule.auction_schedule import pop_due_last_minute_pings
 
 TESTING = False
 
 
 async def check_and_ping_last_minute_auctions(bot: discord.Client):
-    """Checks for auctions that are ending within the next 10 minutes and sends a ping in the auction channel if not already pinged."""
+    """Sends the ping of every auction whose last minute timer fired, then stores all the flags in one write."""
     if TESTING:
         return
 
-    auctions_ending_soon = await fetch_auctions_ending_within_10_mins(bot)
-    if not auctions_ending_soon:
-        return
-    guild = bot.get_guild(GLA_SERVER_ID)
+    guild = bot.get_guild(HOME_GUILD_ID)
     if not guild:
         return
-    for auction in auctions_ending_soon:
-        channel_id = auction["channel_id"]
-        if channel_id in processing_auction_end:
+    due_channel_ids = pop_due_last_minute_pings(int(time.time()))
+    if not due_channel_ids:
+        return
+    try:
+        await _send_last_minute_pings(bot, guild, due_channel_ids)
+    finally:
+        await set_last_minute_pinged_many(bot, due_channel_ids)
+
+
+async def _send_last_minute_pings(
+    bot: discord.Client, guild: discord.Guild, due_channel_ids: list[int]
+):
+    config = get_guild_config(guild.id)
+    speed_channel_ids = config.ids(SPEED_AUCTION_CHANNEL)
+    last_minute_ping_role = guild.get_role(config.first_id(LAST_MINUTE_PING_ROLES) or 0)
+    for channel_id in due_channel_ids:
+        auction = auction_cache.get(channel_id)
+        if not auction or channel_id in processing_auction_end:
             continue  # Skip if auction is currently being processed for ending
 
-        if channel_id == GRAND_LINE_AUCTION_TEXT_CHANNELS.speed_auction:
-            # Update database to indicate ping has been sent without actually sending a message since speed auction channel is already very active and doesn't need ping
-            await update_last_minute_pinged(bot, channel_id, True)
+        if channel_id in speed_channel_ids:
+            # Speed auction channel is already very active and doesn't need a ping, only the flag is stored
             continue
 
         channel = guild.get_channel(channel_id)
         if not channel:
             # Remove auction from database if channel no longer exists
-            await delete_auction(bot, channel_id)
+            await delete_auction(bot, channel_id, reason=CHANNEL_DELETED)
             pretty_log(
                 tag="auction",
                 message=f"Deleted auction with channel ID {channel_id} because the channel no longer exists.",
@@ -48,7 +60,6 @@ async def check_and_ping_last_minute_auctions(bot: discord.Client):
             )
             continue
         # Send last minute ping
-        last_minute_ping_role = guild.get_role(GRAND_LINE_AUCTION_ROLES.last_min)
         if not last_minute_ping_role:
             pretty_log(
                 tag="error",
@@ -62,9 +73,6 @@ async def check_and_ping_last_minute_auctions(bot: discord.Client):
             "is ending in less than 10 minutes!"
         )
         try:
-            await update_last_minute_pinged(
-                bot, channel_id, True
-            )  # Update database to indicate ping has been sent
             await channel.send(content=content)
 
             pretty_log(
@@ -1,9 +1,9 @@
 # inside get_pokemon_gif.py
 from typing import Literal
 
-from constants.paldea_galar_dict import get_dex_number_by_name
 from constants.pokemon_gifs import *
 from utils.db.market_value_db import fetch_image_link_cache
+from utils.essentials.dex_service import get_dex_number
 from utils.essentials.minimum_increment import format_names_for_market_value_lookup
 from utils.logs.debug_log import debug_log, enable_debug
 from utils.logs.pretty_log import pretty_log
@@ -123,7 +123,7 @@ def get_pokemon_gif(input_name: str):
         )  # Replace spaces with hyphens
         golden_base_name_attr = golden_base_name.replace("-", "_")
         debug_log(f"Golden base name for dex lookup: {golden_base_name}")
-        dex_number = get_dex_number_by_name(golden_base_name)
+        dex_number = get_dex_number(golden_base_name)
         debug_log(f"Dex number for golden form: {dex_number}")
         pretty_log(
             tag="debug",
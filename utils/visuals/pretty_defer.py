@@ -1,12 +1,21 @@
 import discord
 
 from constants.aesthetic import *
+from utils.logs.metrics import METRICS, interaction_age_ms
 from utils.logs.pretty_log import pretty_log
 
 LOADING_EMOJI = Emojis.loading
 CHECK_EMOJI = Emojis.check
 ERROR_EMOJI = Emojis.error
 
+# interaction.extras key for a loader already sent by the interaction pipeline
+DEFER_HANDLE_KEY = "defer_handle"
+
+
+def command_label(interaction: discord.Interaction) -> str:
+    command = getattr(interaction, "command", None)
+    return getattr(command, "qualified_name", None) or "unknown"
+
 
 async def pretty_defer(
     interaction: discord.Interaction,
@@ -21,6 +30,8 @@ async def pretty_defer(
     - Always prefers editing the original response.
     - Sends a public fallback message if editing is not possible.
     - Success can override ephemeral by deleting it and sending a public message.
+    - Reuses the loader if the command was already deferred by the interaction pipeline
+      (ephemeral stays whatever the pipeline used).
     """
 
     class PrettyDeferHandle:
@@ -37,6 +48,8 @@ async def pretty_defer(
             self._emoji_added = False
             self.ephemeral = ephemeral
             self.error_emoji = "❌"  # Replaceable error emoji
+            self.content = None
+            self.expired = False
 
         async def _resolve_message(self) -> discord.Message | None:
             """Try to ensure we always have the original response if possible."""
@@ -225,9 +238,21 @@ async def pretty_defer(
                 )
             return  # always return immediately
 
+    # ----------------- Reuse pipeline loader -----------------
+    extras = getattr(interaction, "extras", None)
+    pre_deferred = extras.pop(DEFER_HANDLE_KEY, None) if isinstance(extras, dict) else None
+    if pre_deferred is not None and not pre_deferred.stopped:
+        if view:
+            setattr(view, "defer_handle", pre_deferred)
+        if content != pre_deferred.content or embed or view:
+            pre_deferred.content = content
+            await pre_deferred.edit(content=content, embed=embed, view=view)
+        return pre_deferred
+
     # ----------------- Send initial loader -----------------
     msg: discord.Message | None = None
     msg_content = f"{LOADING_EMOJI} {content}"
+    expired = False
 
     try:
         if (
@@ -237,6 +262,12 @@ async def pretty_defer(
             await interaction.response.send_message(
                 content=msg_content, embed=embed, view=view, ephemeral=ephemeral
             )
+            # 🎀 Time-to-defer: interaction age when Discord got our first response
+            METRICS.observe(
+                "defer_latency_ms",
+                interaction_age_ms(interaction),
+                command=command_label(interaction),
+            )
             try:
                 msg = await interaction.original_response()
             except Exception:
@@ -245,10 +276,20 @@ async def pretty_defer(
             msg = await interaction.followup.send(
                 content=msg_content, embed=embed, view=view, ephemeral=ephemeral
             )
+    except discord.NotFound:
+        # Unknown interaction, Discord's 3 second deadline already passed
+        expired = True
+        METRICS.inc(
+            "interactions_expired_total",
+            command=command_label(interaction),
+            stage="defer",
+        )
     except Exception:
         pass
 
     handle = PrettyDeferHandle(interaction, msg, ephemeral=ephemeral)
+    handle.content = content
+    handle.expired = expired
     if view:
         setattr(view, "defer_handle", handle)
 